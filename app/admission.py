@@ -0,0 +1,331 @@
+"""Contrôle d'admission et délestage des routes liées à la base.
+
+Lorsque PostgreSQL ralentit, les routes synchrones s'accumulent dans le
+pool de threads en attendant une connexion du pool, jusqu'à ce que tout
+expire. Le contrôleur d'admission limite le nombre de requêtes /items en
+cours d'exécution ; les suivantes attendent dans une file bornée :
+
+- file pleine, ou attente estimée supérieure à ``ADMISSION_QUEUE_TIMEOUT``,
+  ou délai dépassé : réponse immédiate ``503`` avec ``Retry-After`` ;
+- la limite s'adapte à la latence observée des instructions SQL : elle
+  diminue lorsque la latence récente dépasse nettement la latence de
+  référence (moyenne longue), et remonte progressivement ensuite.
+
+La limite maximale vaut par défaut la capacité du pool de connexions
+(``DB_POOL_SIZE + DB_MAX_OVERFLOW``) : au-delà, une requête admise ne
+ferait qu'attendre une connexion.
+
+Le contrôleur vit dans la boucle d'événements (dépendance asynchrone) :
+une requête refusée ne consomme jamais de thread. Seul le suivi de la
+latence SQL, alimenté par les événements du moteur depuis les threads,
+est protégé par un verrou.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import env_flag
+
+_POOL_CAPACITY = int(os.getenv("DB_POOL_SIZE", "5")) + int(
+    os.getenv("DB_MAX_OVERFLOW", "10")
+)
+
+ADMISSION_ENABLED = env_flag("ADMISSION_ENABLED", True)
+ADMISSION_MAX_CONCURRENCY = int(
+    os.getenv("ADMISSION_MAX_CONCURRENCY", str(_POOL_CAPACITY))
+)
+ADMISSION_MIN_CONCURRENCY = int(os.getenv("ADMISSION_MIN_CONCURRENCY", "2"))
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", "100"))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "2"))
+# Rapport latence récente / latence de référence toléré avant de réduire la limite
+ADMISSION_LATENCY_TOLERANCE = float(os.getenv("ADMISSION_LATENCY_TOLERANCE", "2"))
+
+# Bornes de l'en-tête Retry-After (secondes)
+RETRY_AFTER_MIN = 1
+RETRY_AFTER_MAX = 30
+
+
+class AdmissionRejected(Exception):
+    """Requête refusée par le contrôleur d'admission.
+
+    Attributes:
+        reason: ``queue_full``, ``deadline`` ou ``timeout``.
+        retry_after: Délai conseillé avant une nouvelle tentative (secondes).
+    """
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class LatencyTracker:
+    """Latence des instructions SQL : moyennes mobiles courte et longue.
+
+    La moyenne courte suit la latence récente, la moyenne longue sert de
+    référence. Alimenté depuis les threads des routes synchrones.
+
+    Attributes:
+        samples: Nombre d'instructions observées.
+    """
+
+    def __init__(self, short_alpha: float = 0.1, long_alpha: float = 0.005):
+        self.short_alpha = short_alpha
+        self.long_alpha = long_alpha
+        self.samples = 0
+        self.short = 0.0
+        self.long = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            if self.samples == 0:
+                self.short = self.long = seconds
+            else:
+                self.short += self.short_alpha * (seconds - self.short)
+                self.long += self.long_alpha * (seconds - self.long)
+            self.samples += 1
+
+    def snapshot(self) -> tuple[int, float, float]:
+        """Retourne le nombre d'échantillons et les moyennes courte et longue."""
+        with self._lock:
+            return self.samples, self.short, self.long
+
+
+class AdmissionController:
+    """Limite adaptative de concurrence avec file d'attente bornée.
+
+    Args:
+        max_concurrency: Limite haute (et initiale) de requêtes en cours.
+        min_concurrency: Limite basse, atteinte lorsque la base sature.
+        queue_size: Nombre maximal de requêtes en attente.
+        queue_timeout: Attente maximale dans la file (secondes).
+        latency_tolerance: Rapport latence courte / longue toléré.
+        enabled: False pour admettre toutes les requêtes.
+
+    Example:
+        >>> controller = AdmissionController(max_concurrency=10)
+        >>> start = await controller.acquire()
+        >>> controller.release(start)
+    """
+
+    # Nombre d'instructions SQL observées avant d'adapter la limite
+    WARMUP_SAMPLES = 50
+
+    def __init__(
+        self,
+        max_concurrency: int = ADMISSION_MAX_CONCURRENCY,
+        min_concurrency: int = ADMISSION_MIN_CONCURRENCY,
+        queue_size: int = ADMISSION_QUEUE_SIZE,
+        queue_timeout: float = ADMISSION_QUEUE_TIMEOUT,
+        latency_tolerance: float = ADMISSION_LATENCY_TOLERANCE,
+        enabled: bool = ADMISSION_ENABLED,
+    ):
+        self.max_concurrency = max(max_concurrency, 1)
+        self.min_concurrency = min(max(min_concurrency, 1), self.max_concurrency)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.latency_tolerance = latency_tolerance
+        self.enabled = enabled
+        self.latency = LatencyTracker()
+
+        self.limit = float(self.max_concurrency)
+        self.active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # Durée moyenne (secondes) pendant laquelle une requête occupe une place
+        self.service_time = 0.0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @property
+    def saturated(self) -> bool:
+        """True si toutes les places sont prises et la file est pleine."""
+        return (
+            self.enabled
+            and self.active >= int(self.limit)
+            and len(self._waiters) >= self.queue_size
+        )
+
+    def estimated_wait(self, position: int) -> float:
+        """Estime l'attente (secondes) d'une requête à cette position de la file.
+
+        Les places se libèrent au rythme de limit / service_time par seconde.
+        """
+        if self.service_time == 0:
+            return 0.0
+        return position * self.service_time / int(self.limit)
+
+    def _retry_after(self) -> int:
+        wait = self.estimated_wait(len(self._waiters) + 1)
+        return min(max(math.ceil(wait), RETRY_AFTER_MIN), RETRY_AFTER_MAX)
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        if reason == "timeout":
+            self.timed_out += 1
+        else:
+            self.rejected += 1
+        return AdmissionRejected(reason, self._retry_after())
+
+    async def acquire(self) -> float:
+        """Attend une place libre.
+
+        Returns:
+            Instant d'admission, à repasser à release().
+
+        Raises:
+            AdmissionRejected: File pleine, attente estimée ou réelle
+                supérieure à queue_timeout.
+        """
+        if not self.enabled:
+            return time.perf_counter()
+
+        if self.active < int(self.limit) and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return time.perf_counter()
+
+        if len(self._waiters) >= self.queue_size:
+            raise self._reject("queue_full")
+        if self.estimated_wait(len(self._waiters) + 1) > self.queue_timeout:
+            raise self._reject("deadline")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # La place a été attribuée au moment de l'annulation : la rendre
+                self._release_slot()
+            else:
+                waiter.cancel()
+                self._discard(waiter)
+            if isinstance(exc, TimeoutError):
+                raise self._reject("timeout") from None
+            raise
+        self.admitted += 1
+        return time.perf_counter()
+
+    def release(self, start: float) -> None:
+        """Libère la place prise par acquire() et adapte la limite.
+
+        Args:
+            start: Instant d'admission retourné par acquire().
+        """
+        if not self.enabled:
+            return
+        elapsed = time.perf_counter() - start
+        if self.service_time == 0:
+            self.service_time = elapsed
+        else:
+            self.service_time += 0.1 * (elapsed - self.service_time)
+        self.adapt()
+        self._release_slot()
+
+    def adapt(self) -> None:
+        """Ajuste la limite d'après la latence SQL observée.
+
+        La limite est multipliée par le gradient ``tolérance × latence
+        longue / latence courte`` (borné entre 0,5 et 1), puis augmentée de
+        sa racine carrée pour continuer à sonder la capacité disponible ;
+        le résultat est lissé et borné par min et max_concurrency.
+        """
+        samples, short, long = self.latency.snapshot()
+        if samples < self.WARMUP_SAMPLES or short <= 0:
+            return
+        gradient = min(max(self.latency_tolerance * long / short, 0.5), 1.0)
+        target = self.limit * gradient + math.sqrt(self.limit)
+        limit = 0.8 * self.limit + 0.2 * target
+        self.limit = min(max(limit, self.min_concurrency), self.max_concurrency)
+
+    def _release_slot(self) -> None:
+        self.active -= 1
+        while self._waiters and self.active < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            waiter.set_result(None)
+            self.active += 1
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        """Retourne l'état du contrôleur (limite, occupation, refus).
+
+        Example:
+            >>> controller.stats()["limit"]
+            15
+        """
+        _, short, long = self.latency.snapshot()
+        return {
+            "enabled": self.enabled,
+            "saturated": self.saturated,
+            "limit": int(self.limit),
+            "active": self.active,
+            "queued": len(self._waiters),
+            "queue_size": self.queue_size,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "db_latency_ms": {"recent": short * 1000, "baseline": long * 1000},
+        }
+
+
+controller = AdmissionController()
+
+
+def track_engine(engine: Engine) -> None:
+    """Alimente la latence SQL du contrôleur à partir des événements d'engine."""
+    if not ADMISSION_ENABLED:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("admission_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["admission_start"].pop()
+        controller.latency.observe(elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        if context.connection is not None and context.cursor is not None:
+            starts = context.connection.info.get("admission_start")
+            if starts:
+                starts.pop()
+
+
+async def admission():
+    """Dépendance FastAPI soumettant la requête au contrôle d'admission.
+
+    Raises:
+        HTTPException: 503 avec ``Retry-After`` si la requête est refusée.
+    """
+    current = controller
+    try:
+        start = await current.acquire()
+    except AdmissionRejected as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Server overloaded ({exc.reason}), retry later",
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+    try:
+        yield
+    finally:
+        current.release(start)
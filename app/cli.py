@@ -0,0 +1,64 @@
+"""Commandes d'administration de l'API.
+
+Usage:
+    python -m app.cli migrate
+    python -m app.cli rebuild-stats
+"""
+
+import argparse
+from collections.abc import Sequence
+
+from sqlmodel import Session
+
+from app.database import engine
+from app.migrations import check_schema, migrate
+from app.services.stats import rebuild_stats
+
+
+def migrate_command(args: argparse.Namespace) -> int:
+    """Applique les migrations de schéma manquantes."""
+    before, after = migrate(engine)
+    if before == after:
+        print(f"schema already at version {after}")
+    else:
+        print(f"schema migrated from version {before} to {after}")
+    return 0
+
+
+def rebuild_stats_command(args: argparse.Namespace) -> int:
+    """Recalcule les agrégats du catalogue à partir de la table items."""
+    check_schema(engine)
+    with Session(engine) as db:
+        stats = rebuild_stats(db)
+    print(f"item_stats rebuilt: count={stats.count} prix_sum={stats.prix_sum:g}")
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Point d'entrée de la ligne de commande.
+
+    Args:
+        argv: Arguments de la ligne de commande (par défaut sys.argv).
+
+    Returns:
+        Code de sortie du processus.
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser(
+        "migrate", help="crée ou met à jour le schéma de la base"
+    )
+    migrate_parser.set_defaults(handler=migrate_command)
+
+    rebuild = commands.add_parser(
+        "rebuild-stats", help="recalcule item_stats et item_price_buckets"
+    )
+    rebuild.set_defaults(handler=rebuild_stats_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
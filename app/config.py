@@ -0,0 +1,29 @@
+"""Lecture des variables d'environnement partagée par les modules de l'app.
+
+Les réglages restent des constantes de module lues au chargement ; ce
+module fournit seulement l'interprétation commune des drapeaux booléens,
+pour que ``ADMISSION_ENABLED=1`` et ``DB_POOL_PRE_PING=True`` soient
+compris de la même façon partout.
+"""
+
+import os
+
+# Valeurs (insensibles à la casse) qui activent un drapeau booléen
+TRUE_VALUES = ("1", "true")
+
+
+def env_flag(name: str, default: bool) -> bool:
+    """Lit un drapeau booléen dans l'environnement.
+
+    Args:
+        name: Nom de la variable d'environnement.
+        default: Valeur retournée lorsque la variable n'est pas définie.
+
+    Returns:
+        True si la variable vaut ``1`` ou ``true`` (sans tenir compte de la
+        casse ni des espaces), False pour toute autre valeur.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in TRUE_VALUES
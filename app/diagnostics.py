@@ -0,0 +1,231 @@
+"""Diagnostic des requêtes SQL : journal des requêtes lentes et détection N+1.
+
+Sous-système optionnel (``DIAGNOSTICS_ENABLED=true``), branché sur les
+événements ``before_cursor_execute``/``after_cursor_execute`` des moteurs :
+
+- toute instruction plus longue que ``DIAGNOSTICS_SLOW_QUERY_MS`` est
+  journalisée avec ses paramètres et, si ``DIAGNOSTICS_EXPLAIN=true``
+  (PostgreSQL, SELECT uniquement), son plan ``EXPLAIN (ANALYZE, BUFFERS)`` ;
+- DiagnosticsMiddleware compte les instructions de chaque requête HTTP et
+  émet un avertissement lorsqu'une requête en exécute plus de
+  ``DIAGNOSTICS_MAX_QUERIES`` (N+1 probable). En mode strict
+  (``DIAGNOSTICS_STRICT=true``, pour les tests), l'instruction de trop lève
+  TooManyQueriesError ;
+- le nombre d'instructions et le temps passé en base sont ajoutés à la
+  réponse dans l'en-tête ``Server-Timing``.
+
+Le compteur de la requête est porté par une ContextVar : il suit la
+requête dans le pool de threads où s'exécutent les routes synchrones.
+"""
+
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import env_flag
+
+DIAGNOSTICS_ENABLED = env_flag("DIAGNOSTICS_ENABLED", False)
+DIAGNOSTICS_SLOW_QUERY_MS = float(os.getenv("DIAGNOSTICS_SLOW_QUERY_MS", "100"))
+DIAGNOSTICS_EXPLAIN = env_flag("DIAGNOSTICS_EXPLAIN", False)
+DIAGNOSTICS_MAX_QUERIES = int(os.getenv("DIAGNOSTICS_MAX_QUERIES", "20"))
+DIAGNOSTICS_STRICT = env_flag("DIAGNOSTICS_STRICT", False)
+
+# Longueur maximale des paramètres reproduits dans le journal
+MAX_PARAMETERS_LENGTH = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class TooManyQueriesError(RuntimeError):
+    """Levée en mode strict lorsqu'une requête dépasse DIAGNOSTICS_MAX_QUERIES."""
+
+
+@dataclass
+class RequestDiagnostics:
+    """Instructions SQL exécutées pendant une requête HTTP.
+
+    Attributes:
+        queries: Nombre d'instructions exécutées.
+        db_time: Temps cumulé passé en base (secondes).
+    """
+
+    queries: int = 0
+    db_time: float = 0.0
+
+    def server_timing(self, total: float) -> str:
+        """Construit la valeur de l'en-tête Server-Timing.
+
+        Args:
+            total: Durée de traitement de la requête (secondes).
+
+        Example:
+            >>> RequestDiagnostics(3, 0.0042).server_timing(0.012)
+            'db;desc="3 queries";dur=4.2, app;dur=12.0'
+        """
+        return (
+            f'db;desc="{self.queries} queries";dur={self.db_time * 1000:.1f}, '
+            f"app;dur={total * 1000:.1f}"
+        )
+
+
+current_request: ContextVar[RequestDiagnostics | None] = ContextVar(
+    "current_request", default=None
+)
+
+
+def _format_parameters(parameters: object) -> str:
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        return text[:MAX_PARAMETERS_LENGTH] + "..."
+    return text
+
+
+def _explain(conn, statement: str, parameters: object) -> str | None:
+    """Retourne le plan EXPLAIN (ANALYZE, BUFFERS) d'un SELECT PostgreSQL.
+
+    ANALYZE exécute de nouveau l'instruction : seules les lectures sont
+    expliquées, et toujours dans un SAVEPOINT annulé ensuite, ce qui défait
+    les écritures d'une CTE et isole un échec d'EXPLAIN de la transaction
+    de l'appelant. Le plan est obtenu sur un curseur DBAPI distinct, hors
+    des événements SQLAlchemy.
+    """
+    if conn.dialect.name != "postgresql":
+        return None
+    if statement.lstrip()[:6].upper() not in ("SELECT", "WITH"):
+        return None
+    cursor = conn.connection.cursor()
+    # Le plan est un bonus : ne jamais faire échouer la requête expliquée
+    try:
+        cursor.execute("SAVEPOINT diagnostics_explain")
+    except Exception as exc:
+        cursor.close()
+        return f"EXPLAIN failed: {exc}"
+    try:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+        return "\n".join(row[0] for row in cursor.fetchall())
+    except Exception as exc:
+        return f"EXPLAIN failed: {exc}"
+    finally:
+        try:
+            cursor.execute("ROLLBACK TO SAVEPOINT diagnostics_explain")
+            cursor.execute("RELEASE SAVEPOINT diagnostics_explain")
+        finally:
+            cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    request = current_request.get()
+    if request is not None:
+        request.queries += 1
+        if DIAGNOSTICS_STRICT and request.queries > DIAGNOSTICS_MAX_QUERIES:
+            raise TooManyQueriesError(
+                f"Request issued more than {DIAGNOSTICS_MAX_QUERIES} queries "
+                f"(possible N+1): {statement}"
+            )
+    conn.info.setdefault("diagnostics_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["diagnostics_start"].pop()
+    request = current_request.get()
+    if request is not None:
+        request.db_time += elapsed
+
+    if elapsed * 1000 < DIAGNOSTICS_SLOW_QUERY_MS:
+        return
+    plan = None
+    if DIAGNOSTICS_EXPLAIN and not executemany:
+        plan = _explain(conn, statement, parameters)
+    logger.warning(
+        "Slow query (%.1f ms): %s\nParameters: %s%s",
+        elapsed * 1000,
+        statement,
+        _format_parameters(parameters),
+        f"\nPlan:\n{plan}" if plan else "",
+    )
+
+
+def _handle_error(context):
+    if context.connection is not None and context.cursor is not None:
+        starts = context.connection.info.get("diagnostics_start")
+        if starts:
+            starts.pop()
+
+
+_LISTENERS = (
+    ("before_cursor_execute", _before_cursor_execute),
+    ("after_cursor_execute", _after_cursor_execute),
+    ("handle_error", _handle_error),
+)
+
+
+def install(engine: Engine) -> None:
+    """Branche le diagnostic sur les événements d'un moteur synchrone.
+
+    Pour un moteur asynchrone, passer son moteur synchrone sous-jacent
+    (``async_engine.sync_engine``).
+
+    Example:
+        >>> install(app.database.engine)
+    """
+    for name, listener in _LISTENERS:
+        if not event.contains(engine, name, listener):
+            event.listen(engine, name, listener)
+
+
+def uninstall(engine: Engine) -> None:
+    """Retire le diagnostic d'un moteur."""
+    for name, listener in _LISTENERS:
+        if event.contains(engine, name, listener):
+            event.remove(engine, name, listener)
+
+
+class DiagnosticsMiddleware:
+    """Compte les instructions SQL de chaque requête HTTP.
+
+    Ajoute l'en-tête ``Server-Timing`` à la réponse et journalise un
+    avertissement lorsque la requête dépasse DIAGNOSTICS_MAX_QUERIES.
+    Sans DIAGNOSTICS_ENABLED, la requête est transmise telle quelle.
+
+    Args:
+        app: Application ASGI enveloppée.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not DIAGNOSTICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        request = RequestDiagnostics()
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timing = request.server_timing(time.perf_counter() - start)
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = current_request.set(request)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            if request.queries > DIAGNOSTICS_MAX_QUERIES:
+                logger.warning(
+                    "%s %s issued %d queries (limit %d): possible N+1",
+                    scope["method"],
+                    scope["path"],
+                    request.queries,
+                    DIAGNOSTICS_MAX_QUERIES,
+                )
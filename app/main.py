@@ -1,14 +1,22 @@
 """Application FastAPI principale pour l'API CRUD des articles.
 
 Ce module initialise l'application FastAPI, configure les routes
-et gère le cycle de vie de l'application (création des tables, etc.).
+et gère le cycle de vie de l'application (vérification de la version du
+schéma au démarrage, fermeture du moteur asynchrone à l'arrêt). Les
+tables sont créées et migrées par ``python -m app.cli migrate``.
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from sqlmodel import SQLModel
-from app.database import engine
-from app.routes import items_router
+from fastapi import FastAPI, Response, status
+from fastapi.responses import PlainTextResponse
+from app import admission, database
+from app.database import DATABASE_ASYNC, async_engine, engine
+from app.diagnostics import DiagnosticsMiddleware
+from app.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from app.migrations import DATABASE_SCHEMA_CHECK, check_schema
+from app.profiling import ProfilingMiddleware
+from app.replicas import ReadYourWritesMiddleware
+from app.routes import items_router, monitoring_router
 
 
 @asynccontextmanager
@@ -16,16 +24,25 @@ async def lifespan(fastapi_app: FastAPI):
     """Gestionnaire du cycle de vie de l'application FastAPI.
 
     Cette fonction est exécutée au démarrage et à l'arrêt de l'application.
-    Elle crée toutes les tables de base de données au démarrage.
+    Au démarrage, elle vérifie seulement la version du schéma (une requête
+    sur une ligne) : les tables sont créées et migrées par
+    ``python -m app.cli migrate`` (voir app.migrations).
 
     Args:
         fastapi_app: Instance de l'application FastAPI.
 
     Yields:
         None: Permet l'exécution de l'application entre le démarrage et l'arrêt.
+
+    Raises:
+        SchemaVersionError: Si la base n'est pas migrée à la version attendue
+            (sauf DATABASE_SCHEMA_CHECK=false).
     """
-    SQLModel.metadata.create_all(engine)
+    if DATABASE_SCHEMA_CHECK:
+        check_schema(engine)
     yield
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 app = FastAPI(
@@ -35,7 +52,29 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Après une écriture, le client relit sur le primaire (voir app.replicas)
+app.add_middleware(ReadYourWritesMiddleware, get_replicas=lambda: database.replicas)
+# Compte les requêtes SQL de chaque requête HTTP (voir app.diagnostics)
+app.add_middleware(DiagnosticsMiddleware)
+# Profilage à la demande (X-Profile) ou échantillonné (voir app.profiling)
+app.add_middleware(ProfilingMiddleware)
+# Ajouté en dernier : enveloppe toute l'application (voir app.metrics)
+app.add_middleware(MetricsMiddleware)
+
+# En mode asynchrone, les routes CRUD asynchrones sont enregistrées en
+# premier et prennent la priorité sur leurs équivalents synchrones. Ils ne
+# sont importés que dans ce mode, pour ne pas alourdir le démarrage. Les
+# lectures asynchrones ne connaissent que le primaire : avec des réplicas,
+# les lectures restent servies par les routes synchrones.
+if DATABASE_ASYNC:
+    from app.routes.items_async import read_router as async_read_router
+    from app.routes.items_async import router as async_items_router
+
+    if not database.replicas:
+        app.include_router(async_read_router)
+    app.include_router(async_items_router)
 app.include_router(items_router)
+app.include_router(monitoring_router)
 
 
 @app.get("/")
@@ -53,20 +92,43 @@ def root():
 
 
 @app.get("/health")
-def health():
-    """Vérification de l'état de santé de l'API.
+def health(response: Response):
+    """Point de terminaison de disponibilité (readiness) de l'API.
+
+    Utilisé par les orchestrateurs de conteneurs : tant que le contrôle
+    d'admission des routes /items est saturé (toutes les places prises et
+    file d'attente pleine), la réponse est un 503 afin que le trafic soit
+    dirigé vers d'autres instances.
 
-    Point de terminaison utilisé pour les health checks
-    (par exemple par les orchestrateurs de conteneurs).
+    Args:
+        response: Réponse HTTP (injectée automatiquement).
 
     Returns:
-        Statut de santé de l'application.
+        Statut de l'instance et état du contrôle d'admission.
 
     Example:
         GET /health
-        Response: {"status": "healthy"}
+        Response: {"status": "healthy", "admission": {"limit": 15, ...}}
+    """
+    stats = admission.controller.stats()
+    if stats["saturated"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "saturated", "admission": stats}
+    return {"status": "healthy", "admission": stats}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    """Expose les métriques de l'API au format texte de Prometheus.
+
+    Returns:
+        Compteurs et histogrammes des requêtes HTTP et des requêtes SQL.
+
+    Example:
+        GET /metrics
+        Response: items_http_requests_total{method="GET",...} 42
     """
-    return {"status": "healthy"}
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
 
 
 # @app.get("/mamie")
@@ -0,0 +1,325 @@
+"""Métriques Prometheus de l'API (requêtes HTTP et requêtes SQL).
+
+Les métriques sont tenues en mémoire par le processus et exposées au
+format texte de Prometheus par ``GET /metrics`` :
+
+- ``items_http_requests_total`` et ``items_http_request_duration_seconds``
+  par méthode, route (gabarit, par exemple ``/items/{item_id}``) et statut ;
+- ``items_http_requests_in_flight`` par méthode ;
+- ``items_db_statement_duration_seconds`` et ``items_db_rows_total`` par
+  base (``primary``, ``replica``) et type d'instruction, collectés par les
+  événements ``before_cursor_execute``/``after_cursor_execute`` des moteurs.
+
+Le coût par requête se limite à quelques incréments protégés par un
+verrou : les métriques peuvent rester actives en production
+(``METRICS_ENABLED=false`` pour les désactiver). Chaque worker expose ses
+propres compteurs ; Prometheus les agrège.
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import env_flag
+
+METRICS_ENABLED = env_flag("METRICS_ENABLED", True)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bornes (secondes) des histogrammes de latence
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+# Types d'instruction distingués ; les autres sont regroupés sous "other"
+STATEMENT_KINDS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Labels, **extra: str) -> str:
+    pairs = [*zip(names, values), *extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Base commune : nom, aide, noms d'étiquettes et verrou."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Compteur monotone par combinaison d'étiquettes.
+
+    Example:
+        >>> requests = Counter("http_requests_total", "Requêtes", ["method"])
+        >>> requests.inc(("GET",))
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Valeur pouvant augmenter et diminuer (requêtes en cours, ...)."""
+
+    kind = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """Histogramme cumulatif à bornes fixes.
+
+    Example:
+        >>> latency = Histogram("latency_seconds", "Latence", ["route"], (0.1, 1))
+        >>> latency.observe(("/items/",), 0.042)
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float],
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Par étiquettes : effectifs par tranche (dernière = +Inf), somme
+        self._values: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, labels: Labels) -> int:
+        with self._lock:
+            entry = self._values.get(labels)
+            return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in self._values.items()
+            )
+        lines = []
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = _format_value(bound)
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_format_labels(self.labelnames, labels, le=le)} {cumulative}"
+                )
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(total)}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ensemble des métriques exposées par GET /metrics."""
+
+    def __init__(self) -> None:
+        self.metrics: list[_Metric] = []
+
+    def register(self, metric: Any) -> Any:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Retourne toutes les métriques au format texte de Prometheus."""
+        lines = [line for metric in self.metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.register(
+    Counter(
+        "items_http_requests_total",
+        "Requêtes HTTP traitées.",
+        ["method", "route", "status"],
+    )
+)
+http_latency = registry.register(
+    Histogram(
+        "items_http_request_duration_seconds",
+        "Durée de traitement des requêtes HTTP.",
+        ["method", "route"],
+        REQUEST_BUCKETS,
+    )
+)
+http_in_flight = registry.register(
+    Gauge("items_http_requests_in_flight", "Requêtes HTTP en cours.", ["method"])
+)
+db_latency = registry.register(
+    Histogram(
+        "items_db_statement_duration_seconds",
+        "Durée d'exécution des instructions SQL.",
+        ["database", "statement"],
+        STATEMENT_BUCKETS,
+    )
+)
+db_rows = registry.register(
+    Counter(
+        "items_db_rows_total",
+        "Lignes retournées ou modifiées par les instructions SQL "
+        "(selon cursor.rowcount du pilote).",
+        ["database", "statement"],
+    )
+)
+
+
+def statement_kind(statement: str) -> str:
+    """Retourne le type d'une instruction SQL (premier mot-clé).
+
+    Example:
+        >>> statement_kind("select items.id from items")
+        'SELECT'
+    """
+    words = statement.split(None, 1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in STATEMENT_KINDS else "other"
+
+
+def instrument_engine(engine: Engine, database: str = "primary") -> None:
+    """Mesure chaque instruction SQL exécutée par engine.
+
+    La durée est mesurée entre les événements ``before_cursor_execute`` et
+    ``after_cursor_execute``. Le nombre de lignes provient de
+    ``cursor.rowcount`` : lignes modifiées pour INSERT/UPDATE/DELETE,
+    lignes retournées pour un SELECT lorsque le pilote les connaît
+    (psycopg2 ; pas SQLite ni les curseurs côté serveur).
+
+    Args:
+        engine: Moteur synchrone (``async_engine.sync_engine`` pour un
+            moteur asynchrone).
+        database: Valeur de l'étiquette ``database``.
+    """
+    if not METRICS_ENABLED:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_start"].pop()
+        labels = (database, statement_kind(statement))
+        db_latency.observe(labels, elapsed)
+        rowcount = getattr(cursor, "rowcount", -1)
+        if rowcount is not None and rowcount > 0:
+            db_rows.inc(labels, rowcount)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # L'instruction a échoué : after_cursor_execute ne sera pas appelé
+        if context.connection is not None and context.cursor is not None:
+            starts = context.connection.info.get("metrics_start")
+            if starts:
+                starts.pop()
+
+
+class MetricsMiddleware:
+    """Compte et chronomètre chaque requête HTTP.
+
+    L'étiquette ``route`` est le gabarit de la route (``/items/{item_id}``)
+    et non le chemin réel, pour borner le nombre de séries ; les requêtes
+    ne correspondant à aucune route sont regroupées sous ``unmatched``.
+
+    Args:
+        app: Application ASGI enveloppée.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_in_flight.inc((method,))
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_in_flight.dec((method,))
+            route = getattr(scope.get("route"), "path", "unmatched")
+            http_requests.inc((method, route, str(status_code)))
+            http_latency.observe((method, route), elapsed)
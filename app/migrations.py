@@ -0,0 +1,248 @@
+"""Migrations versionnées du schéma de la base de données.
+
+Le schéma n'est plus créé au démarrage de chaque worker : il est migré
+explicitement (``python -m app.cli migrate``, par exemple en étape de
+déploiement), et la version appliquée est enregistrée dans la table
+schema_version. Au démarrage, l'application se contente de lire cette
+version (une requête sur une ligne) et refuse de démarrer sur un schéma
+en retard ; ``DATABASE_SCHEMA_CHECK=false`` supprime cette vérification.
+
+Chaque migration reçoit la connexion de la transaction de migration et
+décrit explicitement ses changements (DDL), sans s'appuyer sur les
+modèles courants : une migration appliquée ne change plus. La migration 1
+crée le schéma initial tel que l'ancien create_all au démarrage le
+créait ; elle est idempotente et adopte donc ces bases. Les migrations
+suivantes doivent elles aussi tolérer un schéma déjà partiellement à
+jour (bases créées par create_all entre deux versions).
+"""
+
+from collections.abc import Callable
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    exc,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import SQLModel, col
+
+from app.config import env_flag
+
+# Le paquet app.models enregistre toutes les tables dans SQLModel.metadata
+from app.models import SchemaVersion
+from app.services.stats import backfill_stats
+
+DATABASE_SCHEMA_CHECK = env_flag("DATABASE_SCHEMA_CHECK", True)
+
+# Clé du verrou consultatif PostgreSQL sérialisant les migrations concurrentes
+MIGRATION_LOCK_ID = 74_127_001
+
+
+class SchemaVersionError(RuntimeError):
+    """Levée lorsque le schéma de la base est en retard sur le code."""
+
+
+# Table items de la version 1, figée : ne pas la dériver du modèle Item
+_ITEMS_V1 = Table(
+    "items",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("nom", String, nullable=False, index=True),
+    Column("prix", Float, nullable=False),
+)
+
+# Recherche par nom sur SQLite : index FTS5 synchronisé par triggers
+_ITEMS_FTS_DDL: tuple[str, ...] = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5("
+    "nom, content='items', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN "
+    "INSERT INTO items_fts(rowid, nom) VALUES (new.id, new.nom); END",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, nom) "
+    "VALUES ('delete', old.id, old.nom); END",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE OF nom ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, nom) "
+    "VALUES ('delete', old.id, old.nom); "
+    "INSERT INTO items_fts(rowid, nom) VALUES (new.id, new.nom); END",
+    # Indexe les articles existants
+    "INSERT INTO items_fts(items_fts) VALUES ('rebuild')",
+)
+
+# Recherche par nom sur PostgreSQL : préfixe et sous-chaîne (pg_trgm)
+_ITEMS_PG_SEARCH_DDL: tuple[str, ...] = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_items_nom_lower_pattern "
+    "ON items (lower(nom) text_pattern_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_items_nom_trgm "
+    "ON items USING gin (nom gin_trgm_ops)",
+)
+
+
+def _initial_schema(connection: Connection) -> None:
+    """Crée la table items initiale et son index sur nom."""
+    _ITEMS_V1.create(connection, checkfirst=True)
+
+
+def _add_item_version(connection: Connection) -> None:
+    """Ajoute la colonne items.version (ETag et écritures conditionnelles)."""
+    columns = {column["name"] for column in inspect(connection).get_columns("items")}
+    if "version" not in columns:
+        connection.execute(
+            text("ALTER TABLE items ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+        )
+
+
+def _create_stats_tables(connection: Connection) -> None:
+    """(Re)crée les tables d'agrégats partitionnées puis les remplit."""
+    connection.execute(text("DROP TABLE IF EXISTS item_price_buckets"))
+    connection.execute(text("DROP TABLE IF EXISTS item_stats"))
+    connection.execute(
+        text(
+            "CREATE TABLE item_stats (shard INTEGER NOT NULL PRIMARY KEY, "
+            "count INTEGER NOT NULL, prix_sum FLOAT NOT NULL)"
+        )
+    )
+    connection.execute(
+        text(
+            "CREATE TABLE item_price_buckets (bucket INTEGER NOT NULL, "
+            "shard INTEGER NOT NULL, count INTEGER NOT NULL, "
+            "PRIMARY KEY (bucket, shard))"
+        )
+    )
+    backfill_stats(connection)
+
+
+def _create_item_indexes(connection: Connection) -> None:
+    """Crée les index de tri (clé, id) et de recherche par nom.
+
+    ix_items_nom est remplacé par ix_items_nom_id, qui sert aussi les
+    recherches sur nom seul.
+    """
+    connection.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_items_prix_id ON items (prix, id)")
+    )
+    connection.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_items_nom_id ON items (nom, id)")
+    )
+    connection.execute(text("DROP INDEX IF EXISTS ix_items_nom"))
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        statements = _ITEMS_PG_SEARCH_DDL
+    elif dialect == "sqlite":
+        statements = _ITEMS_FTS_DDL
+    else:
+        statements = ()
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def _items_v2(connection: Connection) -> None:
+    _add_item_version(connection)
+    _create_item_indexes(connection)
+    _create_stats_tables(connection)
+
+
+# Migrations par numéro de version, appliquées dans l'ordre croissant
+MIGRATIONS: dict[int, Callable[[Connection], None]] = {
+    1: _initial_schema,
+    2: _items_v2,
+}
+
+SCHEMA_VERSION = max(MIGRATIONS)
+
+
+def current_version(connection: Connection) -> int | None:
+    """Lit la version du schéma appliquée à la base.
+
+    Args:
+        connection: Connexion à la base.
+
+    Returns:
+        La version enregistrée, ou None si la base n'a jamais été migrée.
+    """
+    try:
+        return connection.execute(
+            select(col(SchemaVersion.version)).where(col(SchemaVersion.id) == 1)
+        ).scalar()
+    except (exc.OperationalError, exc.ProgrammingError):
+        # Table schema_version absente
+        connection.rollback()
+        return None
+
+
+def migrate(engine: Engine, target: int = SCHEMA_VERSION) -> tuple[int, int]:
+    """Applique les migrations manquantes jusqu'à target.
+
+    Les migrations et la mise à jour de schema_version sont faites dans
+    une seule transaction. Sur PostgreSQL, un verrou consultatif empêche
+    deux migrations concurrentes (déploiement progressif).
+
+    Args:
+        engine: Moteur de la base à migrer.
+        target: Version à atteindre (par défaut la dernière).
+
+    Returns:
+        Versions avant et après la migration.
+
+    Example:
+        >>> migrate(engine)
+        (0, 2)
+    """
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_ID}
+            )
+        schema_version = SQLModel.metadata.tables["schema_version"]
+        schema_version.create(connection, checkfirst=True)
+        version = connection.execute(
+            select(col(SchemaVersion.version)).where(col(SchemaVersion.id) == 1)
+        ).scalar()
+        start = version or 0
+        if start >= target:
+            return start, start
+
+        for number in range(start + 1, target + 1):
+            MIGRATIONS[number](connection)
+        if version is None:
+            connection.execute(schema_version.insert().values(id=1, version=target))
+        else:
+            connection.execute(
+                update(SchemaVersion)
+                .where(col(SchemaVersion.id) == 1)
+                .values(version=target)
+            )
+    return start, target
+
+
+def check_schema(engine: Engine) -> int:
+    """Vérifie que la base est au moins à la version attendue par le code.
+
+    Une base plus récente est acceptée : pendant un déploiement progressif,
+    les anciens workers continuent de servir après la migration.
+
+    Args:
+        engine: Moteur de la base.
+
+    Returns:
+        La version du schéma de la base.
+
+    Raises:
+        SchemaVersionError: Si la base n'a pas été migrée ou est en retard.
+    """
+    with engine.connect() as connection:
+        version = current_version(connection)
+    if version is None or version < SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at version {version or 0}, expected "
+            f"{SCHEMA_VERSION}: run `python -m app.cli migrate`"
+        )
+    return version
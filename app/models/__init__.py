@@ -1,3 +1,5 @@
 from .item import Item
+from .item_stats import ItemPriceBucket, ItemStats
+from .schema_version import SchemaVersion
 
-__all__ = ["Item"]
+__all__ = ["Item", "ItemStats", "ItemPriceBucket", "SchemaVersion"]
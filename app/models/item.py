@@ -1,9 +1,16 @@
 """Modèles de base de données pour les articles.
 
 Ce module définit les modèles SQLModel utilisés pour interagir
-avec la table items dans la base de données.
+avec la table items dans la base de données, ainsi que les structures
+de recherche par nom propres à chaque dialecte :
+
+- PostgreSQL : index ``lower(nom) text_pattern_ops`` (préfixe) et
+  index GIN ``pg_trgm`` (sous-chaîne et similarité) ;
+- SQLite : table virtuelle FTS5 ``items_fts`` (tokenizer trigram),
+  synchronisée par triggers.
 """
 
+from sqlalchemy import DDL, Index, column, event, func, table
 from sqlmodel import SQLModel, Field
 
 
@@ -16,8 +23,10 @@ class Item(SQLModel, table=True):
 
     Attributes:
         id: Identifiant unique de l'article (clé primaire, auto-incrémenté).
-        nom: Nom de l'article (indexé pour recherche rapide).
+        nom: Nom de l'article (indexé avec l'id pour le tri par nom).
         prix: Prix de l'article en euros (doit être positif).
+        version: Numéro de version de la ligne, incrémenté à chaque mise à
+            jour ; sert à calculer l'ETag de l'article.
 
     Example:
         >>> item = Item(nom="Ordinateur", prix=999.99)
@@ -28,5 +37,60 @@ class Item(SQLModel, table=True):
     __tablename__ = "items"
 
     id: int | None = Field(default=None, primary_key=True)
-    nom: str = Field(index=True)
+    nom: str
     prix: float
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
+
+
+# Table SQLAlchemy de Item, pour les index et les instructions sans ORM
+items_table = SQLModel.metadata.tables["items"]
+
+# Tri et filtres de GET /items/ : (clé de tri, id) servent les parcours
+# d'intervalle et le départage par id sans tri en mémoire.
+Index("ix_items_prix_id", items_table.c.prix, items_table.c.id)
+Index("ix_items_nom_id", items_table.c.nom, items_table.c.id)
+
+# Recherche par nom sur PostgreSQL
+Index(
+    "ix_items_nom_lower_pattern",
+    func.lower(items_table.c.nom).label("nom_lower"),
+    postgresql_ops={"nom_lower": "text_pattern_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_items_nom_trgm",
+    items_table.c.nom,
+    postgresql_using="gin",
+    postgresql_ops={"nom": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+event.listen(
+    items_table,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+# Recherche par nom sur SQLite : index plein texte externe au contenu de items
+items_fts = table("items_fts", column("rowid"), column("nom"), column("rank"))
+
+for statement in (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5("
+    "nom, content='items', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN "
+    "INSERT INTO items_fts(rowid, nom) VALUES (new.id, new.nom); END",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, nom) "
+    "VALUES ('delete', old.id, old.nom); END",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE OF nom ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, nom) "
+    "VALUES ('delete', old.id, old.nom); "
+    "INSERT INTO items_fts(rowid, nom) VALUES (new.id, new.nom); END",
+):
+    event.listen(
+        items_table, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+
+event.listen(
+    items_table,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS items_fts").execute_if(dialect="sqlite"),
+)
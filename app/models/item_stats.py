@@ -0,0 +1,49 @@
+"""Modèles des agrégats du catalogue d'articles.
+
+Ces tables sont tenues à jour par ItemService à chaque écriture, dans la
+même transaction que la modification de items : GET /items/stats les lit
+sans parcourir la table des articles.
+
+Les compteurs sont répartis sur ITEMS_STATS_SHARDS lignes (``shard``) :
+chaque écriture n'en verrouille qu'une, choisie au hasard, et les
+écritures concurrentes ne se sérialisent plus sur une ligne unique. La
+lecture additionne les lignes de toutes les partitions.
+"""
+
+from sqlmodel import SQLModel, Field
+
+
+class ItemStats(SQLModel, table=True):
+    """Agrégats globaux du catalogue, pour une partition des compteurs.
+
+    Attributes:
+        shard: Numéro de la partition (0 à ITEMS_STATS_SHARDS - 1).
+        count: Nombre d'articles comptés dans cette partition.
+        prix_sum: Somme des prix comptés dans cette partition.
+    """
+
+    __tablename__ = "item_stats"
+
+    shard: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    count: int = 0
+    prix_sum: float = 0.0
+
+
+class ItemPriceBucket(SQLModel, table=True):
+    """Nombre d'articles par tranche de prix, pour une partition.
+
+    La tranche ``bucket`` couvre les prix de ``bucket * largeur`` (inclus)
+    à ``(bucket + 1) * largeur`` (exclu), la largeur étant
+    ITEMS_STATS_BUCKET_WIDTH.
+
+    Attributes:
+        bucket: Indice de la tranche de prix.
+        shard: Numéro de la partition.
+        count: Nombre d'articles de la tranche comptés dans cette partition.
+    """
+
+    __tablename__ = "item_price_buckets"
+
+    bucket: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    shard: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    count: int = 0
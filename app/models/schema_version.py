@@ -0,0 +1,20 @@
+"""Modèle de la version du schéma de la base de données."""
+
+from sqlmodel import SQLModel, Field
+
+
+class SchemaVersion(SQLModel, table=True):
+    """Version du schéma appliquée à la base, sur une ligne unique (id = 1).
+
+    Écrite par ``python -m app.cli migrate`` et lue au démarrage de
+    l'application (voir app.migrations).
+
+    Attributes:
+        id: Identifiant de la ligne, toujours 1.
+        version: Numéro de la dernière migration appliquée.
+    """
+
+    __tablename__ = "schema_version"
+
+    id: int = Field(default=1, primary_key=True)
+    version: int
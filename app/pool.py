@@ -0,0 +1,129 @@
+"""Pool de connexions instrumenté et statistiques associées.
+
+Ce module fournit des variantes de QueuePool qui mesurent la latence
+d'obtention d'une connexion et le nombre d'appelants en attente, afin
+de dimensionner les workers à partir de mesures réelles.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+@dataclass
+class PoolStats:
+    """Compteurs cumulés des checkouts d'un pool de connexions.
+
+    Attributes:
+        waiters: Nombre d'appelants en train d'attendre une connexion.
+        checkouts: Nombre total de connexions obtenues.
+        timeouts: Nombre de checkouts abandonnés après pool_timeout.
+        total_wait: Temps cumulé passé à attendre une connexion (secondes).
+        max_wait: Attente la plus longue observée (secondes).
+    """
+
+    waiters: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, elapsed: float) -> None:
+        """Enregistre la durée d'un checkout réussi.
+
+        Args:
+            elapsed: Durée d'obtention de la connexion en secondes.
+        """
+        with self.lock:
+            self.checkouts += 1
+            self.total_wait += elapsed
+            self.max_wait = max(self.max_wait, elapsed)
+
+
+class _InstrumentedPoolMixin:
+    """Mesure chaque appel à ``connect()`` d'un QueuePool."""
+
+    stats: PoolStats
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self) -> Any:
+        stats = self.stats
+        with stats.lock:
+            stats.waiters += 1
+        start = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            with stats.lock:
+                stats.timeouts += 1
+            raise
+        finally:
+            with stats.lock:
+                stats.waiters -= 1
+        stats.record(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> Any:
+        # Conserve les compteurs lorsque le moteur recrée son pool (dispose, failover)
+        pool = super().recreate()  # type: ignore[misc]
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool synchrone instrumenté."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """QueuePool asynchrone instrumenté (moteurs créés par create_async_engine)."""
+
+
+def pool_status(pool: Pool) -> dict[str, Any]:
+    """Construit un instantané des statistiques d'un pool de connexions.
+
+    Les champs d'occupation ne sont renseignés que pour les pools de type
+    QueuePool ; les compteurs de checkout uniquement pour les pools instrumentés.
+
+    Args:
+        pool: Pool de connexions du moteur (``engine.pool``).
+
+    Returns:
+        Dictionnaire sérialisable en JSON.
+
+    Example:
+        >>> pool_status(engine.pool)["checked_out"]
+        0
+    """
+    status: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    stats: PoolStats | None = getattr(pool, "stats", None)
+    if stats is not None:
+        with stats.lock:
+            status.update(
+                waiters=stats.waiters,
+                checkouts=stats.checkouts,
+                timeouts=stats.timeouts,
+                checkout_latency_ms={
+                    "avg": (stats.total_wait / stats.checkouts * 1000)
+                    if stats.checkouts
+                    else 0.0,
+                    "max": stats.max_wait * 1000,
+                },
+            )
+    return status
@@ -0,0 +1,278 @@
+"""Profilage à la demande d'une requête HTTP.
+
+ProfilingMiddleware profile une requête lorsque celle-ci porte le jeton
+``PROFILING_TOKEN`` dans l'en-tête ``X-Profile``. Le jeton n'est jamais
+lu dans l'URL, qui finit dans les journaux d'accès et les proxys :
+
+- le profil cProfile est enregistré au format pstats dans
+  ``PROFILING_DIR`` (``python -m pstats``, snakeviz, ...), accompagné des
+  plus grosses allocations mesurées par tracemalloc ; l'identifiant du
+  profil est renvoyé dans l'en-tête ``X-Profile-Id``. Seuls les
+  ``PROFILING_MAX_FILES`` profils les plus récents sont conservés ;
+- avec ``X-Profile-Output: inline``, le rapport texte remplace le corps
+  de la réponse ; le statut d'origine est renvoyé dans
+  ``X-Profile-Status``. Ce mode exige le jeton : une requête seulement
+  échantillonnée est toujours servie normalement.
+
+``PROFILING_SAMPLE_RATE`` (0 par défaut) profile en plus une fraction des
+requêtes, sans tracemalloc, pour observer la production en continu à un
+coût moyen réduit.
+
+Depuis Python 3.12, cProfile observe tous les threads du processus (les
+routes synchrones s'exécutent dans le pool de threads) mais un seul profil
+peut être actif à la fois : une requête qui arrive pendant un profilage
+est servie normalement, avec ``X-Profile-Status: busy``. Le profil inclut
+le travail des autres requêtes concurrentes.
+"""
+
+import hmac
+import io
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILING_DIR = Path(os.getenv("PROFILING_DIR", "profiles"))
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+# Nombre maximal de profils conservés dans PROFILING_DIR (0 = sans limite)
+PROFILING_MAX_FILES = int(os.getenv("PROFILING_MAX_FILES", "100"))
+
+# Nombre de lignes des rapports (fonctions, allocations)
+REPORT_LIMIT = 40
+ALLOCATIONS_LIMIT = 20
+
+_profiler_lock = threading.Lock()
+
+
+def _request_options(scope: Scope) -> tuple[str | None, str | None]:
+    """Retourne le jeton et le mode de sortie demandés par les en-têtes."""
+    headers = dict(scope["headers"])
+    token = headers.get(b"x-profile")
+    output = headers.get(b"x-profile-output")
+    return (
+        token.decode("latin-1") if token else None,
+        output.decode("latin-1") if output else None,
+    )
+
+
+def is_authorized(token: str | None) -> bool:
+    """Indique si token autorise le profilage (PROFILING_TOKEN non vide).
+
+    Example:
+        >>> is_authorized("mauvais-jeton")
+        False
+    """
+    if not PROFILING_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode(), PROFILING_TOKEN.encode())
+
+
+def profile_report(
+    profiler: "cProfile.Profile",
+    allocations: "list[tracemalloc.StatisticDiff] | None" = None,
+) -> str:
+    """Construit le rapport texte d'un profil.
+
+    Args:
+        profiler: Profil cProfile arrêté.
+        allocations: Différences entre instantanés tracemalloc, si mesurées.
+
+    Returns:
+        Fonctions triées par temps cumulé, puis plus grosses allocations.
+    """
+    import pstats
+
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_LIMIT)
+    if allocations is not None:
+        out.write(f"\nTop {ALLOCATIONS_LIMIT} allocations (tracemalloc):\n")
+        for stat in allocations[:ALLOCATIONS_LIMIT]:
+            out.write(f"{stat}\n")
+    return out.getvalue()
+
+
+def save_profile(
+    profile_id: str,
+    profiler: "cProfile.Profile",
+    allocations: "list[tracemalloc.StatisticDiff] | None",
+) -> Path:
+    """Enregistre le profil (pstats) et son rapport texte dans PROFILING_DIR.
+
+    Les profils les plus anciens au-delà de PROFILING_MAX_FILES sont
+    ensuite supprimés.
+
+    Returns:
+        Chemin du fichier pstats.
+    """
+    PROFILING_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROFILING_DIR / f"{profile_id}.pstats"
+    profiler.dump_stats(path)
+    (PROFILING_DIR / f"{profile_id}.txt").write_text(
+        profile_report(profiler, allocations)
+    )
+    prune_profiles()
+    return path
+
+
+def prune_profiles(max_files: int | None = None) -> int:
+    """Supprime les profils les plus anciens de PROFILING_DIR.
+
+    Args:
+        max_files: Nombre de profils conservés (par défaut
+            PROFILING_MAX_FILES, 0 pour tout conserver).
+
+    Returns:
+        Nombre de profils supprimés.
+    """
+    limit = PROFILING_MAX_FILES if max_files is None else max_files
+    if limit <= 0:
+        return 0
+    profiles = sorted(
+        PROFILING_DIR.glob("*.pstats"), key=lambda path: path.stat().st_mtime_ns
+    )
+    stale = profiles[: max(len(profiles) - limit, 0)]
+    for path in stale:
+        # Un autre worker peut supprimer le même profil en même temps
+        path.unlink(missing_ok=True)
+        path.with_suffix(".txt").unlink(missing_ok=True)
+    return len(stale)
+
+
+def _with_headers(send: Send, extra: list[tuple[bytes, bytes]]) -> Send:
+    async def send_with_headers(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            message = {**message, "headers": [*message.get("headers", []), *extra]}
+        await send(message)
+
+    return send_with_headers
+
+
+class ProfilingMiddleware:
+    """Profile les requêtes autorisées et une fraction échantillonnée.
+
+    Args:
+        app: Application ASGI enveloppée.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token, output = _request_options(scope)
+        requested = is_authorized(token)
+        sampled = (
+            not requested
+            and PROFILING_SAMPLE_RATE > 0
+            and random.random() < PROFILING_SAMPLE_RATE
+        )
+        if not (requested or sampled):
+            await self.app(scope, receive, send)
+            return
+
+        if not _profiler_lock.acquire(blocking=False):
+            busy = _with_headers(send, [(b"x-profile-status", b"busy")])
+            await self.app(scope, receive, busy)
+            return
+        # Seule une requête autorisée peut recevoir le rapport à la place de
+        # sa réponse : une requête échantillonnée reste servie normalement
+        inline = requested and output == "inline"
+        try:
+            await self._profile(scope, receive, send, requested, inline)
+        finally:
+            _profiler_lock.release()
+
+    async def _profile(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        trace_allocations: bool,
+        inline: bool,
+    ) -> None:
+        # Importés à la demande : inutiles tant qu'aucune requête n'est profilée
+        import cProfile
+        import tracemalloc
+
+        path = re.sub(r"[^A-Za-z0-9_-]+", "_", scope["path"].strip("/")) or "root"
+        profile_id = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method']}-{path}-"
+            f"{uuid.uuid4().hex[:8]}"
+        )
+        started_tracemalloc = trace_allocations and not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot() if trace_allocations else None
+
+        response_start: Message = {}
+        profiler = cProfile.Profile()
+
+        async def capture(message: Message) -> None:
+            nonlocal response_start
+            if message["type"] == "http.response.start":
+                response_start = message
+            # En sortie inline, le corps d'origine est remplacé par le rapport
+            if not inline:
+                await send(message)
+
+        downstream = (
+            capture
+            if inline
+            else _with_headers(capture, [(b"x-profile-id", profile_id.encode())])
+        )
+        try:
+            profiler.enable()
+        except ValueError:
+            # Un autre outil (débogueur, profileur externe) occupe le profilage
+            if started_tracemalloc:
+                tracemalloc.stop()
+            busy = _with_headers(send, [(b"x-profile-status", b"busy")])
+            await self.app(scope, receive, busy)
+            return
+        try:
+            await self.app(scope, receive, downstream)
+        finally:
+            profiler.disable()
+            allocations = None
+            if before is not None:
+                allocations = tracemalloc.take_snapshot().compare_to(before, "lineno")
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+        if not inline:
+            await run_in_threadpool(save_profile, profile_id, profiler, allocations)
+            return
+
+        body = profile_report(profiler, allocations).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profile-id", profile_id.encode()),
+                    (
+                        b"x-profile-status",
+                        str(response_start.get("status", 500)).encode(),
+                    ),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,221 @@
+"""Routage des lectures vers des réplicas de la base de données.
+
+Lorsque ``DATABASE_REPLICA_URLS`` liste une ou plusieurs URLs, un moteur
+est créé par réplica (voir app.database) et les routes de lecture
+obtiennent leur session via ``get_read_db`` : chaque requête est servie
+par un réplica choisi à tour de rôle (``round_robin``) ou par celui dont
+le pool a le moins de connexions prises (``least_connections``).
+
+Un réplica injoignable est écarté pendant ``DATABASE_REPLICA_RETRY_AFTER``
+secondes ; lorsqu'aucun réplica n'est disponible, les lectures retombent
+sur le primaire.
+
+Lecture de ses propres écritures : après une écriture réussie,
+ReadYourWritesMiddleware pose un cookie qui renvoie les lectures du même
+client vers le primaire pendant ``DATABASE_READ_YOUR_WRITES_WINDOW``
+secondes, le temps que la réplication rattrape son retard.
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import QueuePool
+from sqlmodel import Session
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.pool import pool_status
+
+REPLICA_STRATEGY = os.getenv("DATABASE_REPLICA_STRATEGY", "round_robin")
+REPLICA_RETRY_AFTER = float(os.getenv("DATABASE_REPLICA_RETRY_AFTER", "30"))
+READ_YOUR_WRITES_WINDOW = float(os.getenv("DATABASE_READ_YOUR_WRITES_WINDOW", "5"))
+
+# Cookie contenant l'instant (epoch) jusqu'auquel lire sur le primaire
+READ_YOUR_WRITES_COOKIE = "items_read_primary_until"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def is_replica_session(db: Session) -> bool:
+    """Indique si la session lit sur un réplica (données possiblement en retard).
+
+    Example:
+        >>> is_replica_session(db)
+        False
+    """
+    return bool(db.info.get("replica"))
+
+
+def reads_own_writes(request: Request) -> bool:
+    """Indique si le client a écrit récemment et doit lire sur le primaire.
+
+    Args:
+        request: Requête HTTP en cours.
+
+    Returns:
+        True si le cookie de lecture sur le primaire n'a pas expiré.
+    """
+    value = request.cookies.get(READ_YOUR_WRITES_COOKIE)
+    if value is None:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+class ReplicaSet:
+    """Ensemble de réplicas en lecture avec sélection et mise à l'écart.
+
+    Attributes:
+        engines: Moteurs des réplicas, dans l'ordre de configuration.
+        strategy: ``round_robin`` ou ``least_connections``.
+        retry_after: Durée (secondes) de mise à l'écart d'un réplica en échec.
+
+    Example:
+        >>> replicas = ReplicaSet([create_engine(url) for url in urls])
+        >>> connection = replicas.connect()  # None : lire sur le primaire
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        strategy: str = REPLICA_STRATEGY,
+        retry_after: float = REPLICA_RETRY_AFTER,
+    ):
+        if strategy not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unknown replica strategy: {strategy!r}")
+        self.engines = list(engines)
+        self.strategy = strategy
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._down_until: dict[int, float] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def healthy(self) -> list[Engine]:
+        """Retourne les réplicas qui ne sont pas écartés."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                engine
+                for index, engine in enumerate(self.engines)
+                if self._down_until.get(index, 0.0) <= now
+            ]
+
+    def mark_unhealthy(self, engine: Engine) -> None:
+        """Écarte un réplica pendant retry_after secondes."""
+        with self._lock:
+            index = self.engines.index(engine)
+            self._down_until[index] = time.monotonic() + self.retry_after
+
+    def candidates(self) -> list[Engine]:
+        """Ordonne les réplicas disponibles selon la stratégie de sélection.
+
+        Returns:
+            Réplicas à essayer, le préféré en premier.
+        """
+        engines = self.healthy()
+        if not engines:
+            return []
+        start = next(self._counter) % len(engines)
+        engines = engines[start:] + engines[:start]
+        if self.strategy == "least_connections":
+            # Tri stable : à égalité, l'ordre du tourniquet départage
+            engines.sort(key=_checked_out)
+        return engines
+
+    def connect(self) -> Connection | None:
+        """Ouvre une connexion sur le premier réplica joignable.
+
+        Un réplica dont la connexion échoue est écarté et le suivant est
+        essayé.
+
+        Returns:
+            Connexion à un réplica, ou None si aucun n'est disponible.
+        """
+        for engine in self.candidates():
+            try:
+                return engine.connect()
+            except exc.DBAPIError:
+                self.mark_unhealthy(engine)
+        return None
+
+    def status(self) -> list[dict[str, Any]]:
+        """Retourne l'état de chaque réplica (disponibilité et pool).
+
+        Example:
+            >>> replicas.status()[0]["healthy"]
+            True
+        """
+        healthy = self.healthy()
+        return [
+            {
+                "url": engine.url.render_as_string(hide_password=True),
+                "healthy": engine in healthy,
+                **pool_status(engine.pool),
+            }
+            for engine in self.engines
+        ]
+
+
+def _checked_out(engine: Engine) -> int:
+    pool = engine.pool
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class ReadYourWritesMiddleware:
+    """Renvoie vers le primaire les lectures qui suivent une écriture.
+
+    Toute réponse réussie (statut < 400) à une requête qui n'est pas une
+    lecture (POST, PUT, PATCH, DELETE) pose le cookie
+    READ_YOUR_WRITES_COOKIE, valable READ_YOUR_WRITES_WINDOW secondes.
+    Sans réplica configuré, le middleware ne fait rien.
+
+    Args:
+        app: Application ASGI enveloppée.
+        get_replicas: Fonction retournant le ReplicaSet courant.
+        window: Durée de lecture sur le primaire après une écriture.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        get_replicas: Callable[[], ReplicaSet],
+        window: float = READ_YOUR_WRITES_WINDOW,
+    ):
+        self.app = app
+        self.get_replicas = get_replicas
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or not self.get_replicas()
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.window
+                cookie = (
+                    f"{READ_YOUR_WRITES_COOKIE}={until:.3f}; "
+                    f"Max-Age={int(self.window) + 1}; Path=/; HttpOnly; "
+                    "SameSite=Lax"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", cookie.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
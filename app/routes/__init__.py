@@ -1,3 +1,22 @@
 from .items import router as items_router
+from .monitoring import router as monitoring_router
 
-__all__ = ["items_router"]
+__all__ = [
+    "items_router",
+    "async_items_router",
+    "async_items_read_router",
+    "monitoring_router",
+]
+
+
+def __getattr__(name: str):
+    # Les routeurs asynchrones ne sont importés qu'à la demande (DATABASE_ASYNC)
+    if name == "async_items_router":
+        from .items_async import router
+
+        return router
+    if name == "async_items_read_router":
+        from .items_async import read_router
+
+        return read_router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
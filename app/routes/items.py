@@ -4,43 +4,381 @@ Ce module définit toutes les routes FastAPI pour les opérations CRUD
 sur les articles. Les routes utilisent ItemService pour la logique métier.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from collections.abc import Callable
+from typing import Any, Literal
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlmodel import Session
-from app.database import get_db
-from app.schemas.item import ItemCreate, ItemUpdate, ItemResponse
-from app.services.item_service import ItemService
+from app.admission import admission
+from app.database import get_db, get_read_db, get_session_factory
+from app.responses import ItemJSONResponse
+from app.schemas.item import (
+    ItemBatchResult,
+    ItemBulkDelete,
+    ItemBulkDeleteResult,
+    ItemBulkError,
+    ItemBulkReprice,
+    ItemBulkResult,
+    ItemBulkUpdate,
+    ItemBulkUpdateResult,
+    ItemCreate,
+    ItemImportSummary,
+    ItemUpdate,
+    ItemResponse,
+    ItemStatsResponse,
+)
+from app.services.importer import IMPORT_BATCH_SIZE, import_stream
+from app.services.export import MEDIA_TYPES, csv_chunks, ndjson_chunks
+from app.services.etag import etag_matches, if_match_version, item_etag, list_etag
+from app.services.item_service import (
+    BATCH_MAX_IDS,
+    BULK_BATCH_SIZE,
+    EXPORT_BATCH_SIZE,
+    CountMode,
+    ItemService,
+    SearchMode,
+    SortKey,
+    VersionConflictError,
+)
+from app.models.item import Item
+from app.services.pagination import MAX_ID, decode_page_cursor, encode_page_cursor
+
+# Toutes les routes /items passent par le contrôle d'admission
+router = APIRouter(prefix="/items", tags=["items"], dependencies=[Depends(admission)])
+
+# Taille maximale d'une page de GET /items/
+MAX_PAGE_SIZE = 1000
+
+
+def expected_version(if_match: str | None, item_id: int) -> int | None:
+    """Traduit un en-tête If-Match en version attendue pour le service.
 
-router = APIRouter(prefix="/items", tags=["items"])
+    Args:
+        if_match: Valeur de l'en-tête If-Match, ou None.
+        item_id: Identifiant de l'article ciblé.
+
+    Returns:
+        La version attendue, ou None si l'écriture est inconditionnelle.
+
+    Raises:
+        HTTPException: 412 si l'en-tête ne désigne pas cet article.
+    """
+    if if_match is None:
+        return None
+    try:
+        return if_match_version(if_match, item_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item with id {item_id} has been modified",
+        )
+
+
+def page_position(
+    sort: SortKey, cursor: str | None, after_id: int | None
+) -> tuple[int | None, Any]:
+    """Détermine la position de reprise d'une liste d'articles triée.
+
+    Args:
+        sort: Clé de tri demandée.
+        cursor: Jeton opaque de la page suivante, ou None.
+        after_id: Identifiant de reprise explicite, ou None.
+
+    Returns:
+        Couple (identifiant, valeur de la clé de tri) à passer au service.
+
+    Raises:
+        HTTPException: 400 si le curseur est invalide ou émis pour un autre
+            tri, ou si after_id est combiné à un tri autre que par ID.
+    """
+    if cursor is not None:
+        try:
+            return decode_page_cursor(cursor, sort)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+    if after_id is not None and sort != "id":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_id requires sort=id, use cursor instead",
+        )
+    return after_id, None
+
+
+def page_limit(limit: int) -> int:
+    """Ramène la taille de page demandée entre 0 et MAX_PAGE_SIZE.
+
+    Les clients existants pouvaient envoyer n'importe quel ``limit`` : une
+    valeur hors bornes est ramenée à la borne la plus proche au lieu d'être
+    refusée (422).
+
+    Example:
+        >>> page_limit(5000)
+        1000
+    """
+    return min(max(limit, 0), MAX_PAGE_SIZE)
+
+
+def next_page_cursor(items: list[Item], sort: SortKey) -> str:
+    """Construit le jeton de la page qui suit le dernier article de items.
+
+    Args:
+        items: Articles de la page courante, non vide.
+        sort: Clé de tri de la liste.
+
+    Returns:
+        Jeton opaque à placer dans l'en-tête X-Next-Cursor.
+    """
+    last = items[-1]
+    assert last.id is not None
+    return encode_page_cursor(sort, last.id, getattr(last, sort.lstrip("-")))
 
 
 @router.get("/", response_model=list[ItemResponse])
-def get_items(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_items(
+    skip: int = Query(0, ge=0, le=MAX_ID),
+    limit: int = 100,
+    after_id: int | None = Query(None, ge=0, le=MAX_ID),
+    cursor: str | None = None,
+    min_prix: float | None = Query(None, ge=0),
+    max_prix: float | None = Query(None, ge=0),
+    sort: SortKey = "id",
+    count: CountMode | None = None,
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_read_db),
+):
     """Récupère la liste des articles avec pagination.
 
+    La pagination par offset (``skip``) reste disponible pour les clients
+    existants. Pour parcourir de gros volumes, préférer la pagination par
+    curseur : ``after_id`` ou le jeton opaque ``cursor`` renvoyé dans
+    l'en-tête ``X-Next-Cursor`` de la page précédente.
+
+    La liste peut être restreinte à une fourchette de prix et triée par
+    prix, nom ou ID (préfixe ``-`` pour l'ordre décroissant). L'ID sert de
+    départage : l'ordre est total et le curseur reste stable même en cas
+    d'égalité sur la clé de tri. Les index composites (prix, id) et
+    (nom, id) servent ces requêtes sans tri en mémoire.
+
+    La page porte un ETag : si le client renvoie le même dans
+    ``If-None-Match``, la réponse est un 304 sans corps.
+
+    Le nombre total d'articles n'est calculé que sur demande (``count``) :
+    ``exact`` exécute un ``COUNT(*)``, ``estimate`` s'appuie sur les
+    statistiques de PostgreSQL ou sur un décompte récent mis en cache.
+
     Args:
         skip: Nombre d'articles à sauter (offset). Par défaut 0.
-        limit: Nombre maximum d'articles à retourner. Par défaut 100.
+        limit: Nombre maximum d'articles à retourner. Par défaut 100 ; une
+            valeur hors de 0-1000 est ramenée à la borne la plus proche.
+        after_id: Retourne uniquement les articles d'ID supérieur à cette valeur
+            (uniquement avec ``sort=id``).
+        cursor: Jeton opaque de la page suivante (prioritaire sur after_id).
+        min_prix: Prix minimum (inclus).
+        max_prix: Prix maximum (inclus).
+        sort: Clé de tri (``id``, ``prix``, ``nom``, préfixée de ``-``
+            pour l'ordre décroissant). Par défaut ``id``.
+        count: ``exact`` ou ``estimate`` pour recevoir le nombre total
+            d'articles correspondant aux filtres dans l'en-tête X-Total-Count.
+        if_none_match: ETag de la page déjà détenue par le client.
         db: Session de base de données (injectée automatiquement).
 
     Returns:
-        Liste des articles sous forme de schémas ItemResponse.
+        Liste des articles sous forme de schémas ItemResponse,
+        ou 304 Not Modified.
+
+    Raises:
+        HTTPException: 400 si le curseur est invalide ou ne correspond pas
+            au tri demandé.
 
     Example:
         GET /items/?skip=0&limit=10
+        GET /items/?limit=10&cursor=eyJpZCI6MTB9
+        GET /items/?min_prix=10&max_prix=50&sort=-prix
+        GET /items/?limit=20&count=estimate
+    """
+    limit = page_limit(limit)
+    after_id, after_value = page_position(sort, cursor, after_id)
+    items = ItemService.get_all(
+        db,
+        skip,
+        limit,
+        after_id=after_id,
+        min_prix=min_prix,
+        max_prix=max_prix,
+        sort=sort,
+        after_value=after_value,
+    )
+    etag = list_etag(items)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    headers = {"ETag": etag}
+    if count is not None:
+        total = ItemService.count(db, count, min_prix=min_prix, max_prix=max_prix)
+        headers["X-Total-Count"] = str(total)
+    if items and len(items) == limit:
+        headers["X-Next-Cursor"] = next_page_cursor(items, sort)
+    return ItemJSONResponse(items, headers=headers)
+
+
+@router.get("/search", response_model=list[ItemResponse])
+def search_items(
+    q: str = Query(min_length=1, max_length=255),
+    mode: SearchMode = "prefix",
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    """Recherche des articles par nom, sans tenir compte de la casse.
+
+    Args:
+        q: Texte recherché.
+        mode: ``prefix`` (le nom commence par q, par défaut), ``contains``
+            (le nom contient q) ou ``fuzzy`` (nom proche de q, par similarité
+            trigram).
+        limit: Nombre maximum de résultats (1-100). Par défaut 20.
+        db: Session de base de données (injectée automatiquement).
+
+    Returns:
+        Articles correspondants, les plus pertinents en premier.
+
+    Example:
+        GET /items/search?q=clav&mode=prefix
+    """
+    return ItemJSONResponse(ItemService.search(db, q, mode, limit))
+
+
+@router.get("/batch", response_model=ItemBatchResult)
+def get_items_batch(
+    ids: list[int] = Query(min_length=1, max_length=BATCH_MAX_IDS),
+    db: Session = Depends(get_read_db),
+):
+    """Récupère plusieurs articles en une seule requête.
+
+    Remplace N appels à ``GET /items/{id}`` : les articles absents du
+    cache sont lus avec une seule requête ``WHERE id IN (...)``.
+
+    Args:
+        ids: IDs recherchés (paramètre répété), au plus ITEMS_BATCH_MAX_IDS.
+        db: Session de base de données (injectée automatiquement).
+
+    Returns:
+        Les articles trouvés dans l'ordre demandé et les IDs inexistants
+        (schéma ItemBatchResult).
+
+    Example:
+        GET /items/batch?ids=3&ids=1&ids=99
+        Response: {"items": [{"id": 3, ...}, {"id": 1, ...}], "missing": [99]}
     """
-    return ItemService.get_all(db, skip, limit)
+    items = ItemService.get_many(db, ids)
+    found = {item.id for item in items}
+    missing = [item_id for item_id in dict.fromkeys(ids) if item_id not in found]
+    return ItemJSONResponse({"items": items, "missing": missing})
+
+
+@router.get("/stats", response_model=ItemStatsResponse)
+def get_items_stats(
+    bucket_width: float | None = Query(None, gt=0),
+    db: Session = Depends(get_read_db),
+):
+    """Retourne les statistiques du catalogue et l'histogramme des prix.
+
+    Les valeurs proviennent des tables d'agrégats mises à jour à chaque
+    écriture : le coût de l'appel ne dépend pas du nombre d'articles.
+
+    Args:
+        bucket_width: Largeur des tranches de l'histogramme, multiple de
+            ITEMS_STATS_BUCKET_WIDTH. Par défaut cette largeur.
+        db: Session de base de données (injectée automatiquement).
+
+    Returns:
+        Nombre d'articles, prix minimum, maximum, moyen, somme des prix
+        et histogramme.
+
+    Raises:
+        HTTPException: 400 si bucket_width n'est pas un multiple valide.
+
+    Example:
+        GET /items/stats?bucket_width=50
+    """
+    try:
+        return ItemService.get_stats(db, bucket_width)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media: {} for media in MEDIA_TYPES.values()}}},
+)
+def export_items(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=50_000),
+    db: Session = Depends(get_read_db),
+):
+    """Exporte tout le catalogue en flux NDJSON ou CSV.
+
+    Les articles sont lus par lots depuis un curseur côté serveur et
+    envoyés au fur et à mesure : la mémoire consommée ne dépend pas de la
+    taille de la table.
+
+    Args:
+        format: Format de sortie, ``ndjson`` (par défaut) ou ``csv``.
+        batch_size: Nombre de lignes lues par aller-retour avec la base.
+        db: Session de base de données (injectée automatiquement).
+
+    Returns:
+        Réponse en flux contenant tous les articles, triés par ID.
+
+    Example:
+        GET /items/export?format=csv
+    """
+    batches = ItemService.iter_rows(db, batch_size)
+    chunks = csv_chunks(batches) if format == "csv" else ndjson_chunks(batches)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="items.{format}"'},
+    )
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
-def get_item(item_id: int, db: Session = Depends(get_db)):
+def get_item(
+    item_id: int,
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_read_db),
+):
     """Récupère un article spécifique par son ID.
 
+    Avec ``If-None-Match``, seule la version de l'article est lue : si
+    l'ETag correspond, la réponse est un 304 sans charger ni sérialiser
+    l'article.
+
     Args:
         item_id: Identifiant unique de l'article recherché.
+        if_none_match: ETag de l'article déjà détenu par le client.
         db: Session de base de données (injectée automatiquement).
 
     Returns:
-        L'article trouvé sous forme de schéma ItemResponse.
+        L'article trouvé sous forme de schéma ItemResponse,
+        ou 304 Not Modified.
 
     Raises:
         HTTPException: 404 si l'article n'existe pas.
@@ -48,13 +386,22 @@ def get_item(item_id: int, db: Session = Depends(get_db)):
     Example:
         GET /items/1
     """
+    if if_none_match:
+        version = ItemService.get_version(db, item_id)
+        if version is not None:
+            etag = item_etag(item_id, version)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
     item = ItemService.get_by_id(db, item_id)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with id {item_id} not found",
         )
-    return item
+    return ItemJSONResponse(item, headers={"ETag": item_etag(item_id, item.version)})
 
 
 @router.post("/", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
@@ -72,58 +419,281 @@ def create_item(item_data: ItemCreate, db: Session = Depends(get_db)):
         POST /items/
         Body: {"nom": "Laptop", "prix": 899.99}
     """
-    return ItemService.create(db, item_data)
+    item = ItemService.create(db, item_data)
+    # L'identifiant est attribué par la base lors de l'insertion
+    assert item.id is not None
+    return ItemJSONResponse(
+        item,
+        status_code=status.HTTP_201_CREATED,
+        headers={"ETag": item_etag(item.id, item.version)},
+    )
+
+
+@router.post("/bulk", response_model=ItemBulkResult)
+def create_items_bulk(
+    payload: list[Any] = Body(...),
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=10_000),
+    db: Session = Depends(get_db),
+):
+    """Crée plusieurs articles en une seule requête.
+
+    Chaque ligne est validée individuellement avec le schéma ItemCreate :
+    les lignes invalides (y compris un élément qui n'est pas un objet)
+    sont signalées dans ``errors`` sans empêcher l'insertion des lignes
+    valides, faite par lots de ``batch_size``.
+
+    Args:
+        payload: Liste d'objets article (mêmes champs que ItemCreate).
+        batch_size: Nombre d'articles insérés par lot et par transaction.
+        db: Session de base de données (injectée automatiquement).
+
+    Returns:
+        Les IDs créés et les erreurs par ligne (schéma ItemBulkResult).
+
+    Example:
+        POST /items/bulk?batch_size=1000
+        Body: [{"nom": "Laptop", "prix": 899.99}, {"nom": "", "prix": -1}]
+    """
+    valid: list[ItemCreate] = []
+    errors: list[ItemBulkError] = []
+    for index, row in enumerate(payload):
+        try:
+            valid.append(ItemCreate.model_validate(row))
+        except ValidationError as exc:
+            errors.append(
+                ItemBulkError(
+                    index=index,
+                    errors=exc.errors(include_url=False, include_context=False),
+                )
+            )
+
+    ids = ItemService.create_many(db, valid, batch_size)
+    return ItemBulkResult(ids=ids, errors=errors)
+
+
+@router.patch("/bulk", response_model=ItemBulkUpdateResult)
+def update_items_bulk(
+    payload: list[ItemBulkUpdate] | ItemBulkReprice = Body(...),
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=10_000),
+    db: Session = Depends(get_db),
+):
+    """Met à jour plusieurs articles en une seule requête.
+
+    Deux formes de corps sont acceptées :
+
+    - une liste ``[{"id", "nom"?, "prix"?}, ...]`` : chaque article est
+      modifié partiellement, par lots de ``batch_size`` (une instruction
+      UPDATE ensembliste et une transaction par lot) ;
+    - un ajustement ``{"factor", "min_prix"?, "max_prix"?}`` : le prix de
+      tous les articles de la fourchette est multiplié par ``factor``, en
+      une seule instruction UPDATE.
+
+    Args:
+        payload: Liste de modifications (ItemBulkUpdate) ou ajustement de
+            prix (ItemBulkReprice).
+        batch_size: Nombre d'articles modifiés par lot et par transaction
+            (forme par liste).
+        db: Session de base de données (injectée automatiquement).
+
+    Returns:
+        Le nombre d'articles modifiés et les IDs inexistants
+        (schéma ItemBulkUpdateResult).
+
+    Raises:
+        HTTPException: 422 si un nouveau prix dépasserait MAX_PRIX.
+
+    Example:
+        PATCH /items/bulk
+        Body: [{"id": 1, "prix": 9.99}, {"id": 2, "nom": "Souris"}]
+
+        PATCH /items/bulk
+        Body: {"factor": 1.05, "max_prix": 20}
+    """
+    if isinstance(payload, ItemBulkReprice):
+        try:
+            updated = ItemService.reprice(
+                db,
+                payload.factor,
+                min_prix=payload.min_prix,
+                max_prix=payload.max_prix,
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+            )
+        return ItemBulkUpdateResult(updated=updated)
+
+    ids = ItemService.update_many(db, payload, batch_size)
+    found = set(ids)
+    not_found = [
+        item_id
+        for item_id in dict.fromkeys(entry.id for entry in payload)
+        if item_id not in found
+    ]
+    return ItemBulkUpdateResult(updated=len(ids), not_found=not_found)
+
+
+@router.delete("/bulk", response_model=ItemBulkDeleteResult)
+def delete_items_bulk(
+    payload: ItemBulkDelete = Body(...),
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=10_000),
+    db: Session = Depends(get_db),
+):
+    """Supprime plusieurs articles par liste d'IDs et/ou par filtre.
+
+    Les critères fournis se cumulent (fourchette de prix, début du nom,
+    IDs). La suppression est faite par lots de ``batch_size`` articles,
+    une instruction DELETE et une transaction par lot.
+
+    Args:
+        payload: Critères de suppression (schéma ItemBulkDelete).
+        batch_size: Nombre d'articles supprimés par lot et par transaction.
+        db: Session de base de données (injectée automatiquement).
+
+    Returns:
+        Le nombre d'articles supprimés (schéma ItemBulkDeleteResult).
+
+    Example:
+        DELETE /items/bulk
+        Body: {"ids": [3, 4, 5]}
+
+        DELETE /items/bulk
+        Body: {"nom_prefix": "Promo ", "max_prix": 5}
+    """
+    deleted = ItemService.delete_many(
+        db,
+        payload.ids,
+        min_prix=payload.min_prix,
+        max_prix=payload.max_prix,
+        nom_prefix=payload.nom_prefix,
+        batch_size=batch_size,
+    )
+    return ItemBulkDeleteResult(deleted=deleted)
+
+
+@router.post(
+    "/import",
+    response_model=ItemImportSummary,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                media: {"schema": {"type": "string"}} for media in MEDIA_TYPES.values()
+            },
+        }
+    },
+)
+async def import_items(
+    request: Request,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=100_000),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+):
+    """Importe des articles depuis un corps de requête NDJSON ou CSV.
+
+    Le corps est lu en flux et jamais chargé entièrement en mémoire :
+    chaque ligne est validée avec ItemCreate, les lignes valides sont
+    insérées par lots de ``batch_size`` (avec COPY sur PostgreSQL) et
+    validées au fil de l'import.
+
+    Args:
+        request: Requête HTTP dont le corps est lu en flux.
+        format: Format du corps, ``ndjson`` (par défaut) ou ``csv``
+            (avec une ligne d'en-tête ``nom,prix``).
+        batch_size: Nombre de lignes insérées par transaction.
+        session_factory: Fabrique de sessions (injectée automatiquement) :
+            chaque lot ouvre sa session dans le thread qui l'insère.
+
+    Returns:
+        Bilan de l'import (schéma ItemImportSummary).
+
+    Example:
+        POST /items/import?format=csv
+        Body: nom,prix\nLaptop,899.99\nSouris,19.90
+    """
+    return await import_stream(session_factory, request.stream(), format, batch_size)
 
 
 @router.put("/{item_id}", response_model=ItemResponse)
-def update_item(item_id: int, item_data: ItemUpdate, db: Session = Depends(get_db)):
+def update_item(
+    item_id: int,
+    item_data: ItemUpdate,
+    if_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
     """Met à jour un article existant.
 
     Effectue une mise à jour partielle : seuls les champs fournis
-    dans item_data seront modifiés.
+    dans item_data seront modifiés. Avec ``If-Match``, la mise à jour
+    n'a lieu que si l'article n'a pas changé depuis la lecture du client.
 
     Args:
         item_id: Identifiant de l'article à mettre à jour.
         item_data: Nouvelles données (schéma ItemUpdate avec champs optionnels).
+        if_match: ETag de la version lue par le client.
         db: Session de base de données (injectée automatiquement).
 
     Returns:
         L'article mis à jour (schéma ItemResponse).
 
     Raises:
-        HTTPException: 404 si l'article n'existe pas.
+        HTTPException: 404 si l'article n'existe pas,
+            412 si l'article a été modifié entre-temps.
 
     Example:
         PUT /items/1
         Body: {"prix": 799.99}  # Met à jour seulement le prix
     """
-    item = ItemService.update(db, item_id, item_data)
+    try:
+        item = ItemService.update(
+            db, item_id, item_data, expected_version(if_match, item_id)
+        )
+    except VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item with id {item_id} has been modified",
+        )
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with id {item_id} not found",
         )
-    return item
+    return ItemJSONResponse(item, headers={"ETag": item_etag(item_id, item.version)})
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_item(item_id: int, db: Session = Depends(get_db)):
+def delete_item(
+    item_id: int,
+    if_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
     """Supprime un article de la base de données.
 
+    Avec ``If-Match``, la suppression n'a lieu que si l'article n'a pas
+    changé depuis la lecture du client.
+
     Args:
         item_id: Identifiant de l'article à supprimer.
+        if_match: ETag de la version lue par le client.
         db: Session de base de données (injectée automatiquement).
 
     Returns:
         Aucun contenu (status 204 No Content) en cas de succès.
 
     Raises:
-        HTTPException: 404 si l'article n'existe pas.
+        HTTPException: 404 si l'article n'existe pas,
+            412 si l'article a été modifié entre-temps.
 
     Example:
         DELETE /items/1
     """
-    deleted = ItemService.delete(db, item_id)
+    try:
+        deleted = ItemService.delete(db, item_id, expected_version(if_match, item_id))
+    except VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item with id {item_id} has been modified",
+        )
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
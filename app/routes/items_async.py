@@ -0,0 +1,243 @@
+"""Points de terminaison CRUD asynchrones pour les articles.
+
+Ces routeurs exposent les mêmes routes CRUD que app.routes.items, mais en
+``async def`` sur une AsyncSession. Ils ne sont montés (avant le routeur
+synchrone, qu'ils masquent pour ces routes) que lorsque le moteur
+asynchrone est activé ; les autres routes restent servies par le
+routeur synchrone.
+
+Les lectures (read_router) se font toujours sur le primaire : elles ne
+sont montées qu'en l'absence de réplicas, qui restent sinon servis par
+les routes synchrones (voir app.replicas). Les écritures (router) vont
+au primaire dans tous les cas.
+"""
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.admission import admission
+from app.database import get_async_db
+from app.responses import ItemJSONResponse
+from app.routes.items import (
+    expected_version,
+    next_page_cursor,
+    page_limit,
+    page_position,
+)
+from app.schemas.item import ItemCreate, ItemUpdate, ItemResponse
+from app.services.async_item_service import AsyncItemService
+from app.services.etag import etag_matches, item_etag, list_etag
+from app.services.item_service import CountMode, SortKey, VersionConflictError
+from app.services.pagination import MAX_ID
+
+# Toutes les routes /items passent par le contrôle d'admission
+read_router = APIRouter(
+    prefix="/items", tags=["items"], dependencies=[Depends(admission)]
+)
+router = APIRouter(prefix="/items", tags=["items"], dependencies=[Depends(admission)])
+
+
+@read_router.get("/", response_model=list[ItemResponse])
+async def get_items(
+    skip: int = Query(0, ge=0, le=MAX_ID),
+    limit: int = 100,
+    after_id: int | None = Query(None, ge=0, le=MAX_ID),
+    cursor: str | None = None,
+    min_prix: float | None = Query(None, ge=0),
+    max_prix: float | None = Query(None, ge=0),
+    sort: SortKey = "id",
+    count: CountMode | None = None,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Récupère la liste des articles avec pagination (version asynchrone).
+
+    Args:
+        skip: Nombre d'articles à sauter (offset). Par défaut 0.
+        limit: Nombre maximum d'articles à retourner. Par défaut 100 ; une
+            valeur hors de 0-1000 est ramenée à la borne la plus proche.
+        after_id: Retourne uniquement les articles d'ID supérieur à cette valeur
+            (uniquement avec ``sort=id``).
+        cursor: Jeton opaque de la page suivante (prioritaire sur after_id).
+        min_prix: Prix minimum (inclus).
+        max_prix: Prix maximum (inclus).
+        sort: Clé de tri (``id``, ``prix``, ``nom``, préfixée de ``-``
+            pour l'ordre décroissant). Par défaut ``id``.
+        count: ``exact`` ou ``estimate`` pour recevoir le nombre total
+            d'articles correspondant aux filtres dans l'en-tête X-Total-Count.
+        if_none_match: ETag de la page déjà détenue par le client.
+        db: Session asynchrone (injectée automatiquement).
+
+    Returns:
+        Liste des articles sous forme de schémas ItemResponse,
+        ou 304 Not Modified.
+
+    Raises:
+        HTTPException: 400 si le curseur est invalide ou ne correspond pas
+            au tri demandé.
+    """
+    limit = page_limit(limit)
+    after_id, after_value = page_position(sort, cursor, after_id)
+    items = await AsyncItemService.get_all(
+        db,
+        skip,
+        limit,
+        after_id=after_id,
+        min_prix=min_prix,
+        max_prix=max_prix,
+        sort=sort,
+        after_value=after_value,
+    )
+    etag = list_etag(items)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    headers = {"ETag": etag}
+    if count is not None:
+        total = await AsyncItemService.count(
+            db, count, min_prix=min_prix, max_prix=max_prix
+        )
+        headers["X-Total-Count"] = str(total)
+    if items and len(items) == limit:
+        headers["X-Next-Cursor"] = next_page_cursor(items, sort)
+    return ItemJSONResponse(items, headers=headers)
+
+
+# Le convertisseur ":int" évite de masquer les routes statiques
+# du routeur synchrone (/items/bulk, ...).
+@read_router.get("/{item_id:int}", response_model=ItemResponse)
+async def get_item(
+    item_id: int,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Récupère un article spécifique par son ID (version asynchrone).
+
+    Args:
+        item_id: Identifiant unique de l'article recherché.
+        if_none_match: ETag de l'article déjà détenu par le client.
+        db: Session asynchrone (injectée automatiquement).
+
+    Returns:
+        L'article trouvé sous forme de schéma ItemResponse,
+        ou 304 Not Modified.
+
+    Raises:
+        HTTPException: 404 si l'article n'existe pas.
+    """
+    if if_none_match:
+        version = await AsyncItemService.get_version(db, item_id)
+        if version is not None:
+            etag = item_etag(item_id, version)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+    item = await AsyncItemService.get_by_id(db, item_id)
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with id {item_id} not found",
+        )
+    return ItemJSONResponse(item, headers={"ETag": item_etag(item_id, item.version)})
+
+
+@router.post("/", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
+async def create_item(
+    item_data: ItemCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Crée un nouvel article dans la base de données (version asynchrone).
+
+    Args:
+        item_data: Données de l'article à créer (schéma ItemCreate validé).
+        db: Session asynchrone (injectée automatiquement).
+
+    Returns:
+        L'article créé avec son ID généré (schéma ItemResponse).
+    """
+    item = await AsyncItemService.create(db, item_data)
+    # L'identifiant est attribué par la base lors de l'insertion
+    assert item.id is not None
+    return ItemJSONResponse(
+        item,
+        status_code=status.HTTP_201_CREATED,
+        headers={"ETag": item_etag(item.id, item.version)},
+    )
+
+
+@router.put("/{item_id:int}", response_model=ItemResponse)
+async def update_item(
+    item_id: int,
+    item_data: ItemUpdate,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Met à jour un article existant (version asynchrone).
+
+    Args:
+        item_id: Identifiant de l'article à mettre à jour.
+        item_data: Nouvelles données (schéma ItemUpdate avec champs optionnels).
+        if_match: ETag de la version lue par le client.
+        db: Session asynchrone (injectée automatiquement).
+
+    Returns:
+        L'article mis à jour (schéma ItemResponse).
+
+    Raises:
+        HTTPException: 404 si l'article n'existe pas,
+            412 si l'article a été modifié entre-temps.
+    """
+    try:
+        item = await AsyncItemService.update(
+            db, item_id, item_data, expected_version(if_match, item_id)
+        )
+    except VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item with id {item_id} has been modified",
+        )
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with id {item_id} not found",
+        )
+    return ItemJSONResponse(item, headers={"ETag": item_etag(item_id, item.version)})
+
+
+@router.delete("/{item_id:int}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_item(
+    item_id: int,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Supprime un article de la base de données (version asynchrone).
+
+    Args:
+        item_id: Identifiant de l'article à supprimer.
+        if_match: ETag de la version lue par le client.
+        db: Session asynchrone (injectée automatiquement).
+
+    Returns:
+        Aucun contenu (status 204 No Content) en cas de succès.
+
+    Raises:
+        HTTPException: 404 si l'article n'existe pas,
+            412 si l'article a été modifié entre-temps.
+    """
+    try:
+        deleted = await AsyncItemService.delete(
+            db, item_id, expected_version(if_match, item_id)
+        )
+    except VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item with id {item_id} has been modified",
+        )
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with id {item_id} not found",
+        )
@@ -0,0 +1,75 @@
+"""Points de terminaison de supervision de l'API.
+
+Ce module expose des statistiques d'exécution (pool de connexions, cache, ...)
+pour dimensionner les workers à partir de mesures plutôt qu'au jugé.
+"""
+
+from fastapi import APIRouter
+
+from app import database
+from app.pool import pool_status
+from app.services.item_service import ItemService
+
+router = APIRouter(prefix="/health", tags=["monitoring"])
+
+
+@router.get("/pool")
+def get_pool_stats():
+    """Retourne l'état courant des pools de connexions.
+
+    Returns:
+        Statistiques du pool du moteur synchrone (``sync``) et, s'il est
+        activé, du moteur asynchrone (``async``) : connexions prises,
+        débordement, appelants en attente et latence de checkout. Les
+        réplicas configurés figurent sous ``replicas``, avec leur
+        disponibilité (``healthy``).
+
+    Example:
+        GET /health/pool
+        Response: {"sync": {"pool": "InstrumentedQueuePool", "size": 5, ...}}
+    """
+    stats = {"sync": pool_status(database.engine.pool)}
+    if database.async_engine is not None:
+        stats["async"] = pool_status(database.async_engine.pool)
+    if database.replicas:
+        stats["replicas"] = database.replicas.status()
+    return stats
+
+
+@router.get("/cache")
+def get_cache_stats():
+    """Retourne les compteurs du cache de lecture des articles.
+
+    Returns:
+        Taille courante, hits, misses, évictions et expirations du cache
+        utilisé par ItemService.get_by_id.
+
+    Example:
+        GET /health/cache
+        Response: {"backend": "LRUCache", "hits": 42, "misses": 3, ...}
+    """
+    return ItemService.cache.stats()
+
+
+@router.get("/singleflight")
+def get_singleflight_stats():
+    """Retourne les compteurs du regroupement des lectures concurrentes.
+
+    Returns:
+        Compteurs des routes synchrones (``sync``) et, si le moteur
+        asynchrone est activé, des routes asynchrones (``async``) : nombre
+        de lectures exécutées en base (``executed``), de lectures épargnées
+        parce qu'un appel identique était déjà en cours (``shared``) et
+        d'appels en cours.
+
+    Example:
+        GET /health/singleflight
+        Response: {"sync": {"enabled": true, "executed": 120, "shared": 37, ...}}
+    """
+    stats = {"sync": ItemService.flight.stats()}
+    if database.async_engine is not None:
+        # Importé seulement en mode asynchrone, comme les routes asynchrones
+        from app.services.async_item_service import AsyncItemService
+
+        stats["async"] = AsyncItemService.flight.stats()
+    return stats
@@ -1,3 +1,35 @@
-from .item import ItemCreate, ItemUpdate, ItemResponse
+from .item import (
+    ItemBatchResult,
+    ItemBulkDelete,
+    ItemBulkDeleteResult,
+    ItemBulkError,
+    ItemBulkReprice,
+    ItemBulkResult,
+    ItemBulkUpdate,
+    ItemBulkUpdateResult,
+    ItemCreate,
+    ItemImportError,
+    ItemImportSummary,
+    ItemPriceHistogramBin,
+    ItemResponse,
+    ItemStatsResponse,
+    ItemUpdate,
+)
 
-__all__ = ["ItemCreate", "ItemUpdate", "ItemResponse"]
+__all__ = [
+    "ItemCreate",
+    "ItemUpdate",
+    "ItemResponse",
+    "ItemBatchResult",
+    "ItemBulkError",
+    "ItemBulkResult",
+    "ItemBulkUpdate",
+    "ItemBulkReprice",
+    "ItemBulkUpdateResult",
+    "ItemBulkDelete",
+    "ItemBulkDeleteResult",
+    "ItemImportError",
+    "ItemImportSummary",
+    "ItemPriceHistogramBin",
+    "ItemStatsResponse",
+]
@@ -4,8 +4,17 @@ Ce module contient les schémas utilisés pour valider les données
 des requêtes et réponses de l'API concernant les articles.
 """
 
+from typing import Any, Self
+
+from pydantic import model_validator
 from sqlmodel import SQLModel, Field
 
+# Prix maximal d'un article : borne aussi l'indice de tranche de
+# l'histogramme des prix (colonne INTEGER) et exclut inf et NaN
+MAX_PRIX = 1e9
+# Coefficient maximal d'un ajustement de prix en masse
+MAX_REPRICE_FACTOR = 100
+
 
 class ItemBase(SQLModel):
     """Schéma de base contenant les champs communs d'un article.
@@ -15,11 +24,11 @@ class ItemBase(SQLModel):
 
     Attributes:
         nom: Nom de l'article (1-255 caractères).
-        prix: Prix de l'article (doit être strictement positif).
+        prix: Prix de l'article (strictement positif, au plus MAX_PRIX).
     """
 
     nom: str = Field(min_length=1, max_length=255)
-    prix: float = Field(gt=0)
+    prix: float = Field(gt=0, le=MAX_PRIX)
 
 
 class ItemCreate(ItemBase):
@@ -43,7 +52,7 @@ class ItemUpdate(SQLModel):
 
     Attributes:
         nom: Nouveau nom de l'article (optionnel, 1-255 caractères si fourni).
-        prix: Nouveau prix de l'article (optionnel, doit être positif si fourni).
+        prix: Nouveau prix de l'article (optionnel, entre 0 exclu et MAX_PRIX).
 
     Example:
         >>> # Mise à jour uniquement du prix
@@ -51,7 +60,7 @@ class ItemUpdate(SQLModel):
     """
 
     nom: str | None = Field(None, min_length=1, max_length=255)
-    prix: float | None = Field(None, gt=0)
+    prix: float | None = Field(None, gt=0, le=MAX_PRIX)
 
 
 class ItemResponse(ItemBase):
@@ -70,3 +79,222 @@ class ItemResponse(ItemBase):
     """
 
     id: int
+
+
+class ItemBatchResult(SQLModel):
+    """Schéma de réponse d'une lecture groupée (GET /items/batch).
+
+    Attributes:
+        items: Articles trouvés, dans l'ordre des IDs demandés.
+        missing: IDs demandés qui n'existent pas.
+
+    Example:
+        >>> result = ItemBatchResult(items=[], missing=[42])
+    """
+
+    items: list[ItemResponse]
+    missing: list[int]
+
+
+class ItemBulkError(SQLModel):
+    """Erreur de validation d'une ligne d'une création en masse.
+
+    Attributes:
+        index: Position de la ligne rejetée dans la liste envoyée (à partir de 0).
+        errors: Détail des erreurs de validation Pydantic pour cette ligne.
+    """
+
+    index: int
+    errors: list[dict[str, Any]]
+
+
+class ItemBulkResult(SQLModel):
+    """Schéma de réponse d'une création en masse (POST /items/bulk).
+
+    Les lignes valides sont insérées, les lignes invalides sont signalées
+    sans faire échouer toute la requête.
+
+    Attributes:
+        ids: Identifiants des articles créés, dans l'ordre des lignes valides.
+        errors: Lignes rejetées avec leurs erreurs de validation.
+
+    Example:
+        >>> result = ItemBulkResult(ids=[1, 2], errors=[])
+    """
+
+    ids: list[int]
+    errors: list[ItemBulkError]
+
+
+class ItemBulkUpdate(ItemUpdate):
+    """Modification d'un article dans une mise à jour en masse.
+
+    Attributes:
+        id: Identifiant de l'article à modifier.
+        nom: Nouveau nom (optionnel, hérité de ItemUpdate).
+        prix: Nouveau prix (optionnel, hérité de ItemUpdate).
+
+    Example:
+        >>> ItemBulkUpdate(id=12, prix=19.99)
+    """
+
+    id: int
+
+
+class ItemBulkReprice(SQLModel):
+    """Ajustement de prix appliqué à tous les articles d'une fourchette.
+
+    Au moins une borne est requise, pour qu'un oubli ne modifie pas
+    tout le catalogue.
+
+    Attributes:
+        factor: Coefficient appliqué aux prix (1.05 = hausse de 5 %),
+            au plus MAX_REPRICE_FACTOR.
+        min_prix: Prix minimum des articles visés (inclus).
+        max_prix: Prix maximum des articles visés (inclus).
+
+    Example:
+        >>> ItemBulkReprice(factor=1.05, max_prix=20)
+    """
+
+    factor: float = Field(gt=0, le=MAX_REPRICE_FACTOR)
+    min_prix: float | None = Field(None, ge=0)
+    max_prix: float | None = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def check_bounds(self) -> Self:
+        if self.min_prix is None and self.max_prix is None:
+            raise ValueError("min_prix or max_prix is required")
+        return self
+
+
+class ItemBulkUpdateResult(SQLModel):
+    """Schéma de réponse d'une mise à jour en masse (PATCH /items/bulk).
+
+    Attributes:
+        updated: Nombre d'articles modifiés.
+        not_found: Identifiants demandés qui n'existent pas (forme par liste).
+
+    Example:
+        >>> result = ItemBulkUpdateResult(updated=2, not_found=[])
+    """
+
+    updated: int
+    not_found: list[int] = []
+
+
+class ItemBulkDelete(SQLModel):
+    """Critères d'une suppression en masse (DELETE /items/bulk).
+
+    Les critères fournis se cumulent ; au moins un est requis, pour qu'un
+    corps vide ne vide pas le catalogue.
+
+    Attributes:
+        ids: Identifiants des articles à supprimer.
+        min_prix: Prix minimum des articles à supprimer (inclus).
+        max_prix: Prix maximum des articles à supprimer (inclus).
+        nom_prefix: Début du nom des articles à supprimer (sans tenir
+            compte de la casse).
+
+    Example:
+        >>> ItemBulkDelete(nom_prefix="Promo ", max_prix=5)
+    """
+
+    ids: list[int] | None = None
+    min_prix: float | None = Field(None, ge=0)
+    max_prix: float | None = Field(None, ge=0)
+    nom_prefix: str | None = Field(None, min_length=1, max_length=255)
+
+    @model_validator(mode="after")
+    def check_criteria(self) -> Self:
+        criteria = (self.ids, self.min_prix, self.max_prix, self.nom_prefix)
+        if all(criterion is None for criterion in criteria):
+            raise ValueError(
+                "ids or a filter (min_prix, max_prix, nom_prefix) is required"
+            )
+        return self
+
+
+class ItemBulkDeleteResult(SQLModel):
+    """Schéma de réponse d'une suppression en masse (DELETE /items/bulk).
+
+    Attributes:
+        deleted: Nombre d'articles supprimés.
+    """
+
+    deleted: int
+
+
+class ItemImportError(SQLModel):
+    """Ligne rejetée lors d'un import en flux.
+
+    Attributes:
+        line: Numéro de ligne dans le fichier importé (à partir de 1).
+        errors: Détail des erreurs de décodage ou de validation.
+    """
+
+    line: int
+    errors: list[dict[str, Any]]
+
+
+class ItemImportSummary(SQLModel):
+    """Bilan d'un import en flux (POST /items/import).
+
+    Attributes:
+        accepted: Nombre de lignes insérées.
+        rejected: Nombre de lignes rejetées.
+        errors: Détail des premières lignes rejetées (liste tronquée).
+        elapsed_seconds: Durée totale de l'import.
+
+    Example:
+        >>> summary = ItemImportSummary(
+        ...     accepted=10, rejected=0, errors=[], elapsed_seconds=0.2
+        ... )
+    """
+
+    accepted: int
+    rejected: int
+    errors: list[ItemImportError]
+    elapsed_seconds: float
+
+
+class ItemPriceHistogramBin(SQLModel):
+    """Tranche de l'histogramme des prix.
+
+    Attributes:
+        lower: Borne inférieure de la tranche (incluse).
+        upper: Borne supérieure de la tranche (exclue).
+        count: Nombre d'articles dont le prix tombe dans la tranche.
+    """
+
+    lower: float
+    upper: float
+    count: int
+
+
+class ItemStatsResponse(SQLModel):
+    """Statistiques du catalogue (GET /items/stats).
+
+    Attributes:
+        count: Nombre d'articles.
+        min_prix: Prix minimum, ou None si le catalogue est vide.
+        max_prix: Prix maximum, ou None si le catalogue est vide.
+        avg_prix: Prix moyen, ou None si le catalogue est vide.
+        sum_prix: Somme des prix.
+        bucket_width: Largeur des tranches de l'histogramme.
+        histogram: Tranches non vides, par prix croissant.
+
+    Example:
+        >>> stats = ItemStatsResponse(
+        ...     count=0, min_prix=None, max_prix=None, avg_prix=None,
+        ...     sum_prix=0.0, bucket_width=10.0, histogram=[]
+        ... )
+    """
+
+    count: int
+    min_prix: float | None
+    max_prix: float | None
+    avg_prix: float | None
+    sum_prix: float
+    bucket_width: float
+    histogram: list[ItemPriceHistogramBin]
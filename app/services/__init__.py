@@ -1,3 +1,12 @@
-from .item_service import ItemService
+from .item_service import ItemService, VersionConflictError
 
-__all__ = ["ItemService"]
+__all__ = ["ItemService", "AsyncItemService", "VersionConflictError"]
+
+
+def __getattr__(name: str):
+    # Le service asynchrone n'est importé qu'à la demande (DATABASE_ASYNC)
+    if name == "AsyncItemService":
+        from .async_item_service import AsyncItemService
+
+        return AsyncItemService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,307 @@
+"""Version asynchrone du service de gestion des articles.
+
+Ce module reprend les opérations CRUD de ItemService avec une
+AsyncSession : la requête n'occupe plus un thread du pool de Starlette
+pendant qu'elle attend la base de données.
+"""
+
+from typing import Any
+
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.item import Item
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.services.item_service import (
+    ESTIMATED_COUNT_STATEMENT,
+    CountMode,
+    ItemService,
+    SortKey,
+    VersionConflictError,
+    count_cache_key,
+    count_statement,
+    delete_statement,
+    insert_statement,
+    item_cache_key,
+    item_from_row,
+    list_statement,
+    update_statement,
+)
+from app.services.singleflight import AsyncSingleFlight
+from app.services.stats import apply_stats_delta_async
+
+
+class AsyncItemService:
+    """Service asynchrone gérant les opérations métier sur les articles.
+
+    Les méthodes ont la même sémantique que celles de ItemService
+    et partagent la construction des requêtes ainsi que ItemService.cache.
+    Les lectures se font toujours sur le primaire : les routes asynchrones
+    de lecture ne sont montées que sans réplica (voir app.main).
+
+    Attributes:
+        flight: Regroupement des lectures concurrentes identiques de
+            get_by_id et get_all (équivalent de ItemService.flight).
+    """
+
+    flight: AsyncSingleFlight = AsyncSingleFlight()
+
+    @staticmethod
+    async def get_all(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        *,
+        min_prix: float | None = None,
+        max_prix: float | None = None,
+        sort: SortKey = "id",
+        after_value: Any = None,
+    ) -> list[Item]:
+        """Récupère une liste paginée d'articles, filtrée et triée en SQL.
+
+        Les appels concurrents avec les mêmes paramètres partagent une
+        seule requête (AsyncItemService.flight).
+
+        Args:
+            db: Session asynchrone active.
+            skip: Nombre d'articles à sauter. Ignoré lorsque after_id est fourni.
+            limit: Nombre maximum d'articles à retourner. Par défaut 100.
+            after_id: Identifiant du dernier article de la page précédente.
+            min_prix: Prix minimum (inclus).
+            max_prix: Prix maximum (inclus).
+            sort: Clé de tri, voir ItemService.get_all.
+            after_value: Valeur de la clé de tri du dernier article de la
+                page précédente (tri autre que par ID).
+
+        Returns:
+            Liste d'objets Item de la base de données.
+
+        Example:
+            >>> items = await AsyncItemService.get_all(db, limit=10)
+        """
+        statement = list_statement(
+            skip,
+            limit,
+            after_id,
+            min_prix=min_prix,
+            max_prix=max_prix,
+            sort=sort,
+            after_value=after_value,
+        )
+        key = repr(
+            ("list", skip, limit, after_id, min_prix, max_prix, sort, after_value)
+        )
+
+        async def load() -> list[Item]:
+            return list((await db.exec(statement)).all())
+
+        items, leader = await AsyncItemService.flight.do(key, load)
+        if leader:
+            return items
+        # Les objets du leader appartiennent à sa session : copies détachées
+        return [Item(**item.model_dump()) for item in items]
+
+    @staticmethod
+    async def count(
+        db: AsyncSession,
+        mode: CountMode = "exact",
+        *,
+        min_prix: float | None = None,
+        max_prix: float | None = None,
+    ) -> int:
+        """Compte les articles d'une liste, voir ItemService.count.
+
+        Args:
+            db: Session asynchrone active.
+            mode: ``exact`` ou ``estimate``.
+            min_prix: Prix minimum (inclus).
+            max_prix: Prix maximum (inclus).
+
+        Returns:
+            Nombre d'articles correspondant aux filtres.
+        """
+        if mode == "exact":
+            return (await db.exec(count_statement(min_prix, max_prix))).one()
+
+        unfiltered = min_prix is None and max_prix is None
+        if unfiltered and db.get_bind().dialect.name == "postgresql":
+            estimate = (await db.exec(ESTIMATED_COUNT_STATEMENT)).first()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        key = count_cache_key(min_prix, max_prix)
+        cached = ItemService.count_cache.get(key)
+        if cached is None:
+            cached = (await db.exec(count_statement(min_prix, max_prix))).one()
+            ItemService.count_cache.set(key, cached)
+        return cached
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, item_id: int) -> Item | None:
+        """Récupère un article par son identifiant, via ItemService.cache.
+
+        En cas d'absence, les appels concurrents pour le même article
+        partagent une seule requête (AsyncItemService.flight).
+
+        Args:
+            db: Session asynchrone active.
+            item_id: Identifiant unique de l'article à récupérer.
+
+        Returns:
+            L'objet Item correspondant, ou None si non trouvé.
+
+        Example:
+            >>> item = await AsyncItemService.get_by_id(db, 1)
+        """
+        key = item_cache_key(item_id)
+        cached = ItemService.cache.get(key)
+        if cached is not None:
+            return Item.model_validate(cached)
+
+        async def load() -> dict[str, Any] | None:
+            token = ItemService.cache.fill_token(key)
+            item = await db.get(Item, item_id)
+            if item is None:
+                return None
+            data = item.model_dump()
+            ItemService.cache.set(key, data, token)
+            return data
+
+        data, _ = await AsyncItemService.flight.do(key, load)
+        return Item.model_validate(data) if data is not None else None
+
+    @staticmethod
+    async def get_version(db: AsyncSession, item_id: int) -> int | None:
+        """Récupère uniquement le numéro de version d'un article.
+
+        Args:
+            db: Session asynchrone active.
+            item_id: Identifiant de l'article.
+
+        Returns:
+            La version de l'article, ou None s'il n'existe pas.
+        """
+        cached = ItemService.cache.get(item_cache_key(item_id))
+        if cached is not None:
+            return cached["version"]
+        result = await db.exec(select(Item.version).where(Item.id == item_id))
+        return result.first()
+
+    @staticmethod
+    async def create(db: AsyncSession, item_data: ItemCreate) -> Item:
+        """Crée un nouvel article dans la base de données.
+
+        Args:
+            db: Session asynchrone active.
+            item_data: Données validées pour créer l'article (schéma ItemCreate).
+
+        Returns:
+            L'objet Item nouvellement créé avec son ID généré.
+
+        Example:
+            >>> new_item = ItemCreate(nom="Écran", prix=299.99)
+            >>> created = await AsyncItemService.create(db, new_item)
+        """
+        result = await db.exec(insert_statement(item_data))
+        item = item_from_row(result.one())
+        await apply_stats_delta_async(db, added=[item.prix])
+        await db.commit()
+        return item
+
+    @staticmethod
+    async def update(
+        db: AsyncSession,
+        item_id: int,
+        item_data: ItemUpdate,
+        expected_version: int | None = None,
+    ) -> Item | None:
+        """Met à jour partiellement un article existant.
+
+        Args:
+            db: Session asynchrone active.
+            item_id: Identifiant de l'article à mettre à jour.
+            item_data: Données de mise à jour (schéma ItemUpdate).
+            expected_version: Version attendue (en-tête If-Match), ou None.
+
+        Returns:
+            L'objet Item mis à jour, ou None si l'article n'existe pas.
+
+        Raises:
+            VersionConflictError: Si la version diffère de expected_version.
+
+        Example:
+            >>> update_data = ItemUpdate(prix=249.99)
+            >>> updated = await AsyncItemService.update(db, 1, update_data)
+        """
+        values = item_data.model_dump(exclude_unset=True)
+        returning_old_prix = (
+            "prix" in values and db.get_bind().dialect.name == "postgresql"
+        )
+        previous_prix = None
+        if "prix" in values and not returning_old_prix:
+            previous_prix = (
+                await db.exec(select(Item.prix).where(col(Item.id) == item_id))
+            ).first()
+
+        statement = update_statement(
+            item_id, values, expected_version, returning_old_prix=returning_old_prix
+        )
+        row = (await db.exec(statement)).first()
+        if row is None:
+            await db.rollback()
+            if expected_version is not None and await AsyncItemService._exists(
+                db, item_id
+            ):
+                raise VersionConflictError(item_id)
+            return None
+
+        item = item_from_row(row)
+        if returning_old_prix:
+            previous_prix = row.old_prix
+        if previous_prix is not None and item.prix != previous_prix:
+            await apply_stats_delta_async(
+                db, added=[item.prix], removed=[previous_prix]
+            )
+        await db.commit()
+        ItemService.cache.delete(item_cache_key(item_id))
+        return item
+
+    @staticmethod
+    async def delete(
+        db: AsyncSession, item_id: int, expected_version: int | None = None
+    ) -> bool:
+        """Supprime un article de la base de données.
+
+        Args:
+            db: Session asynchrone active.
+            item_id: Identifiant de l'article à supprimer.
+            expected_version: Version attendue (en-tête If-Match), ou None.
+
+        Returns:
+            True si l'article a été supprimé, False s'il n'existait pas.
+
+        Raises:
+            VersionConflictError: Si la version diffère de expected_version.
+
+        Example:
+            >>> success = await AsyncItemService.delete(db, 1)
+        """
+        result = await db.exec(delete_statement(item_id, expected_version))
+        prix = result.scalar()
+        if prix is None:
+            await db.rollback()
+            if expected_version is not None and await AsyncItemService._exists(
+                db, item_id
+            ):
+                raise VersionConflictError(item_id)
+            return False
+
+        await apply_stats_delta_async(db, removed=[prix])
+        await db.commit()
+        ItemService.cache.delete(item_cache_key(item_id))
+        return True
+
+    @staticmethod
+    async def _exists(db: AsyncSession, item_id: int) -> bool:
+        result = await db.exec(select(Item.id).where(Item.id == item_id))
+        return result.first() is not None
@@ -0,0 +1,176 @@
+"""Cache de lecture pour les services.
+
+Ce module définit l'interface CacheBackend et son implémentation par
+défaut, un cache LRU borné en mémoire avec expiration (TTL). Un backend
+partagé entre workers (Redis, memcached, ...) peut être branché en
+implémentant la même interface.
+
+Le cache LRU vit dans le processus : une écriture n'invalide que le cache
+du worker qui l'a servie. Avec plusieurs workers, les autres continuent
+de servir l'ancienne valeur jusqu'à l'expiration du TTL ; seul un backend
+partagé supprime ce retard.
+
+Remplir le cache après une lecture en base est sujet à une course : une
+écriture concurrente peut valider puis invalider la clé entre la lecture
+et le remplissage, qui réinsérerait alors la valeur périmée. L'appelant
+prend donc un jeton (fill_token) avant la lecture et le repasse à set :
+le remplissage est ignoré si la clé a été invalidée entre-temps.
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+ITEM_CACHE_SIZE = int(os.getenv("ITEM_CACHE_SIZE", "10000"))
+ITEM_CACHE_TTL = float(os.getenv("ITEM_CACHE_TTL", "60"))
+
+
+class CacheBackend(ABC):
+    """Interface commune des backends de cache.
+
+    Les clés sont des chaînes et les valeurs des objets sérialisables
+    (dictionnaires de colonnes), afin qu'un backend partagé puisse les stocker.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Retourne la valeur associée à key, ou None si absente ou expirée."""
+
+    @abstractmethod
+    def fill_token(self, key: str) -> int:
+        """Retourne un jeton à prendre avant de lire la valeur de key en base."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, token: int | None = None) -> None:
+        """Associe value à key.
+
+        Args:
+            key: Clé de l'entrée.
+            value: Valeur à conserver.
+            token: Jeton de fill_token ; set est ignoré si key a été
+                invalidée depuis qu'il a été pris.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Invalide key si elle est présente."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """Retourne les compteurs du cache (hits, misses, evictions, ...)."""
+
+
+class LRUCache(CacheBackend):
+    """Cache LRU borné en mémoire, avec expiration par entrée.
+
+    Les entrées les moins récemment lues sont évincées lorsque la taille
+    maximale est atteinte ; une entrée expirée est traitée comme absente.
+    Une taille maximale de 0 désactive le cache.
+
+    Chaque invalidation (delete, clear) incrémente une génération globale ;
+    delete laisse une pierre tombale portant cette génération, et les clés
+    sans pierre tombale ont une génération plancher, relevée lorsque les
+    pierres tombales les plus anciennes sont évincées (au plus maxsize).
+    Un jeton est la génération courante : le remplissage est refusé si la
+    génération de la clé lui est postérieure.
+
+    Attributes:
+        maxsize: Nombre maximal d'entrées conservées.
+        ttl: Durée de vie d'une entrée en secondes.
+
+    Example:
+        >>> cache = LRUCache(maxsize=2, ttl=30)
+        >>> cache.set("item:1", {"id": 1})
+        >>> cache.get("item:1")
+        {'id': 1}
+        >>> token = cache.fill_token("item:1")
+        >>> cache.delete("item:1")
+        >>> cache.set("item:1", {"id": 1}, token)
+        >>> cache.get("item:1") is None
+        True
+    """
+
+    def __init__(self, maxsize: int = ITEM_CACHE_SIZE, ttl: float = ITEM_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._tombstones: OrderedDict[str, int] = OrderedDict()
+        self._floor = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_fills = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def fill_token(self, key: str) -> int:
+        with self._lock:
+            return self._generation
+
+    def set(self, key: str, value: Any, token: int | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if token is not None and self._tombstones.get(key, self._floor) > token:
+                self.stale_fills += 1
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+            self._tombstones[key] = self._generation
+            self._tombstones.move_to_end(key)
+            while len(self._tombstones) > max(self.maxsize, 1):
+                _, generation = self._tombstones.popitem(last=False)
+                self._floor = max(self._floor, generation)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._tombstones.clear()
+            self._floor = self._generation
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": type(self).__name__,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "stale_fills": self.stale_fills,
+            }
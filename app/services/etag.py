@@ -0,0 +1,103 @@
+"""Calcul et comparaison des ETag des articles.
+
+L'ETag d'un article est dérivé de son identifiant et de son numéro de
+version (colonne ``version``, incrémentée à chaque mise à jour) : il se
+calcule sans sérialiser l'article et sert aussi bien aux GET
+conditionnels (If-None-Match) qu'aux écritures conditionnelles (If-Match).
+"""
+
+import hashlib
+from collections.abc import Iterable
+
+from app.models.item import Item
+
+
+def item_etag(item_id: int, version: int) -> str:
+    """Construit l'ETag d'un article.
+
+    Args:
+        item_id: Identifiant de l'article.
+        version: Numéro de version de l'article.
+
+    Returns:
+        ETag fort, guillemets compris.
+
+    Example:
+        >>> item_etag(12, 3)
+        '"12-3"'
+    """
+    return f'"{item_id}-{version}"'
+
+
+def list_etag(items: Iterable[Item]) -> str:
+    """Construit l'ETag d'une page d'articles.
+
+    Seuls les couples (id, version) entrent dans l'empreinte : la page
+    change d'ETag dès qu'un article y apparaît, disparaît ou est modifié.
+
+    Args:
+        items: Articles de la page, dans l'ordre de la réponse.
+
+    Returns:
+        ETag faible, guillemets compris.
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    for item in items:
+        digest.update(f"{item.id}-{item.version};".encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _parse_etags(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """Indique si un en-tête If-None-Match correspond à un ETag.
+
+    La comparaison est faible (le préfixe ``W/`` est ignoré), comme le
+    prévoit la RFC 9110 pour If-None-Match.
+
+    Args:
+        header: Valeur de l'en-tête If-None-Match, ou None.
+        etag: ETag courant de la ressource.
+
+    Returns:
+        True si l'en-tête vaut ``*`` ou contient l'ETag.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in _parse_etags(header))
+
+
+def if_match_version(header: str, item_id: int) -> int | None:
+    """Extrait la version attendue d'un en-tête If-Match.
+
+    La comparaison est forte, comme le prévoit la RFC 9110 pour If-Match :
+    un ETag faible (préfixe ``W/``) ne désigne jamais l'article.
+
+    Args:
+        header: Valeur de l'en-tête If-Match.
+        item_id: Identifiant de l'article ciblé par la requête.
+
+    Returns:
+        La version attendue, ou None si l'en-tête vaut ``*``.
+
+    Raises:
+        ValueError: Si aucun ETag de l'en-tête ne désigne cet article.
+
+    Example:
+        >>> if_match_version('"12-3"', 12)
+        3
+    """
+    if header.strip() == "*":
+        return None
+    prefix = f'"{item_id}-'
+    for tag in _parse_etags(header):
+        if tag.startswith(prefix) and tag.endswith('"'):
+            version = tag[len(prefix) : -1]
+            if version.isdigit():
+                return int(version)
+    raise ValueError("If-Match does not designate this item")
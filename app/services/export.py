@@ -0,0 +1,53 @@
+"""Sérialisation en flux des exports d'articles.
+
+Ce module transforme les lots de lignes produits par
+ItemService.iter_rows en fragments NDJSON ou CSV, émis au fur et à
+mesure : le premier octet part dès le premier lot lu.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+EXPORT_COLUMNS = ("id", "nom", "prix")
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def ndjson_chunks(batches: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """Encode des lots de lignes en NDJSON (un objet JSON par ligne).
+
+    Args:
+        batches: Lots de lignes (id, nom, prix).
+
+    Yields:
+        Un fragment de texte par lot.
+    """
+    for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n"
+            for row in rows
+        )
+
+
+def csv_chunks(batches: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """Encode des lots de lignes en CSV, ligne d'en-tête comprise.
+
+    Args:
+        batches: Lots de lignes (id, nom, prix).
+
+    Yields:
+        L'en-tête, puis un fragment de texte par lot.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,148 @@
+"""Import en flux d'articles depuis un corps de requête NDJSON ou CSV.
+
+Le corps est décodé et découpé en lignes au fil de l'eau : seules la
+ligne en cours et le lot en attente d'insertion sont en mémoire, quelle
+que soit la taille du fichier. Chaque ligne est validée avec ItemCreate,
+les lignes valides sont insérées par lots (COPY sur PostgreSQL).
+
+Le CSV attendu a une ligne d'en-tête (``nom,prix``) et une ligne par
+article ; les champs contenant un retour à la ligne ne sont pas pris en charge.
+"""
+
+import codecs
+import csv
+import json
+import os
+import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Mapping,
+    Sequence,
+)
+from typing import Any, Literal
+
+from pydantic import ValidationError
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.schemas.item import ItemCreate, ItemImportError, ItemImportSummary
+from app.services.item_service import ItemService
+
+IMPORT_BATCH_SIZE = int(os.getenv("ITEMS_IMPORT_BATCH_SIZE", "5000"))
+# Nombre maximal de lignes rejetées détaillées dans le bilan
+IMPORT_MAX_REPORTED_ERRORS = int(os.getenv("ITEMS_IMPORT_MAX_REPORTED_ERRORS", "1000"))
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Découpe un flux d'octets UTF-8 en lignes de texte.
+
+    Args:
+        chunks: Fragments d'octets, tels que renvoyés par request.stream().
+
+    Yields:
+        Chaque ligne, sans son caractère de fin de ligne.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _decode_error(message: str) -> list[dict[str, Any]]:
+    return [{"type": "decode_error", "loc": [], "msg": message}]
+
+
+def _insert_batch(
+    session_factory: Callable[[], Session], batch: list[ItemCreate]
+) -> int:
+    # Session ouverte et fermée dans le thread qui l'utilise
+    with session_factory() as db:
+        return ItemService.copy_many(db, batch)
+
+
+async def import_stream(
+    session_factory: Callable[[], Session],
+    chunks: AsyncIterable[bytes],
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ItemImportSummary:
+    """Importe des articles depuis un flux NDJSON ou CSV.
+
+    Les insertions sont exécutées dans le pool de threads pour ne pas
+    bloquer la boucle d'événements pendant la lecture du flux. Chaque lot
+    peut s'exécuter dans un thread différent : il ouvre donc sa propre
+    session, une Session ne devant pas être partagée entre threads.
+
+    Args:
+        session_factory: Fabrique de sessions (voir get_session_factory).
+        chunks: Fragments d'octets du fichier à importer.
+        format: Format du flux, ``ndjson`` ou ``csv``.
+        batch_size: Nombre de lignes valides insérées par transaction.
+
+    Returns:
+        Bilan de l'import : lignes acceptées, rejetées et durée.
+
+    Example:
+        >>> summary = await import_stream(
+        ...     partial(Session, engine), request.stream(), "csv"
+        ... )
+        >>> summary.accepted
+    """
+    started = time.perf_counter()
+    accepted = 0
+    rejected = 0
+    errors: list[ItemImportError] = []
+    batch: list[ItemCreate] = []
+    header: list[str] | None = None
+
+    def reject(line_number: int, details: Sequence[Mapping[str, Any]]) -> None:
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < IMPORT_MAX_REPORTED_ERRORS:
+            errors.append(ItemImportError(line=line_number, errors=details))
+
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if format == "csv":
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            row: Any = dict(zip(header, values))
+        else:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                reject(line_number, _decode_error(str(exc)))
+                continue
+
+        try:
+            batch.append(ItemCreate.model_validate(row))
+        except ValidationError as exc:
+            reject(line_number, exc.errors(include_url=False, include_context=False))
+            continue
+
+        if len(batch) >= batch_size:
+            accepted += await run_in_threadpool(_insert_batch, session_factory, batch)
+            batch = []
+
+    if batch:
+        accepted += await run_in_threadpool(_insert_batch, session_factory, batch)
+    return ItemImportSummary(
+        accepted=accepted,
+        rejected=rejected,
+        errors=errors,
+        elapsed_seconds=round(time.perf_counter() - started, 6),
+    )
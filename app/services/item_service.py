@@ -4,9 +4,389 @@ Ce module contient la couche service qui encapsule toutes les
 opérations CRUD (Create, Read, Update, Delete) sur les articles.
 """
 
-from sqlmodel import Session, select
-from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemUpdate
+import csv
+import io
+import os
+from collections.abc import Iterator, Sequence
+from typing import Any, Literal
+
+from sqlalchemy import (
+    Delete,
+    Float,
+    Insert,
+    Integer,
+    Row,
+    String,
+    Update,
+    any_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    table,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped
+from sqlalchemy.sql.dml import ReturningDelete
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
+from app.models.item import Item, items_fts, items_table
+from app.replicas import is_replica_session
+from app.schemas.item import (
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemStatsResponse,
+    ItemUpdate,
+    MAX_PRIX,
+)
+from app.services.cache import CacheBackend, LRUCache
+from app.services.singleflight import SingleFlight
+from app.services.stats import (
+    STATS_BUCKET_WIDTH,
+    apply_stats_delta,
+    stats_buckets_statement,
+    stats_response,
+    stats_totals_statement,
+)
+
+BULK_BATCH_SIZE = int(os.getenv("ITEMS_BULK_BATCH_SIZE", "500"))
+EXPORT_BATCH_SIZE = int(os.getenv("ITEMS_EXPORT_BATCH_SIZE", "1000"))
+# Nombre maximal d'IDs acceptés par GET /items/batch
+BATCH_MAX_IDS = int(os.getenv("ITEMS_BATCH_MAX_IDS", "100"))
+SearchMode = Literal["prefix", "contains", "fuzzy"]
+SortKey = Literal["id", "-id", "prix", "-prix", "nom", "-nom"]
+CountMode = Literal["exact", "estimate"]
+# Durée pendant laquelle un décompte du mode estimate est réutilisé
+COUNT_CACHE_TTL = float(os.getenv("ITEMS_COUNT_CACHE_TTL", "5"))
+
+SORT_COLUMNS = {"id": col(Item.id), "prix": col(Item.prix), "nom": col(Item.nom)}
+
+
+def price_filters(min_prix: float | None, max_prix: float | None) -> list[Any]:
+    """Retourne les conditions WHERE d'une fourchette de prix (bornes incluses)."""
+    filters = []
+    if min_prix is not None:
+        filters.append(Item.prix >= min_prix)
+    if max_prix is not None:
+        filters.append(Item.prix <= max_prix)
+    return filters
+
+
+def list_statement(
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+    *,
+    min_prix: float | None = None,
+    max_prix: float | None = None,
+    sort: SortKey = "id",
+    after_value: Any = None,
+) -> SelectOfScalar[Item]:
+    """Construit la requête de liste paginée partagée par les services.
+
+    Le tri se fait toujours sur la clé demandée suivie de l'identifiant,
+    dans le même sens : l'ordre est stable et la pagination par clé peut
+    reprendre avec une comparaison de tuples ``(prix, id) > (:prix, :id)``,
+    servie par les index composites ``(prix, id)`` et ``(nom, id)``.
+
+    Args:
+        skip: Nombre d'articles à sauter. Ignoré lorsque after_id est fourni.
+        limit: Nombre maximum d'articles à retourner.
+        after_id: Identifiant du dernier article de la page précédente.
+        min_prix: Prix minimum (inclus).
+        max_prix: Prix maximum (inclus).
+        sort: Clé de tri, préfixée par ``-`` pour un tri décroissant.
+        after_value: Valeur de la clé de tri du dernier article de la page
+            précédente (requise avec after_id si le tri n'est pas sur id).
+
+    Returns:
+        Requête SELECT filtrée et triée.
+    """
+    descending = sort.startswith("-")
+    key = SORT_COLUMNS[sort.lstrip("-")]
+    item_id = col(Item.id)
+    columns: list[Mapped[Any]] = [item_id] if key is item_id else [key, item_id]
+
+    statement = select(Item).where(*price_filters(min_prix, max_prix))
+    if descending:
+        statement = statement.order_by(*(column.desc() for column in columns))
+    else:
+        statement = statement.order_by(*columns)
+    statement = statement.limit(limit)
+
+    if after_id is None:
+        return statement.offset(skip)
+    if key is item_id:
+        return statement.where(item_id < after_id if descending else item_id > after_id)
+    position = tuple_(key, item_id)
+    bound = tuple_(literal(after_value), literal(after_id))
+    return statement.where(position < bound if descending else position > bound)
+
+
+def count_statement(
+    min_prix: float | None = None, max_prix: float | None = None
+) -> SelectOfScalar[int]:
+    """Construit la requête ``SELECT count(*)`` correspondant aux filtres de liste.
+
+    Args:
+        min_prix: Prix minimum (inclus).
+        max_prix: Prix maximum (inclus).
+
+    Returns:
+        Requête de décompte exact.
+    """
+    return (
+        select(func.count()).select_from(Item).where(*price_filters(min_prix, max_prix))
+    )
+
+
+# Nombre de lignes estimé par le planificateur PostgreSQL (mis à jour par
+# ANALYZE et l'autovacuum) : lecture d'une ligne du catalogue, sans parcours.
+ESTIMATED_COUNT_STATEMENT = (
+    select(column("reltuples", Float))
+    .select_from(table("pg_class"))
+    .where(column("oid") == func.to_regclass(Item.__tablename__))
+)
+
+
+def count_cache_key(min_prix: float | None, max_prix: float | None) -> str:
+    """Clé de cache du décompte d'une liste filtrée.
+
+    Returns:
+        Clé utilisée dans ItemService.count_cache.
+    """
+    return f"count:{min_prix}:{max_prix}"
+
+
+class VersionConflictError(Exception):
+    """Levée lorsqu'une écriture conditionnelle vise une version périmée."""
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def name_prefix_filter(prefix: str) -> Any:
+    """Retourne la condition « le nom commence par prefix », sans tenir
+    compte de la casse (servie par l'index ``lower(nom)`` sur PostgreSQL)."""
+    pattern = _like_escape(prefix.lower()) + "%"
+    return func.lower(Item.nom).like(pattern, escape="\\")
+
+
+def _fts_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def search_statement(
+    dialect: str, q: str, mode: SearchMode = "prefix", limit: int = 20
+) -> SelectOfScalar[Item]:
+    """Construit la requête de recherche par nom adaptée au dialecte.
+
+    Toutes les recherches ignorent la casse, sont classées et limitées en SQL :
+
+    - ``prefix`` : le nom commence par q, noms les plus courts en premier ;
+    - ``contains`` : le nom contient q ;
+    - ``fuzzy`` : le nom ressemble à q (similarité trigram).
+
+    Sur PostgreSQL, les requêtes s'appuient sur les index
+    ``lower(nom) text_pattern_ops`` et GIN ``pg_trgm`` ; sur SQLite, sur
+    la table FTS5 ``items_fts``, dont le tokenizer trigram n'indexe que
+    les termes d'au moins trois caractères.
+
+    Args:
+        dialect: Nom du dialecte SQLAlchemy (``postgresql``, ``sqlite``).
+        q: Texte recherché.
+        mode: Mode de correspondance.
+        limit: Nombre maximum de résultats.
+
+    Returns:
+        Requête SELECT des articles correspondants, les meilleurs en premier.
+    """
+    statement = select(Item)
+    pattern = _like_escape(q.lower())
+    if dialect == "postgresql":
+        if mode == "prefix":
+            statement = statement.where(name_prefix_filter(q)).order_by(
+                func.length(Item.nom), Item.nom
+            )
+        elif mode == "contains":
+            statement = statement.where(
+                col(Item.nom).ilike("%" + pattern + "%", escape="\\")
+            ).order_by(func.similarity(Item.nom, q).desc())
+        else:
+            # L'opérateur % (seuil pg_trgm.similarity_threshold) utilise l'index GIN
+            statement = statement.where(col(Item.nom).op("%")(q)).order_by(
+                func.similarity(Item.nom, q).desc()
+            )
+        return statement.order_by(col(Item.id)).limit(limit)
+
+    statement = statement.join(items_fts, items_fts.c.rowid == Item.id)
+    trigrams = {q.lower()[i : i + 3] for i in range(len(q) - 2)}
+    if mode == "fuzzy" and trigrams:
+        query = " OR ".join(_fts_phrase(trigram) for trigram in sorted(trigrams))
+        statement = statement.where(items_fts.c.nom.match(query))
+        statement = statement.order_by(items_fts.c.rank)
+    elif mode == "prefix":
+        statement = statement.where(items_fts.c.nom.like(pattern + "%", escape="\\"))
+        statement = statement.order_by(func.length(Item.nom), Item.nom)
+    elif trigrams:
+        statement = statement.where(items_fts.c.nom.match(_fts_phrase(q)))
+        statement = statement.order_by(items_fts.c.rank)
+    else:
+        # Terme trop court pour l'index trigram : simple LIKE
+        statement = statement.where(
+            items_fts.c.nom.like("%" + pattern + "%", escape="\\")
+        )
+        statement = statement.order_by(func.length(Item.nom))
+    return statement.order_by(col(Item.id)).limit(limit)
+
+
+# Colonnes renvoyées par les écritures (RETURNING) pour reconstruire l'article
+ITEM_COLUMNS = tuple(items_table.columns)
+
+
+def item_from_row(row: Row[Any]) -> Item:
+    """Construit un Item détaché à partir d'une ligne renvoyée par RETURNING.
+
+    L'objet n'est pas attaché à la session : le commit ne l'expire pas et
+    la lecture de ses attributs ne déclenche aucune requête. Les colonnes
+    renvoyées en plus de ITEM_COLUMNS (``old_prix``, ...) sont ignorées.
+    """
+    mapping = row._mapping
+    return Item(**{column.name: mapping[column] for column in ITEM_COLUMNS})
+
+
+def insert_statement(item_data: ItemCreate) -> Insert:
+    """Construit ``INSERT INTO items ... RETURNING *`` pour un article."""
+    return insert(Item).values(**item_data.model_dump()).returning(*ITEM_COLUMNS)
+
+
+def update_statement(
+    item_id: int,
+    values: dict[str, Any],
+    expected_version: int | None = None,
+    *,
+    returning_old_prix: bool = False,
+) -> Update:
+    """Construit ``UPDATE items ... WHERE id = :id RETURNING *``.
+
+    La version est incrémentée dans la même instruction ; avec
+    expected_version, la condition ``version = :expected`` rend l'écriture
+    conditionnelle sans lecture préalable.
+
+    Args:
+        item_id: Identifiant de l'article.
+        values: Colonnes à modifier.
+        expected_version: Version attendue, ou None.
+        returning_old_prix: Renvoie aussi le prix avant modification
+            (colonne ``old_prix``), lu par une CTE ``SELECT ... FOR UPDATE``
+            qui verrouille la ligne dans la même instruction. Syntaxe
+            PostgreSQL.
+
+    Returns:
+        Instruction UPDATE ne renvoyant aucune ligne si l'article n'existe
+        pas ou n'a plus la version attendue.
+    """
+    items = items_table
+    statement = (
+        update(items)
+        .values(**values, version=items.c.version + 1)
+        .returning(*ITEM_COLUMNS)
+    )
+    if returning_old_prix:
+        old = (
+            select(items.c.id, items.c.prix)
+            .where(items.c.id == item_id)
+            .with_for_update()
+            .cte("old")
+        )
+        statement = statement.where(items.c.id == old.c.id).returning(
+            old.c.prix.label("old_prix")
+        )
+    else:
+        statement = statement.where(items.c.id == item_id)
+    if expected_version is not None:
+        statement = statement.where(items.c.version == expected_version)
+    return statement
+
+
+def delete_statement(
+    item_id: int, expected_version: int | None = None
+) -> ReturningDelete[tuple[float]]:
+    """Construit ``DELETE FROM items WHERE id = :id RETURNING prix``.
+
+    Args:
+        item_id: Identifiant de l'article.
+        expected_version: Version attendue, ou None.
+
+    Returns:
+        Instruction DELETE renvoyant le prix de l'article supprimé, ou
+        aucune ligne si l'article n'existe pas ou n'a plus la version attendue.
+    """
+    items = items_table
+    statement = delete(items).where(items.c.id == item_id)
+    if expected_version is not None:
+        statement = statement.where(items.c.version == expected_version)
+    return statement.returning(col(Item.prix))
+
+
+def bulk_update_values_statement(rows: list[dict[str, Any]]) -> Update:
+    """Construit ``UPDATE items ... FROM (VALUES ...)`` pour un lot d'articles.
+
+    Une seule instruction modifie tout le lot ; un champ à NULL dans
+    VALUES laisse la colonne inchangée. Syntaxe PostgreSQL.
+
+    Args:
+        rows: Dictionnaires ``{"id", "nom", "prix"}``, None pour un champ
+            inchangé.
+
+    Returns:
+        Instruction UPDATE ensembliste.
+    """
+    items = items_table
+    data = values(
+        column("id", Integer), column("nom", String), column("prix", Float), name="v"
+    ).data([(row["id"], row["nom"], row["prix"]) for row in rows])
+    return (
+        update(items)
+        .where(items.c.id == data.c.id)
+        .values(
+            nom=func.coalesce(cast(data.c.nom, String), items.c.nom),
+            prix=func.coalesce(cast(data.c.prix, Float), items.c.prix),
+            version=items.c.version + 1,
+        )
+    )
+
+
+# Variante exécutée en executemany (une ligne de paramètres par article),
+# pour les bases sans UPDATE ... FROM (VALUES ...) nommé, comme SQLite.
+BULK_UPDATE_BY_ID_STATEMENT = (
+    update(items_table)
+    .where(items_table.c.id == bindparam("b_id"))
+    .values(
+        nom=func.coalesce(bindparam("b_nom", type_=String), items_table.c.nom),
+        prix=func.coalesce(bindparam("b_prix", type_=Float), items_table.c.prix),
+        version=items_table.c.version + 1,
+    )
+)
+
+
+def item_cache_key(item_id: int) -> str:
+    """Clé de cache d'un article.
+
+    Args:
+        item_id: Identifiant de l'article.
+
+    Returns:
+        Clé utilisée dans ItemService.cache.
+    """
+    return f"item:{item_id}"
 
 
 class ItemService:
@@ -15,15 +395,60 @@ class ItemService:
     Cette classe fournit des méthodes statiques pour effectuer
     toutes les opérations CRUD sur les articles, en séparant
     la logique métier des routes API.
+
+    Attributes:
+        cache: Cache de lecture de get_by_id (LRU en mémoire par défaut).
+            Propre à chaque worker : une écriture n'invalide pas le cache
+            des autres workers, qui servent l'ancienne valeur jusqu'au TTL.
+            Peut être remplacé par tout CacheBackend partagé.
+        count_cache: Décomptes récents du mode estimate, conservés
+            ITEMS_COUNT_CACHE_TTL secondes.
+        flight: Regroupement des lectures concurrentes identiques de
+            get_by_id et get_all.
     """
+
+    cache: CacheBackend = LRUCache()
+    count_cache: CacheBackend = LRUCache(maxsize=1024, ttl=COUNT_CACHE_TTL)
+    flight: SingleFlight = SingleFlight()
+
     @staticmethod
-    def get_all(db: Session, skip: int = 0, limit: int = 100) -> list[Item]:
-        """Récupère une liste paginée d'articles.
+    def get_all(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        *,
+        min_prix: float | None = None,
+        max_prix: float | None = None,
+        sort: SortKey = "id",
+        after_value: Any = None,
+    ) -> list[Item]:
+        """Récupère une liste paginée d'articles, filtrée et triée en SQL.
+
+        Les appels concurrents avec les mêmes paramètres partagent une
+        seule requête (ItemService.flight). Les lectures sur un réplica et
+        sur le primaire ne sont pas regroupées entre elles.
+
+        Deux modes de pagination sont disponibles :
+
+        - par offset (``skip``) : simple mais chaque page profonde oblige la
+          base à parcourir puis ignorer toutes les lignes sautées ;
+        - par clé (``after_id``) : ``WHERE id > :after_id ORDER BY id LIMIT :n``
+          s'appuie sur l'index de la clé primaire, chaque page coûte donc
+          le même prix quelle que soit sa profondeur.
 
         Args:
             db: Session de base de données active.
             skip: Nombre d'articles à sauter (pour pagination). Par défaut 0.
+                Ignoré lorsque after_id est fourni.
             limit: Nombre maximum d'articles à retourner. Par défaut 100.
+            after_id: Identifiant du dernier article de la page précédente.
+            min_prix: Prix minimum (inclus).
+            max_prix: Prix maximum (inclus).
+            sort: Clé de tri (``id``, ``prix``, ``nom``, préfixée par ``-``
+                pour un tri décroissant). Par défaut ``id``.
+            after_value: Valeur de la clé de tri du dernier article de la
+                page précédente, lorsque le tri n'est pas sur id.
 
         Returns:
             Liste d'objets Item de la base de données.
@@ -31,14 +456,151 @@ class ItemService:
         Example:
             >>> items = ItemService.get_all(db, skip=0, limit=10)
             >>> len(items)  # Maximum 10 articles
+            >>> suite = ItemService.get_all(db, after_id=items[-1].id, limit=10)
+            >>> moins_chers = ItemService.get_all(db, max_prix=20, sort="prix")
+        """
+        statement = list_statement(
+            skip,
+            limit,
+            after_id,
+            min_prix=min_prix,
+            max_prix=max_prix,
+            sort=sort,
+            after_value=after_value,
+        )
+        key = repr(
+            (
+                "list",
+                is_replica_session(db),
+                skip,
+                limit,
+                after_id,
+                min_prix,
+                max_prix,
+                sort,
+                after_value,
+            )
+        )
+        items, leader = ItemService.flight.do(
+            key, lambda: list(db.exec(statement).all())
+        )
+        if leader:
+            return items
+        # Les objets du leader appartiennent à sa session : copies détachées
+        return [Item(**item.model_dump()) for item in items]
+
+    @staticmethod
+    def count(
+        db: Session,
+        mode: CountMode = "exact",
+        *,
+        min_prix: float | None = None,
+        max_prix: float | None = None,
+    ) -> int:
+        """Compte les articles d'une liste, exactement ou approximativement.
+
+        En mode ``exact``, un ``SELECT count(*)`` est exécuté à chaque appel.
+        En mode ``estimate``, une liste sans filtre est décomptée d'après les
+        statistiques du planificateur PostgreSQL (``pg_class.reltuples``) ;
+        sinon (filtres, autre base, table jamais analysée) le décompte exact
+        est mis en cache pendant ITEMS_COUNT_CACHE_TTL secondes.
+
+        Args:
+            db: Session de base de données active.
+            mode: ``exact`` ou ``estimate``.
+            min_prix: Prix minimum (inclus).
+            max_prix: Prix maximum (inclus).
+
+        Returns:
+            Nombre d'articles correspondant aux filtres.
+
+        Example:
+            >>> ItemService.count(db, "estimate")
+            1250000
+        """
+        if mode == "exact":
+            return db.exec(count_statement(min_prix, max_prix)).one()
+
+        unfiltered = min_prix is None and max_prix is None
+        if unfiltered and db.get_bind().dialect.name == "postgresql":
+            estimate = db.exec(ESTIMATED_COUNT_STATEMENT).first()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        key = count_cache_key(min_prix, max_prix)
+        cached = ItemService.count_cache.get(key)
+        if cached is None:
+            cached = db.exec(count_statement(min_prix, max_prix)).one()
+            ItemService.count_cache.set(key, cached)
+        return cached
+
+    @staticmethod
+    def iter_rows(
+        db: Session, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Sequence[tuple[int | None, str, float]]]:
+        """Parcourt tous les articles par lots, via un curseur côté serveur.
+
+        Les lignes sont lues en colonnes brutes (sans objets ORM ni carte
+        d'identité) avec ``stream_results`` : sur PostgreSQL, un curseur
+        nommé ne transfère que ``batch_size`` lignes à la fois, la mémoire
+        reste donc constante quelle que soit la taille de la table.
+
+        Args:
+            db: Session de base de données active.
+            batch_size: Nombre de lignes lues par aller-retour.
+
+        Yields:
+            Lots de lignes (id, nom, prix), triés par identifiant.
+
+        Example:
+            >>> for rows in ItemService.iter_rows(db, batch_size=500):
+            ...     print(len(rows))
+        """
+        statement = (
+            select(col(Item.id), Item.nom, Item.prix)
+            .order_by(col(Item.id))
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        yield from db.exec(statement).partitions()
+
+    @staticmethod
+    def search(
+        db: Session, q: str, mode: SearchMode = "prefix", limit: int = 20
+    ) -> list[Item]:
+        """Recherche des articles par nom.
+
+        Args:
+            db: Session de base de données active.
+            q: Texte recherché (insensible à la casse).
+            mode: ``prefix``, ``contains`` ou ``fuzzy`` (similarité trigram).
+            limit: Nombre maximum de résultats. Par défaut 20.
+
+        Returns:
+            Articles correspondants, les plus pertinents en premier.
+
+        Example:
+            >>> ItemService.search(db, "clav", mode="prefix")
+            [Item(id=3, nom='Clavier', prix=49.99, version=1)]
         """
-        statement = select(Item).offset(skip).limit(limit)
-        return list(db.exec(statement).all())
+        dialect = db.get_bind().dialect.name
+        return list(db.exec(search_statement(dialect, q, mode, limit)).all())
 
     @staticmethod
     def get_by_id(db: Session, item_id: int) -> Item | None:
         """Récupère un article par son identifiant.
 
+        La lecture passe par ItemService.cache : en cas de succès, aucune
+        requête n'est envoyée à la base. Les entrées sont invalidées par
+        update et delete après leur commit, et expirent au bout du TTL ; un
+        jeton pris avant la lecture en base (CacheBackend.fill_token)
+        empêche de remettre en cache une valeur invalidée entre-temps.
+        En cas d'absence, les appels concurrents pour le même article
+        partagent une seule requête (ItemService.flight).
+
+        Une lecture sur un réplica ne remplit pas le cache : une valeur
+        en retard sur le primaire y resterait jusqu'à l'expiration du TTL,
+        bien après l'invalidation faite par l'écriture.
+
         Args:
             db: Session de base de données active.
             item_id: Identifiant unique de l'article à récupérer.
@@ -51,12 +613,146 @@ class ItemService:
             >>> if item:
             ...     print(item.nom)
         """
-        return db.get(Item, item_id)
+        key = item_cache_key(item_id)
+        cached = ItemService.cache.get(key)
+        if cached is not None:
+            return Item.model_validate(cached)
+
+        replica = is_replica_session(db)
+
+        def load() -> dict[str, Any] | None:
+            token = ItemService.cache.fill_token(key)
+            item = db.get(Item, item_id)
+            if item is None:
+                return None
+            data = item.model_dump()
+            if not replica:
+                ItemService.cache.set(key, data, token)
+            return data
+
+        flight_key = f"replica:{key}" if replica else key
+        data, _ = ItemService.flight.do(flight_key, load)
+        return Item.model_validate(data) if data is not None else None
+
+    @staticmethod
+    def get_many(db: Session, ids: Sequence[int]) -> list[Item]:
+        """Récupère plusieurs articles par leurs identifiants.
+
+        Les articles présents dans ItemService.cache sont servis sans
+        requête ; les autres sont lus en une seule requête
+        ``WHERE id IN (...)`` puis mis en cache (sauf lecture sur un
+        réplica, voir get_by_id).
+
+        Args:
+            db: Session de base de données active.
+            ids: Identifiants recherchés (les doublons sont ignorés).
+
+        Returns:
+            Articles trouvés, dans l'ordre de ids ; les IDs inexistants
+            sont omis.
+
+        Example:
+            >>> [item.id for item in ItemService.get_many(db, [3, 1, 99])]
+            [3, 1]
+        """
+        found: dict[int, Item] = {}
+        pending: list[int] = []
+        for item_id in dict.fromkeys(ids):
+            cached = ItemService.cache.get(item_cache_key(item_id))
+            if cached is not None:
+                found[item_id] = Item.model_validate(cached)
+            else:
+                pending.append(item_id)
+
+        if pending:
+            replica = is_replica_session(db)
+            tokens = {
+                item_id: ItemService.cache.fill_token(item_cache_key(item_id))
+                for item_id in pending
+            }
+            for item in db.exec(select(Item).where(col(Item.id).in_(pending))).all():
+                # Un article lu depuis la base a toujours un identifiant
+                assert item.id is not None
+                if not replica:
+                    ItemService.cache.set(
+                        item_cache_key(item.id), item.model_dump(), tokens[item.id]
+                    )
+                found[item.id] = item
+        return [found[item_id] for item_id in dict.fromkeys(ids) if item_id in found]
+
+    @staticmethod
+    def get_version(db: Session, item_id: int) -> int | None:
+        """Récupère uniquement le numéro de version d'un article.
+
+        Utilisé pour les requêtes conditionnelles : la version est lue
+        dans le cache si possible, sinon seule la colonne version est
+        chargée depuis la base.
+
+        Args:
+            db: Session de base de données active.
+            item_id: Identifiant de l'article.
+
+        Returns:
+            La version de l'article, ou None s'il n'existe pas.
+
+        Example:
+            >>> ItemService.get_version(db, 1)
+            3
+        """
+        cached = ItemService.cache.get(item_cache_key(item_id))
+        if cached is not None:
+            return cached["version"]
+        statement = select(Item.version).where(Item.id == item_id)
+        return db.exec(statement).first()
+
+    @staticmethod
+    def get_stats(db: Session, bucket_width: float | None = None) -> ItemStatsResponse:
+        """Récupère les statistiques du catalogue sans parcourir items.
+
+        Le nombre, la somme et l'histogramme des prix sont lus dans les
+        tables d'agrégats tenues à jour par les écritures ; le minimum et le
+        maximum sont deux recherches dans l'index (prix, id).
+
+        Args:
+            db: Session de base de données active.
+            bucket_width: Largeur des tranches de l'histogramme, multiple
+                entier de ITEMS_STATS_BUCKET_WIDTH. Par défaut cette largeur.
+
+        Returns:
+            Statistiques du catalogue.
+
+        Raises:
+            ValueError: Si bucket_width n'est pas un multiple valide.
+
+        Example:
+            >>> ItemService.get_stats(db, bucket_width=50).count
+            1250
+        """
+        # Deux sous-requêtes : SQLite ne résout min() et max() par l'index
+        # que s'ils sont seuls dans leur SELECT.
+        min_prix, max_prix = db.exec(
+            select(
+                select(func.min(Item.prix)).scalar_subquery(),
+                select(func.max(Item.prix)).scalar_subquery(),
+            )
+        ).one()
+        count, prix_sum = db.exec(stats_totals_statement()).one()
+        return stats_response(
+            count,
+            prix_sum,
+            min_prix,
+            max_prix,
+            db.exec(stats_buckets_statement()).all(),
+            bucket_width or STATS_BUCKET_WIDTH,
+        )
 
     @staticmethod
     def create(db: Session, item_data: ItemCreate) -> Item:
         """Crée un nouvel article dans la base de données.
 
+        L'article est inséré et relu en une seule instruction
+        ``INSERT ... RETURNING``, sans SELECT après le commit.
+
         Args:
             db: Session de base de données active.
             item_data: Données validées pour créer l'article (schéma ItemCreate).
@@ -69,64 +765,409 @@ class ItemService:
             >>> created = ItemService.create(db, new_item)
             >>> print(created.id)  # ID auto-généré
         """
-        item = Item(**item_data.model_dump())
-        db.add(item)
+        item = item_from_row(db.exec(insert_statement(item_data)).one())
+        apply_stats_delta(db, added=[item.prix])
         db.commit()
-        db.refresh(item)
         return item
 
     @staticmethod
-    def update(db: Session, item_id: int, item_data: ItemUpdate) -> Item | None:
+    def create_many(
+        db: Session, items_data: list[ItemCreate], batch_size: int = BULK_BATCH_SIZE
+    ) -> list[int]:
+        """Crée plusieurs articles par lots d'INSERT multi-lignes.
+
+        Chaque lot est envoyé en une seule instruction
+        ``INSERT ... VALUES (...), (...) RETURNING id`` puis validé dans
+        sa propre transaction : un chargement de catalogue coûte ainsi
+        un aller-retour par lot au lieu de deux par article.
+
+        Args:
+            db: Session de base de données active.
+            items_data: Données validées des articles à créer.
+            batch_size: Nombre maximum d'articles par lot et par transaction.
+
+        Returns:
+            Identifiants des articles créés, dans l'ordre de items_data.
+
+        Example:
+            >>> ids = ItemService.create_many(
+            ...     db, [ItemCreate(nom="A", prix=1.0), ItemCreate(nom="B", prix=2.0)]
+            ... )
+            >>> len(ids)
+            2
+        """
+        statement = insert(Item).returning(col(Item.id), sort_by_parameter_order=True)
+        ids: list[int] = []
+        for start in range(0, len(items_data), batch_size):
+            chunk = items_data[start : start + batch_size]
+            params = [item_data.model_dump() for item_data in chunk]
+            ids.extend(db.exec(statement, params=params).scalars().all())
+            apply_stats_delta(db, added=[row["prix"] for row in params])
+            db.commit()
+        return ids
+
+    @staticmethod
+    def copy_many(db: Session, items_data: list[ItemCreate]) -> int:
+        """Insère un lot d'articles sans relire leurs identifiants.
+
+        Sur PostgreSQL (psycopg2), le lot est envoyé avec ``COPY ... FROM
+        STDIN``, le chemin d'insertion le plus rapide ; sur les autres
+        bases, avec un INSERT multi-lignes. Le lot est validé dans sa
+        propre transaction.
+
+        Args:
+            db: Session de base de données active.
+            items_data: Données validées des articles à créer.
+
+        Returns:
+            Nombre d'articles insérés.
+
+        Example:
+            >>> ItemService.copy_many(db, [ItemCreate(nom="A", prix=1.0)])
+            1
+        """
+        if not items_data:
+            return 0
+        rows = [item_data.model_dump() for item_data in items_data]
+        connection = db.connection()
+        if connection.dialect.driver == "psycopg2":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows((row["nom"], row["prix"]) for row in rows)
+            buffer.seek(0)
+            cursor = connection.connection.cursor()
+            try:
+                cursor.copy_expert(
+                    "COPY items (nom, prix) FROM STDIN WITH (FORMAT csv)", buffer
+                )
+            finally:
+                cursor.close()
+        else:
+            db.exec(insert(Item), params=rows)
+        apply_stats_delta(db, added=[row["prix"] for row in rows])
+        db.commit()
+        return len(rows)
+
+    @staticmethod
+    def update_many(
+        db: Session,
+        updates: list[ItemBulkUpdate],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> list[int]:
+        """Applique des mises à jour partielles à plusieurs articles.
+
+        Les modifications d'un même article sont fusionnées, puis envoyées
+        par lots, une transaction par lot : sur PostgreSQL, une seule
+        instruction ``UPDATE ... FROM (VALUES ...)`` par lot ; ailleurs, un
+        UPDATE préparé exécuté en executemany. Chaque lot commence par lire
+        (et verrouiller) les prix courants, qui servent à détecter les
+        articles inexistants et à tenir à jour l'histogramme des prix.
+
+        Args:
+            db: Session de base de données active.
+            updates: Modifications à appliquer.
+            batch_size: Nombre maximum d'articles par lot et par transaction.
+
+        Returns:
+            Identifiants des articles modifiés.
+
+        Example:
+            >>> ItemService.update_many(db, [ItemBulkUpdate(id=1, prix=9.5)])
+            [1]
+        """
+        merged: dict[int, dict[str, Any]] = {}
+        for entry in updates:
+            changes = entry.model_dump(exclude_unset=True, exclude={"id"})
+            merged.setdefault(entry.id, {}).update(
+                (field, value) for field, value in changes.items() if value is not None
+            )
+
+        dialect = db.get_bind().dialect.name
+        ids = list(merged)
+        updated: list[int] = []
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start : start + batch_size]
+            previous = dict(
+                db.exec(
+                    select(col(Item.id), Item.prix)
+                    .where(col(Item.id).in_(chunk))
+                    .with_for_update()
+                ).all()
+            )
+            rows = [
+                {"id": item_id, "nom": None, "prix": None, **merged[item_id]}
+                for item_id in chunk
+                if item_id in previous
+            ]
+            if rows:
+                if dialect == "postgresql":
+                    db.exec(bulk_update_values_statement(rows))
+                else:
+                    params = [
+                        {f"b_{field}": value for field, value in row.items()}
+                        for row in rows
+                    ]
+                    db.exec(BULK_UPDATE_BY_ID_STATEMENT, params=params)
+                repriced = [row for row in rows if row["prix"] is not None]
+                apply_stats_delta(
+                    db,
+                    added=[row["prix"] for row in repriced],
+                    removed=[previous[row["id"]] for row in repriced],
+                )
+            db.commit()
+            for row in rows:
+                ItemService.cache.delete(item_cache_key(row["id"]))
+            updated.extend(row["id"] for row in rows)
+        return updated
+
+    @staticmethod
+    def reprice(
+        db: Session,
+        factor: float,
+        *,
+        min_prix: float | None = None,
+        max_prix: float | None = None,
+    ) -> int:
+        """Multiplie le prix de tous les articles d'une fourchette de prix.
+
+        La modification est une seule instruction UPDATE, quel que soit le
+        nombre d'articles visés. Sur PostgreSQL, elle renvoie aussi les
+        anciens prix pour l'histogramme, lus et verrouillés par une CTE
+        ``SELECT ... FOR UPDATE`` ; ailleurs, ceux-ci sont lus juste avant,
+        dans la même transaction.
+
+        Args:
+            db: Session de base de données active.
+            factor: Coefficient appliqué aux prix.
+            min_prix: Prix minimum des articles visés (inclus).
+            max_prix: Prix maximum des articles visés (inclus).
+
+        Returns:
+            Nombre d'articles modifiés.
+
+        Raises:
+            ValueError: Si un nouveau prix dépasse MAX_PRIX ; rien n'est
+                modifié.
+
+        Example:
+            >>> ItemService.reprice(db, 1.05, max_prix=20)
+            1250
+        """
+        items = items_table
+        filters = price_filters(min_prix, max_prix)
+        statement = update(items).values(
+            prix=items.c.prix * factor, version=items.c.version + 1
+        )
+
+        if db.get_bind().dialect.name == "postgresql":
+            old = (
+                select(items.c.id, items.c.prix)
+                .where(*filters)
+                .with_for_update()
+                .cte("old")
+            )
+            rows = db.exec(
+                statement.where(items.c.id == old.c.id).returning(
+                    items.c.id, items.c.prix, old.c.prix
+                )
+            ).all()
+            previous = [row[2] for row in rows]
+        else:
+            previous = list(
+                db.exec(select(Item.prix).where(*filters).with_for_update()).all()
+            )
+            rows = db.exec(
+                statement.where(*filters).returning(items.c.id, items.c.prix)
+            ).all()
+        # Annulé avant toute mise à jour des agrégats
+        if not all(row[1] <= MAX_PRIX for row in rows):
+            db.rollback()
+            raise ValueError(f"Repriced prices must not exceed {MAX_PRIX:g}")
+
+        apply_stats_delta(db, added=[row[1] for row in rows], removed=previous)
+        db.commit()
+        for row in rows:
+            ItemService.cache.delete(item_cache_key(row[0]))
+        return len(rows)
+
+    @staticmethod
+    def update(
+        db: Session,
+        item_id: int,
+        item_data: ItemUpdate,
+        expected_version: int | None = None,
+    ) -> Item | None:
         """Met à jour un article existant avec les données fournies.
 
         Effectue une mise à jour partielle en ne modifiant que les champs
-        fournis dans item_data (grâce à exclude_unset=True).
+        fournis dans item_data (grâce à exclude_unset=True), et incrémente
+        la version de l'article. L'article est modifié et relu en une seule
+        instruction ``UPDATE ... RETURNING``. Si le prix change, l'ancien
+        prix (pour l'histogramme) est renvoyé par la même instruction sur
+        PostgreSQL, la ligne étant verrouillée par une CTE ``FOR UPDATE`` ;
+        sur SQLite, il est lu juste avant dans la même transaction.
 
         Args:
             db: Session de base de données active.
             item_id: Identifiant de l'article à mettre à jour.
             item_data: Données de mise à jour (schéma ItemUpdate).
+            expected_version: Version attendue (en-tête If-Match), ou None
+                pour une mise à jour inconditionnelle.
 
         Returns:
             L'objet Item mis à jour, ou None si l'article n'existe pas.
 
+        Raises:
+            VersionConflictError: Si la version de l'article diffère
+                de expected_version.
+
         Example:
             >>> update_data = ItemUpdate(prix=249.99)  # Ne met à jour que le prix
             >>> updated = ItemService.update(db, 1, update_data)
         """
-        item = db.get(Item, item_id)
-        if not item:
-            return None
+        values = item_data.model_dump(exclude_unset=True)
+        returning_old_prix = (
+            "prix" in values and db.get_bind().dialect.name == "postgresql"
+        )
+        previous_prix = None
+        if "prix" in values and not returning_old_prix:
+            # SQLite n'a pas de verrou de ligne : l'écriture qui suit verrouille
+            # la base entière, et la transaction échoue si la ligne a changé.
+            previous_prix = db.exec(
+                select(Item.prix).where(col(Item.id) == item_id)
+            ).first()
 
-        update_data = item_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(item, field, value)
+        statement = update_statement(
+            item_id, values, expected_version, returning_old_prix=returning_old_prix
+        )
+        row = db.exec(statement).first()
+        if row is None:
+            db.rollback()
+            if expected_version is not None and ItemService._exists(db, item_id):
+                raise VersionConflictError(item_id)
+            return None
 
-        db.add(item)
+        item = item_from_row(row)
+        if returning_old_prix:
+            previous_prix = row.old_prix
+        if previous_prix is not None and item.prix != previous_prix:
+            apply_stats_delta(db, added=[item.prix], removed=[previous_prix])
         db.commit()
-        db.refresh(item)
+        ItemService.cache.delete(item_cache_key(item_id))
         return item
 
     @staticmethod
-    def delete(db: Session, item_id: int) -> bool:
+    def delete(db: Session, item_id: int, expected_version: int | None = None) -> bool:
         """Supprime un article de la base de données.
 
+        La suppression est une seule instruction ``DELETE ... RETURNING``,
+        sans lecture préalable de l'article.
+
         Args:
             db: Session de base de données active.
             item_id: Identifiant de l'article à supprimer.
+            expected_version: Version attendue (en-tête If-Match), ou None
+                pour une suppression inconditionnelle.
 
         Returns:
             True si l'article a été supprimé, False s'il n'existait pas.
 
+        Raises:
+            VersionConflictError: Si la version de l'article diffère
+                de expected_version.
+
         Example:
             >>> success = ItemService.delete(db, 1)
             >>> if success:
             ...     print("Article supprimé avec succès")
         """
-        item = db.get(Item, item_id)
-        if not item:
+        prix = db.exec(delete_statement(item_id, expected_version)).scalar()
+        if prix is None:
+            db.rollback()
+            if expected_version is not None and ItemService._exists(db, item_id):
+                raise VersionConflictError(item_id)
             return False
 
-        db.delete(item)
+        apply_stats_delta(db, removed=[prix])
         db.commit()
+        ItemService.cache.delete(item_cache_key(item_id))
         return True
+
+    @staticmethod
+    def delete_many(
+        db: Session,
+        ids: list[int] | None = None,
+        *,
+        min_prix: float | None = None,
+        max_prix: float | None = None,
+        nom_prefix: str | None = None,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """Supprime en masse les articles correspondant aux critères.
+
+        Les critères se cumulent. La suppression se fait par lots, une
+        transaction par lot, pour ne jamais verrouiller toute la plage à
+        la fois :
+
+        - avec ids : ``DELETE ... WHERE id = ANY(:ids)`` sur PostgreSQL
+          (``IN (...)`` ailleurs) pour chaque tranche de batch_size IDs ;
+        - sans ids : ``DELETE ... WHERE id IN (SELECT id ... LIMIT :n)``
+          répété jusqu'à épuisement des articles correspondants.
+
+        Args:
+            db: Session de base de données active.
+            ids: Identifiants des articles à supprimer.
+            min_prix: Prix minimum (inclus).
+            max_prix: Prix maximum (inclus).
+            nom_prefix: Début du nom, sans tenir compte de la casse.
+            batch_size: Nombre maximum d'articles supprimés par lot.
+
+        Returns:
+            Nombre d'articles supprimés.
+
+        Example:
+            >>> ItemService.delete_many(db, nom_prefix="Promo ", max_prix=5)
+            4200
+        """
+        filters = price_filters(min_prix, max_prix)
+        if nom_prefix is not None:
+            filters.append(name_prefix_filter(nom_prefix))
+        returning = (col(Item.id), col(Item.prix))
+
+        def run(statement: Delete) -> int:
+            rows = db.exec(statement.where(*filters).returning(*returning)).all()
+            apply_stats_delta(db, removed=[row.prix for row in rows])
+            db.commit()
+            for row in rows:
+                ItemService.cache.delete(item_cache_key(row.id))
+            return len(rows)
+
+        deleted = 0
+        if ids is not None:
+            postgresql = db.get_bind().dialect.name == "postgresql"
+            unique_ids = list(dict.fromkeys(ids))
+            for start in range(0, len(unique_ids), batch_size):
+                chunk = unique_ids[start : start + batch_size]
+                if postgresql:
+                    condition = col(Item.id) == any_(
+                        bindparam("ids", chunk, ARRAY(Integer))
+                    )
+                else:
+                    condition = col(Item.id).in_(chunk)
+                deleted += run(delete(items_table).where(condition))
+            return deleted
+
+        batch = (
+            select(col(Item.id))
+            .where(*filters)
+            .order_by(col(Item.id))
+            .limit(batch_size)
+        )
+        while True:
+            count = run(delete(items_table).where(col(Item.id).in_(batch)))
+            deleted += count
+            if count < batch_size:
+                return deleted
+
+    @staticmethod
+    def _exists(db: Session, item_id: int) -> bool:
+        return db.exec(select(Item.id).where(Item.id == item_id)).first() is not None
@@ -0,0 +1,111 @@
+"""Encodage des curseurs opaques pour la pagination par clé (keyset).
+
+Un curseur est un petit dictionnaire JSON (par exemple ``{"id": 42}``)
+encodé en base64 URL-safe. Le client le renvoie tel quel pour obtenir
+la page suivante, sans jamais dépendre de son format interne.
+"""
+
+import base64
+import binascii
+import json
+import math
+from typing import Any
+
+# Plus grand identifiant représentable par une colonne BIGINT (64 bits)
+MAX_ID = 2**63 - 1
+
+# Type attendu de la valeur de reprise ``v`` selon la clé de tri
+SORT_VALUE_TYPES: dict[str, type] = {"prix": float, "nom": str}
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """Encode la position de pagination en un jeton opaque.
+
+    Args:
+        values: Valeurs de la clé de tri du dernier élément de la page.
+
+    Returns:
+        Jeton base64 URL-safe, sans caractère de remplissage.
+
+    Example:
+        >>> encode_cursor({"id": 42})
+        'eyJpZCI6NDJ9'
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+    """Décode un jeton produit par encode_cursor.
+
+    Args:
+        token: Jeton opaque reçu du client.
+
+    Returns:
+        Dictionnaire des valeurs de la clé de tri.
+
+    Raises:
+        ValueError: Si le jeton est mal formé.
+
+    Example:
+        >>> decode_cursor("eyJpZCI6NDJ9")
+        {'id': 42}
+    """
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def encode_page_cursor(sort: str, item_id: int, value: Any = None) -> str:
+    """Encode la position de reprise d'une liste d'articles triée.
+
+    Args:
+        sort: Clé de tri de la liste (``id``, ``prix``, ``-prix``, ...).
+        item_id: Identifiant du dernier article de la page.
+        value: Valeur de la clé de tri pour ce dernier article.
+
+    Returns:
+        Jeton opaque à renvoyer pour obtenir la page suivante.
+    """
+    if sort == "id":
+        return encode_cursor({"id": item_id})
+    return encode_cursor({"s": sort, "id": item_id, "v": value})
+
+
+def decode_page_cursor(token: str, sort: str) -> tuple[int, Any]:
+    """Décode un jeton produit par encode_page_cursor.
+
+    Args:
+        token: Jeton opaque reçu du client.
+        sort: Clé de tri de la requête courante.
+
+    Returns:
+        Couple (identifiant, valeur de la clé de tri) du dernier article
+        de la page précédente.
+
+    Raises:
+        ValueError: Si le jeton est mal formé, a été émis pour un autre tri
+            ou porte une valeur de reprise du mauvais type.
+    """
+    values = decode_cursor(token)
+    if values.get("s", "id") != sort:
+        raise ValueError("Cursor does not match the requested sort")
+    item_id = values.get("id")
+    # bool est une sous-classe de int ; un id hors BIGINT ferait échouer la requête
+    if not isinstance(item_id, int) or isinstance(item_id, bool):
+        raise ValueError("Invalid cursor")
+    if not -MAX_ID - 1 <= item_id <= MAX_ID:
+        raise ValueError("Invalid cursor")
+    value = values.get("v")
+    expected = SORT_VALUE_TYPES.get(sort.lstrip("-"))
+    if expected is not None and not isinstance(value, expected):
+        raise ValueError("Invalid cursor")
+    # json accepte NaN et Infinity, qui fausseraient la comparaison de tuples
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("Invalid cursor")
+    return item_id, value
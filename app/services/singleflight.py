@@ -0,0 +1,184 @@
+"""Regroupement des lectures concurrentes identiques (single-flight).
+
+Lors d'un pic de trafic, de nombreuses requêtes demandent en même temps
+le même article ou la même première page. SingleFlight laisse un seul
+appelant (le « leader ») exécuter la requête pour une clé donnée : les
+appelants concurrents sur la même clé attendent son résultat au lieu
+d'interroger la base à leur tour.
+
+Les routes synchrones s'exécutent dans le pool de threads de Starlette :
+la synchronisation de SingleFlight repose donc sur threading.
+AsyncSingleFlight offre le même regroupement aux routes asynchrones, qui
+partagent toutes la boucle d'événements : un simple Future suffit.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.config import env_flag
+
+SINGLE_FLIGHT_ENABLED = env_flag("ITEMS_SINGLE_FLIGHT", True)
+
+T = TypeVar("T")
+
+
+class _Call:
+    """Appel en cours pour une clé : résultat partagé avec les suiveurs."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Exécute au plus un appel à la fois par clé.
+
+    Attributes:
+        enabled: False pour exécuter chaque appel directement.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> result, leader = flight.do("item:1", lambda: load(1))
+    """
+
+    def __init__(self, enabled: bool = SINGLE_FLIGHT_ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Exécute fn, ou attend le résultat d'un appel en cours sur key.
+
+        Args:
+            key: Clé identifiant la lecture (mêmes paramètres, même clé).
+            fn: Fonction effectuant la lecture.
+
+        Returns:
+            Le résultat, et True si l'appelant l'a lui-même calculé (leader),
+            False s'il a reçu celui d'un autre appelant. Un résultat partagé
+            appartient au leader : le suiveur ne doit pas le modifier.
+
+        Raises:
+            BaseException: L'exception levée par fn, propagée au leader
+                comme aux suiveurs.
+        """
+        if not self.enabled:
+            return fn(), True
+
+        with self._lock:
+            existing = self._calls.get(key)
+            leader = existing is None
+            if existing is None:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call = existing
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, False
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, True
+
+    def stats(self) -> dict[str, Any]:
+        """Retourne les compteurs : lectures exécutées, lectures épargnées
+        (``shared``) et appels en cours."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "executed": self.executed,
+                "shared": self.shared,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """Exécute au plus un appel à la fois par clé, dans la boucle d'événements.
+
+    Attributes:
+        enabled: False pour exécuter chaque appel directement.
+
+    Example:
+        >>> flight = AsyncSingleFlight()
+        >>> result, leader = await flight.do("item:1", lambda: load(1))
+    """
+
+    def __init__(self, enabled: bool = SINGLE_FLIGHT_ENABLED):
+        self.enabled = enabled
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Exécute fn, ou attend le résultat d'un appel en cours sur key.
+
+        Si le leader est annulé (client déconnecté), ses suiveurs exécutent
+        fn eux-mêmes au lieu d'échouer.
+
+        Args:
+            key: Clé identifiant la lecture (mêmes paramètres, même clé).
+            fn: Fonction asynchrone effectuant la lecture.
+
+        Returns:
+            Le résultat, et True si l'appelant l'a lui-même calculé, voir
+            SingleFlight.do.
+
+        Raises:
+            Exception: L'exception levée par fn, propagée au leader comme
+                aux suiveurs.
+        """
+        if not self.enabled:
+            return await fn(), True
+
+        call = self._calls.get(key)
+        if call is not None:
+            self.shared += 1
+            # wait() n'annule pas call si le suiveur est lui-même annulé
+            await asyncio.wait([call])
+            if call.cancelled():
+                return await fn(), True
+            return call.result(), False
+
+        call = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.executed += 1
+        try:
+            result = await fn()
+        except Exception as exc:
+            call.set_exception(exc)
+            # Marque l'exception comme lue, même sans suiveur
+            call.exception()
+            raise
+        except BaseException:
+            call.cancel()
+            raise
+        else:
+            call.set_result(result)
+        finally:
+            del self._calls[key]
+        return result, True
+
+    def stats(self) -> dict[str, Any]:
+        """Retourne les compteurs, voir SingleFlight.stats."""
+        return {
+            "enabled": self.enabled,
+            "executed": self.executed,
+            "shared": self.shared,
+            "in_flight": len(self._calls),
+        }
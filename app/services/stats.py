@@ -0,0 +1,270 @@
+"""Agrégats du catalogue maintenus de façon incrémentale.
+
+Chaque écriture sur les articles applique, dans sa propre transaction,
+un delta aux tables item_stats (nombre et somme des prix) et
+item_price_buckets (histogramme des prix) : la lecture des statistiques
+ne dépend plus de la taille du catalogue. Les prix minimum et maximum
+sont lus à chaque appel par une simple recherche dans l'index (prix, id).
+
+Les deltas sont des upserts atomiques (``count = count + :delta``) : des
+écritures concurrentes ne perdent pas de mise à jour. Chaque écriture
+applique son delta à une partition tirée au hasard parmi
+ITEMS_STATS_SHARDS : les transactions concurrentes verrouillent des
+lignes différentes au lieu d'attendre toutes la même. En cas de dérive
+(import direct en base, changement de ITEMS_STATS_BUCKET_WIDTH, ...),
+``python -m app.cli rebuild-stats`` recalcule les agrégats.
+"""
+
+import math
+import os
+import random
+from collections import Counter
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import ColumnElement, Integer, cast, delete, func, insert, literal
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select
+
+from app.models.item import Item
+from app.models.item_stats import ItemPriceBucket, ItemStats
+from app.schemas.item import ItemPriceHistogramBin, ItemStatsResponse
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+STATS_BUCKET_WIDTH = float(os.getenv("ITEMS_STATS_BUCKET_WIDTH", "10"))
+# Nombre de partitions des compteurs (lignes verrouillées par les écritures)
+STATS_SHARDS = max(int(os.getenv("ITEMS_STATS_SHARDS", "16")), 1)
+
+_INSERTS: dict[str, Callable[..., postgresql.Insert | sqlite.Insert]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def price_bucket(prix: float) -> int:
+    """Retourne l'indice de la tranche de l'histogramme contenant prix.
+
+    Example:
+        >>> price_bucket(25.0)  # avec une largeur de 10
+        2
+    """
+    return math.floor(prix / STATS_BUCKET_WIDTH)
+
+
+def bucket_expression(dialect: str) -> ColumnElement[int]:
+    """Retourne l'expression SQL de l'indice de tranche du prix d'un article."""
+    if dialect == "sqlite":
+        # floor() n'est pas toujours compilé dans SQLite ; les prix étant
+        # positifs, la troncature entière donne le même résultat.
+        return cast(Item.prix / STATS_BUCKET_WIDTH, Integer)
+    return cast(func.floor(Item.prix / STATS_BUCKET_WIDTH), Integer)
+
+
+def stats_delta_statements(
+    dialect: str,
+    added: Iterable[float] = (),
+    removed: Iterable[float] = (),
+    shard: int | None = None,
+) -> list[Any]:
+    """Construit les upserts qui répercutent des écritures sur les agrégats.
+
+    Args:
+        dialect: Nom du dialecte SQLAlchemy (``postgresql``, ``sqlite``).
+        added: Prix des articles créés (ou nouveaux prix après mise à jour).
+        removed: Prix des articles supprimés (ou anciens prix).
+        shard: Partition des compteurs à modifier ; tirée au hasard si None.
+
+    Returns:
+        Instructions à exécuter dans la transaction de l'écriture ; liste
+        vide si les agrégats ne changent pas.
+
+    Example:
+        >>> stats_delta_statements("sqlite", added=[12.5], removed=[8.0])
+    """
+    added = list(added)
+    removed = list(removed)
+    buckets = Counter(price_bucket(prix) for prix in added)
+    buckets.subtract(price_bucket(prix) for prix in removed)
+    count = len(added) - len(removed)
+    prix_sum = sum(added) - sum(removed)
+
+    if shard is None:
+        shard = random.randrange(STATS_SHARDS)
+    upsert = _INSERTS[dialect]
+    statements = []
+    if count or prix_sum:
+        statement = upsert(ItemStats).values(
+            shard=shard, count=count, prix_sum=prix_sum
+        )
+        statements.append(
+            statement.on_conflict_do_update(
+                index_elements=[col(ItemStats.shard)],
+                set_={
+                    "count": ItemStats.count + statement.excluded.count,
+                    "prix_sum": ItemStats.prix_sum + statement.excluded.prix_sum,
+                },
+            )
+        )
+    for bucket, delta in sorted(buckets.items()):
+        if not delta:
+            continue
+        statement = upsert(ItemPriceBucket).values(
+            bucket=bucket, shard=shard, count=delta
+        )
+        statements.append(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    col(ItemPriceBucket.bucket),
+                    col(ItemPriceBucket.shard),
+                ],
+                set_={"count": ItemPriceBucket.count + statement.excluded.count},
+            )
+        )
+    return statements
+
+
+def apply_stats_delta(
+    db: Session, added: Iterable[float] = (), removed: Iterable[float] = ()
+) -> None:
+    """Applique un delta aux agrégats dans la transaction courante de db.
+
+    Args:
+        db: Session de base de données active (non validée).
+        added: Prix des articles créés.
+        removed: Prix des articles supprimés.
+    """
+    dialect = db.get_bind().dialect.name
+    for statement in stats_delta_statements(dialect, added, removed):
+        db.exec(statement)
+
+
+async def apply_stats_delta_async(
+    db: "AsyncSession", added: Iterable[float] = (), removed: Iterable[float] = ()
+) -> None:
+    """Version asynchrone de apply_stats_delta."""
+    dialect = db.get_bind().dialect.name
+    for statement in stats_delta_statements(dialect, added, removed):
+        await db.exec(statement)
+
+
+def stats_totals_statement() -> Select[tuple[int, float]]:
+    """Requête du nombre et de la somme des prix, toutes partitions confondues."""
+    return select(
+        func.coalesce(func.sum(ItemStats.count), 0),
+        func.coalesce(func.sum(ItemStats.prix_sum), 0.0),
+    )
+
+
+def stats_buckets_statement() -> Select[tuple[int, int]]:
+    """Requête des tranches de l'histogramme, toutes partitions confondues."""
+    bucket = col(ItemPriceBucket.bucket)
+    return select(bucket, func.sum(ItemPriceBucket.count)).group_by(bucket)
+
+
+def stats_response(
+    count: int,
+    prix_sum: float,
+    min_prix: float | None,
+    max_prix: float | None,
+    buckets: Iterable[tuple[int, int]],
+    bucket_width: float,
+) -> ItemStatsResponse:
+    """Assemble la réponse de GET /items/stats à partir des agrégats lus.
+
+    Args:
+        count: Nombre d'articles (somme des partitions).
+        prix_sum: Somme des prix (somme des partitions).
+        min_prix: Prix minimum lu dans l'index.
+        max_prix: Prix maximum lu dans l'index.
+        buckets: Couples (tranche, nombre) de largeur STATS_BUCKET_WIDTH.
+        bucket_width: Largeur des tranches demandée, multiple entier de
+            STATS_BUCKET_WIDTH.
+
+    Returns:
+        Statistiques du catalogue.
+
+    Raises:
+        ValueError: Si bucket_width n'est pas un multiple de STATS_BUCKET_WIDTH.
+    """
+    ratio = bucket_width / STATS_BUCKET_WIDTH
+    factor = round(ratio)
+    if factor < 1 or not math.isclose(ratio, factor):
+        raise ValueError(f"bucket_width must be a multiple of {STATS_BUCKET_WIDTH:g}")
+
+    merged: Counter[int] = Counter()
+    for bucket, bucket_count in buckets:
+        if bucket_count > 0:
+            merged[bucket // factor] += bucket_count
+
+    return ItemStatsResponse(
+        count=count,
+        min_prix=min_prix,
+        max_prix=max_prix,
+        avg_prix=prix_sum / count if count else None,
+        sum_prix=prix_sum,
+        bucket_width=bucket_width,
+        histogram=[
+            ItemPriceHistogramBin(
+                lower=index * bucket_width,
+                upper=(index + 1) * bucket_width,
+                count=merged[index],
+            )
+            for index in sorted(merged)
+        ],
+    )
+
+
+def backfill_stats(connection: Connection) -> None:
+    """Recalcule les agrégats à partir de la table items, en SQL ensembliste.
+
+    Les partitions existantes sont vidées et les totaux recalculés sont
+    placés dans la partition 0. Sur PostgreSQL, la table items est
+    verrouillée en écriture jusqu'à la fin de la transaction, afin qu'aucun
+    delta concurrent ne soit écrasé.
+
+    Args:
+        connection: Connexion dans la transaction du recalcul (migration ou
+            rebuild_stats).
+    """
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        connection.exec_driver_sql("LOCK TABLE items IN SHARE MODE")
+
+    connection.execute(delete(ItemPriceBucket))
+    connection.execute(delete(ItemStats))
+    connection.execute(
+        insert(ItemStats).from_select(
+            ["shard", "count", "prix_sum"],
+            select(literal(0), func.count(), func.coalesce(func.sum(Item.prix), 0.0)),
+        )
+    )
+    connection.execute(
+        insert(ItemPriceBucket).from_select(
+            ["bucket", "shard", "count"],
+            select(
+                bucket_expression(dialect).label("bucket"), literal(0), func.count()
+            ).group_by("bucket"),
+        )
+    )
+
+
+def rebuild_stats(db: Session) -> ItemStats:
+    """Recalcule entièrement les agrégats à partir de la table items.
+
+    Args:
+        db: Session de base de données active.
+
+    Returns:
+        La ligne item_stats recalculée (partition 0, qui porte les totaux).
+
+    Example:
+        >>> rebuild_stats(db).count
+        1250
+    """
+    backfill_stats(db.connection())
+    db.commit()
+    return db.exec(select(ItemStats).where(ItemStats.shard == 0)).one()
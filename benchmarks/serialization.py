@@ -0,0 +1,63 @@
+"""Micro-benchmark de la sérialisation d'une page d'articles.
+
+Compare le chemin standard de FastAPI (validation dans le response_model
+list[ItemResponse], conversion en types JSON, puis JSONResponse) avec
+ItemJSONResponse, qui écrit directement les objets Item en octets.
+
+Usage:
+    python -m benchmarks.serialization --rows 1000 --repeat 200
+"""
+
+import argparse
+import json
+import timeit
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app import responses
+from app.models.item import Item
+from app.responses import ItemJSONResponse
+from app.schemas.item import ItemResponse
+
+adapter = TypeAdapter(list[ItemResponse])
+
+
+def fastapi_path(items: list[Item]) -> bytes:
+    """Reproduit fastapi.routing.serialize_response pour un response_model."""
+    validated = adapter.validate_python(items, from_attributes=True)
+    return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+
+def fast_path(items: list[Item]) -> bytes:
+    return ItemJSONResponse(items).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    items = [
+        Item(id=i, nom=f"Article {i}", prix=i * 1.25, version=1)
+        for i in range(1, args.rows + 1)
+    ]
+    # Les séparateurs diffèrent selon l'encodeur, pas le contenu
+    assert json.loads(fastapi_path(items)) == json.loads(fast_path(items))
+
+    cases = {"response_model (FastAPI)": fastapi_path, "ItemJSONResponse": fast_path}
+    encoder = "orjson" if responses.orjson is not None else "json (stdlib)"
+    print(f"{args.rows} articles par page, {args.repeat} répétitions, {encoder}")
+    baseline = None
+    for name, func in cases.items():
+        seconds = (
+            min(timeit.repeat(lambda: func(items), number=args.repeat, repeat=5))
+            / args.repeat
+        )
+        baseline = baseline or seconds
+        print(f"  {name:<26} {seconds * 1e3:8.3f} ms/page  x{baseline / seconds:.1f}")
+
+
+if __name__ == "__main__":
+    main()
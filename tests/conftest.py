@@ -1,8 +1,10 @@
 import pytest
 from sqlmodel import create_engine, Session, SQLModel
 from fastapi.testclient import TestClient
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.migrations import migrate
 from app.models.item import Item
+from app.services.item_service import ItemService
 import app.database
 import app.main
 
@@ -15,7 +17,9 @@ engine = create_engine(
 
 @pytest.fixture(scope="function")
 def db():
-    SQLModel.metadata.create_all(engine)
+    ItemService.cache.clear()
+    ItemService.count_cache.clear()
+    migrate(engine)
     with Session(engine) as session:
         yield session
     SQLModel.metadata.drop_all(engine)
@@ -31,6 +35,7 @@ def client(db):
     app.main.engine = engine
 
     app.main.app.dependency_overrides[get_db] = override_get_db
+    app.main.app.dependency_overrides[get_read_db] = override_get_db
 
     with TestClient(app.main.app, raise_server_exceptions=False) as test_client:
         yield test_client
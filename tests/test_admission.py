@@ -0,0 +1,85 @@
+"""Tests du contrôle d'admission des routes /items."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import admission
+from app.admission import AdmissionController, AdmissionRejected
+
+
+def test_queue_and_reject():
+    """Teste l'attente dans la file puis le refus lorsque la file est pleine."""
+
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, queue_size=1)
+        first = await controller.acquire()
+        queued = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.stats()["queued"] == 1
+        assert controller.saturated
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.reason == "queue_full"
+        assert rejected.value.retry_after >= 1
+
+        controller.release(first)
+        controller.release(await queued)
+        return controller.stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats["active"], stats["admitted"], stats["rejected"]) == (0, 2, 1)
+
+
+def test_queue_timeout():
+    """Teste le refus d'une requête restée trop longtemps dans la file."""
+
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, queue_timeout=0.01)
+        await controller.acquire()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.reason == "timeout"
+        return controller.stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats["active"], stats["queued"], stats["timed_out"]) == (1, 0, 1)
+
+
+def test_limit_adapts_to_db_latency():
+    """Teste la baisse de la limite quand la base ralentit, puis sa remontée."""
+    controller = AdmissionController(max_concurrency=20, min_concurrency=2)
+    for _ in range(200):
+        controller.latency.observe(0.001)
+    for _ in range(50):
+        controller.latency.observe(0.02)
+    for _ in range(30):
+        controller.adapt()
+    assert controller.limit < 10
+
+    for _ in range(200):
+        controller.latency.observe(0.001)
+    for _ in range(100):
+        controller.adapt()
+    assert controller.limit == 20
+
+
+def test_overloaded_route_returns_503(client: TestClient, monkeypatch):
+    """Teste le délestage HTTP et la disponibilité signalée par /health."""
+    controller = AdmissionController(max_concurrency=1, queue_size=0)
+    monkeypatch.setattr(admission, "controller", controller)
+    controller.active = 1
+
+    response = client.get("/items/")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+    health = client.get("/health")
+    assert health.status_code == 503
+    assert health.json()["status"] == "saturated"
+
+    controller.active = 0
+    assert client.get("/items/").status_code == 200
+    assert client.get("/health").json()["admission"]["admitted"] == 1
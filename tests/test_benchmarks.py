@@ -0,0 +1,28 @@
+"""Tests du benchmark de charge (benchmarks.load)."""
+
+from benchmarks.load import SCENARIOS, compare, run
+
+
+def test_run_reports_every_scenario(tmp_path):
+    """Teste une exécution réduite du benchmark sur SQLite."""
+    results = run(f"sqlite:///{tmp_path}/bench.db", items=10, requests=6, concurrency=2)
+
+    assert results["meta"]["dialect"] == "sqlite"
+    assert set(results["scenarios"]) == set(SCENARIOS)
+    for stats in results["scenarios"].values():
+        assert stats["errors"] == 0
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+        assert stats["queries_per_request"] > 0
+
+
+def test_compare_flags_regressions():
+    """Teste la détection des régressions par rapport à la référence."""
+    reference = {"p95_ms": 10.0, "rps": 100.0, "queries_per_request": 1.0, "errors": 0}
+    baseline = {"scenarios": {"get_item": reference}}
+
+    assert compare({"scenarios": {"get_item": reference}}, baseline) == []
+
+    slower = {**reference, "p95_ms": 13.0, "queries_per_request": 2.0}
+    regressions = compare({"scenarios": {"get_item": slower}}, baseline)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("get_item: p95 13.0 ms")
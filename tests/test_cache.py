@@ -0,0 +1,96 @@
+"""Tests du cache LRU et de son intégration dans ItemService."""
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.item import Item
+from app.services.cache import LRUCache
+from app.services.item_service import ItemService, item_cache_key
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Teste l'éviction LRU et les compteurs associés."""
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_lru_cache_expires_entries():
+    """Teste qu'une entrée expirée est traitée comme absente."""
+    cache = LRUCache(maxsize=10, ttl=-1)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_cache_ignores_fill_after_invalidation():
+    """Teste qu'un remplissage pris avant une invalidation est ignoré."""
+    cache = LRUCache(maxsize=2, ttl=60)
+    token = cache.fill_token("a")
+    cache.delete("a")
+    cache.set("a", "stale", token)
+    assert cache.get("a") is None
+    assert cache.stats()["stale_fills"] == 1
+
+    cache.set("a", "fresh", cache.fill_token("a"))
+    assert cache.get("a") == "fresh"
+
+    # Les pierres tombales évincées relèvent la génération plancher
+    token = cache.fill_token("b")
+    for key in ("b", "c", "d"):
+        cache.delete(key)
+    cache.set("b", "stale", token)
+    assert cache.get("b") is None
+
+
+def test_get_by_id_does_not_cache_value_invalidated_during_load(db: Session):
+    """Teste la course lecture / écriture concurrente sur le cache."""
+    item = Item(nom="Course", prix=1.0)
+    db.add(item)
+    db.commit()
+    item_id = item.id
+    assert item_id is not None
+    db.expunge_all()
+    original_get = db.get
+
+    def get_then_concurrent_update(*args, **kwargs):
+        # Une écriture valide et invalide la clé après la lecture en base
+        loaded = original_get(*args, **kwargs)
+        ItemService.cache.delete(item_cache_key(item_id))
+        return loaded
+
+    db.get = get_then_concurrent_update  # type: ignore[method-assign]
+    assert ItemService.get_by_id(db, item_id) is not None
+    assert ItemService.cache.get(item_cache_key(item_id)) is None
+
+
+def test_get_item_is_cached_and_invalidated(client: TestClient):
+    """Teste la lecture en cache et l'invalidation par update/delete."""
+    item_id = client.post("/items/", json={"nom": "Cached", "prix": 1.0}).json()["id"]
+
+    client.get(f"/items/{item_id}")
+    client.get(f"/items/{item_id}")
+    assert ItemService.cache.stats()["hits"] >= 1
+
+    client.put(f"/items/{item_id}", json={"prix": 2.0})
+    assert client.get(f"/items/{item_id}").json()["prix"] == 2.0
+
+    client.delete(f"/items/{item_id}")
+    assert client.get(f"/items/{item_id}").status_code == 404
+
+
+def test_cache_stats_endpoint(client: TestClient):
+    """Teste l'endpoint des compteurs du cache."""
+    response = client.get("/health/cache")
+    assert response.status_code == 200
+    assert {"hits", "misses", "evictions"} <= response.json().keys()
@@ -0,0 +1,26 @@
+"""Tests de la lecture des variables d'environnement."""
+
+import pytest
+
+from app.config import env_flag
+
+
+@pytest.mark.parametrize("value", ["1", "true", "True", "TRUE", " true "])
+def test_env_flag_true(monkeypatch, value):
+    """Teste les valeurs qui activent un drapeau."""
+    monkeypatch.setenv("ITEMS_TEST_FLAG", value)
+    assert env_flag("ITEMS_TEST_FLAG", False) is True
+
+
+@pytest.mark.parametrize("value", ["0", "false", "False", "no", ""])
+def test_env_flag_false(monkeypatch, value):
+    """Teste les valeurs qui désactivent un drapeau."""
+    monkeypatch.setenv("ITEMS_TEST_FLAG", value)
+    assert env_flag("ITEMS_TEST_FLAG", True) is False
+
+
+def test_env_flag_default(monkeypatch):
+    """Teste la valeur par défaut lorsque la variable est absente."""
+    monkeypatch.delenv("ITEMS_TEST_FLAG", raising=False)
+    assert env_flag("ITEMS_TEST_FLAG", True) is True
+    assert env_flag("ITEMS_TEST_FLAG", False) is False
@@ -0,0 +1,86 @@
+"""Tests du diagnostic SQL (requêtes lentes, N+1, Server-Timing)."""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import diagnostics
+from tests.conftest import engine
+
+
+@pytest.fixture
+def diagnosed(monkeypatch):
+    monkeypatch.setattr(diagnostics, "DIAGNOSTICS_ENABLED", True)
+    diagnostics.install(engine)
+    yield
+    diagnostics.uninstall(engine)
+
+
+def test_server_timing_header(client: TestClient, diagnosed):
+    """Teste l'ajout du nombre de requêtes SQL dans Server-Timing."""
+    item = client.post("/items/", json={"nom": "Souris", "prix": 29.99}).json()
+
+    response = client.get("/items/?count=exact")
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith('db;desc="2 queries";dur=')
+    assert "app;dur=" in timing
+    assert response.json()[0]["id"] == item["id"]
+
+
+def test_server_timing_disabled(client: TestClient):
+    """Teste l'absence de l'en-tête lorsque le diagnostic est désactivé."""
+    assert "server-timing" not in client.get("/items/").headers
+
+
+def test_too_many_queries(client: TestClient, diagnosed, monkeypatch, caplog):
+    """Teste l'avertissement N+1, puis l'échec de la requête en mode strict."""
+    monkeypatch.setattr(diagnostics, "DIAGNOSTICS_MAX_QUERIES", 1)
+
+    with caplog.at_level(logging.WARNING, logger="app.diagnostics"):
+        assert client.get("/items/?count=exact").status_code == 200
+    assert "possible N+1" in caplog.text
+
+    monkeypatch.setattr(diagnostics, "DIAGNOSTICS_STRICT", True)
+    assert client.get("/items/?count=exact").status_code == 500
+
+
+def test_slow_query_log(client: TestClient, diagnosed, monkeypatch, caplog):
+    """Teste la journalisation des requêtes lentes avec leurs paramètres."""
+    monkeypatch.setattr(diagnostics, "DIAGNOSTICS_SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.diagnostics"):
+        client.get("/items/?min_prix=12.5")
+
+    assert "Slow query" in caplog.text
+    assert "12.5" in caplog.text
+
+
+def test_explain_rolls_back_to_savepoint():
+    """Teste qu'EXPLAIN ANALYZE est toujours annulé, même en cas d'échec."""
+    executed = []
+
+    class Cursor:
+        def execute(self, statement, parameters=None):
+            executed.append(statement)
+            if statement.startswith("EXPLAIN"):
+                raise RuntimeError("boom")
+
+        def close(self):
+            executed.append("close")
+
+    class Connection:
+        dialect = type("Dialect", (), {"name": "postgresql"})()
+        connection = type("DBAPIConnection", (), {"cursor": lambda self: Cursor()})()
+
+    plan = diagnostics._explain(Connection(), "SELECT 1", ())
+
+    assert plan == "EXPLAIN failed: boom"
+    assert executed == [
+        "SAVEPOINT diagnostics_explain",
+        "EXPLAIN (ANALYZE, BUFFERS) SELECT 1",
+        "ROLLBACK TO SAVEPOINT diagnostics_explain",
+        "RELEASE SAVEPOINT diagnostics_explain",
+        "close",
+    ]
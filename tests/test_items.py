@@ -4,8 +4,20 @@ Ce module contient tous les tests pour vérifier le bon fonctionnement
 des opérations CRUD sur les articles via l'API FastAPI.
 """
 
+import csv
+import io
+import json
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+import app.main
+from app.database import get_session_factory
+from app.services.item_service import update_statement
+from app.services.pagination import encode_cursor
+from tests.conftest import engine
 
 
 def test_create_item(client: TestClient):
@@ -160,11 +172,163 @@ def test_pagination(client: TestClient):
     assert data[0]["nom"] == "Item 5"
 
 
+def test_cursor_pagination(client: TestClient):
+    """Teste le parcours complet des articles avec le curseur X-Next-Cursor."""
+    for i in range(7):
+        client.post("/items/", json={"nom": f"Item {i}", "prix": float(i + 1)})
+
+    noms = []
+    response = client.get("/items/?limit=3")
+    while True:
+        assert response.status_code == 200
+        noms.extend(item["nom"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get(f"/items/?limit=3&cursor={cursor}")
+
+    assert noms == [f"Item {i}" for i in range(7)]
+
+
+def test_pagination_after_id(client: TestClient):
+    """Teste la pagination par clé avec after_id."""
+    ids = [
+        client.post("/items/", json={"nom": f"Item {i}", "prix": 1.0}).json()["id"]
+        for i in range(5)
+    ]
+
+    response = client.get(f"/items/?after_id={ids[1]}&limit=2")
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == ids[2:4]
+
+
+def test_pagination_invalid_cursor(client: TestClient):
+    """Teste qu'un curseur mal formé retourne 400."""
+    response = client.get("/items/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+    response = client.get(f"/items/?cursor={encode_cursor({'id': 10**30})}")
+    assert response.status_code == 400
+
+
+def test_pagination_bounds(client: TestClient):
+    """Teste le rejet des paramètres de pagination invalides."""
+    for query in ("limit=1e20", "skip=-1"):
+        assert client.get(f"/items/?{query}").status_code == 422
+    assert client.get(f"/items/?after_id={10**30}").status_code == 422
+
+
+def test_pagination_limit_is_clamped(client: TestClient):
+    """Teste qu'un limit hors bornes est ramené entre 0 et 1000, sans 422."""
+    client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 3)
+
+    for limit, expected in (("0", 0), ("-1", 0), ("1001", 3), (str(10**30), 3)):
+        response = client.get(f"/items/?limit={limit}")
+        assert response.status_code == 200, limit
+        assert len(response.json()) == expected
+        assert "x-next-cursor" not in response.headers
+
+
+def test_get_items_price_filter_and_sort(client: TestClient):
+    """Teste le filtre par fourchette de prix et le tri par prix décroissant."""
+    for nom, prix in [("A", 5.0), ("B", 25.0), ("C", 15.0), ("D", 50.0)]:
+        client.post("/items/", json={"nom": nom, "prix": prix})
+
+    response = client.get("/items/?min_prix=10&max_prix=30&sort=-prix")
+    assert response.status_code == 200
+    assert [item["nom"] for item in response.json()] == ["B", "C"]
+
+    response = client.get("/items/?sort=nom")
+    assert [item["nom"] for item in response.json()] == ["A", "B", "C", "D"]
+
+
+def test_sorted_cursor_pagination_with_ties(client: TestClient):
+    """Teste le parcours par curseur d'une liste triée avec des prix égaux."""
+    prix = [3.0, 1.0, 3.0, 2.0, 3.0, 1.0, 2.0]
+    ids = [
+        client.post("/items/", json={"nom": f"Item {i}", "prix": p}).json()["id"]
+        for i, p in enumerate(prix)
+    ]
+
+    seen = []
+    response = client.get("/items/?limit=2&sort=-prix")
+    while True:
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get(f"/items/?limit=2&sort=-prix&cursor={cursor}")
+
+    expected = sorted(zip(prix, ids), key=lambda pair: (-pair[0], -pair[1]))
+    assert seen == [item_id for _, item_id in expected]
+
+
+def test_sorted_pagination_rejects_mismatched_cursor(client: TestClient):
+    """Teste qu'un curseur émis pour un autre tri est refusé."""
+    for i in range(3):
+        client.post("/items/", json={"nom": f"Item {i}", "prix": float(i)})
+
+    cursor = client.get("/items/?limit=1").headers["X-Next-Cursor"]
+    response = client.get(f"/items/?limit=1&sort=prix&cursor={cursor}")
+    assert response.status_code == 400
+
+    response = client.get("/items/?after_id=1&sort=prix")
+    assert response.status_code == 400
+
+
+def test_sorted_pagination_rejects_tampered_cursor(client: TestClient):
+    """Teste qu'une valeur de reprise du mauvais type est refusée en 400."""
+    client.post("/items/", json={"nom": "Item", "prix": 1.0})
+
+    tampered = [
+        ("prix", None),
+        ("prix", "1.0"),
+        ("prix", [1]),
+        ("prix", True),
+        ("prix", float("nan")),
+        ("-prix", float("inf")),
+        ("nom", 1),
+        ("-nom", {"a": 1}),
+    ]
+    for sort, value in tampered:
+        cursor = encode_cursor({"s": sort, "id": 1, "v": value})
+        response = client.get(f"/items/?sort={sort}&cursor={cursor}")
+        assert response.status_code == 400, (sort, value)
+
+    cursor = encode_cursor({"s": "nom", "id": 1, "v": "Item"})
+    assert client.get(f"/items/?sort=nom&cursor={cursor}").status_code == 200
+
+
+def test_get_items_total_count(client: TestClient):
+    """Teste l'en-tête X-Total-Count en modes exact et estimate."""
+    for i in range(5):
+        client.post("/items/", json={"nom": f"Item {i}", "prix": float(i + 1)})
+
+    response = client.get("/items/?limit=2")
+    assert "X-Total-Count" not in response.headers
+
+    response = client.get("/items/?limit=2&count=exact")
+    assert response.headers["X-Total-Count"] == "5"
+
+    response = client.get("/items/?limit=2&min_prix=3&count=estimate")
+    assert response.headers["X-Total-Count"] == "3"
+
+    # Le décompte estimé est réutilisé pendant ITEMS_COUNT_CACHE_TTL
+    client.post("/items/", json={"nom": "Item 5", "prix": 6.0})
+    response = client.get("/items/?limit=2&min_prix=3&count=estimate")
+    assert response.headers["X-Total-Count"] == "3"
+    response = client.get("/items/?limit=2&min_prix=3&count=exact")
+    assert response.headers["X-Total-Count"] == "4"
+
+
 def test_health_endpoint(client: TestClient):
     """Teste l'endpoint de vérification de santé de l'API."""
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["admission"]["saturated"] is False
 
 
 def test_root_endpoint(client: TestClient):
@@ -172,3 +336,327 @@ def test_root_endpoint(client: TestClient):
     response = client.get("/")
     assert response.status_code == 200
     assert "message" in response.json()
+
+
+def test_create_items_bulk(client: TestClient):
+    """Teste la création en masse avec lots et erreurs par ligne."""
+    payload = [
+        {"nom": "Item A", "prix": 1.0},
+        {"nom": "", "prix": 2.0},
+        {"nom": "Item C", "prix": 3.0},
+        {"nom": "Item D", "prix": -4.0},
+        {"nom": "Item E", "prix": 5.0},
+    ]
+    response = client.post("/items/bulk?batch_size=2", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["ids"]) == 3
+    assert [error["index"] for error in data["errors"]] == [1, 3]
+
+    items = client.get("/items/").json()
+    assert [item["id"] for item in items] == data["ids"]
+    assert [item["nom"] for item in items] == ["Item A", "Item C", "Item E"]
+
+
+def test_create_items_bulk_non_object_row(client: TestClient):
+    """Teste qu'un élément qui n'est pas un objet n'invalide que sa ligne."""
+    payload = [{"nom": "Item A", "prix": 1.0}, 1, None, {"nom": "Item B", "prix": 2.0}]
+    response = client.post("/items/bulk", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["ids"]) == 2
+    assert [error["index"] for error in data["errors"]] == [1, 2]
+
+
+def test_update_items_bulk(client: TestClient):
+    """Teste la mise à jour partielle en masse par liste d'IDs."""
+    ids = client.post(
+        "/items/bulk",
+        json=[{"nom": f"Item {i}", "prix": float(i + 1)} for i in range(3)],
+    ).json()["ids"]
+
+    response = client.patch(
+        "/items/bulk?batch_size=2",
+        json=[
+            {"id": ids[0], "prix": 10.0},
+            {"id": ids[1], "nom": "Renommé"},
+            {"id": ids[2], "nom": "Item 2b", "prix": 30.0},
+            {"id": 9999, "prix": 1.0},
+        ],
+    )
+    assert response.status_code == 200
+    assert response.json() == {"updated": 3, "not_found": [9999]}
+
+    items = client.get("/items/").json()
+    assert [(item["nom"], item["prix"]) for item in items] == [
+        ("Item 0", 10.0),
+        ("Renommé", 2.0),
+        ("Item 2b", 30.0),
+    ]
+    assert client.get(f"/items/{ids[1]}").headers["ETag"] == f'"{ids[1]}-2"'
+    assert client.get("/items/stats").json()["sum_prix"] == 42.0
+
+
+def test_reprice_items_bulk(client: TestClient):
+    """Teste l'ajustement de prix par fourchette."""
+    for prix in [10.0, 20.0, 40.0]:
+        client.post("/items/", json={"nom": "Item", "prix": prix})
+
+    response = client.patch("/items/bulk", json={"factor": 1.5, "max_prix": 20})
+    assert response.status_code == 200
+    assert response.json() == {"updated": 2, "not_found": []}
+
+    assert [item["prix"] for item in client.get("/items/").json()] == [
+        15.0,
+        30.0,
+        40.0,
+    ]
+    assert client.get("/items/stats").json()["sum_prix"] == 85.0
+
+    response = client.patch("/items/bulk", json={"factor": 2})
+    assert response.status_code == 422
+
+
+def test_reprice_items_bulk_rejects_out_of_range_prices(client: TestClient):
+    """Teste le refus d'un ajustement dont le résultat dépasse le prix maximal."""
+    client.post("/items/", json={"nom": "Item", "prix": 1e8})
+
+    response = client.patch("/items/bulk", json={"factor": 1e308, "min_prix": 0})
+    assert response.status_code == 422
+
+    response = client.patch("/items/bulk", json={"factor": 100, "min_prix": 0})
+    assert response.status_code == 422
+    assert client.get("/items/").json()[0]["prix"] == 1e8
+    assert client.get("/items/stats").json()["sum_prix"] == 1e8
+
+
+def test_create_item_rejects_out_of_range_price(client: TestClient):
+    """Teste le refus d'un prix supérieur à MAX_PRIX."""
+    response = client.post("/items/", json={"nom": "Item", "prix": 2e9})
+    assert response.status_code == 422
+
+
+def test_delete_items_bulk(client: TestClient):
+    """Teste la suppression en masse par IDs puis par filtre."""
+    rows = [
+        {"nom": "Promo A", "prix": 2.0},
+        {"nom": "promo B", "prix": 4.0},
+        {"nom": "Promo C", "prix": 50.0},
+        {"nom": "Clavier", "prix": 3.0},
+        {"nom": "Souris", "prix": 8.0},
+    ]
+    ids = client.post("/items/bulk", json=rows).json()["ids"]
+
+    response = client.request(
+        "DELETE", "/items/bulk", json={"ids": [ids[4], ids[4], 9999]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 1}
+
+    response = client.request(
+        "DELETE",
+        "/items/bulk?batch_size=1",
+        json={"nom_prefix": "PROMO", "max_prix": 10},
+    )
+    assert response.json() == {"deleted": 2}
+
+    noms = [item["nom"] for item in client.get("/items/").json()]
+    assert noms == ["Promo C", "Clavier"]
+    assert client.get("/items/stats").json()["count"] == 2
+
+    response = client.request("DELETE", "/items/bulk", json={})
+    assert response.status_code == 422
+
+
+def test_get_items_batch(client: TestClient):
+    """Teste la lecture groupée dans l'ordre demandé, avec IDs manquants."""
+    ids = client.post(
+        "/items/bulk", json=[{"nom": f"Item {i}", "prix": 1.0} for i in range(3)]
+    ).json()["ids"]
+    client.get(f"/items/{ids[2]}")  # servi ensuite depuis le cache
+
+    response = client.get(
+        f"/items/batch?ids={ids[2]}&ids=9999&ids={ids[0]}&ids={ids[2]}"
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [
+            {"id": ids[2], "nom": "Item 2", "prix": 1.0},
+            {"id": ids[0], "nom": "Item 0", "prix": 1.0},
+        ],
+        "missing": [9999],
+    }
+
+    assert client.get("/items/batch").status_code == 422
+
+
+def test_get_item_etag_not_modified(client: TestClient):
+    """Teste le GET conditionnel d'un article avec If-None-Match."""
+    item_id = client.post("/items/", json={"nom": "Tagged", "prix": 1.0}).json()["id"]
+
+    response = client.get(f"/items/{item_id}")
+    etag = response.headers["ETag"]
+
+    not_modified = client.get(f"/items/{item_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    client.put(f"/items/{item_id}", json={"prix": 2.0})
+    modified = client.get(f"/items/{item_id}", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] != etag
+
+
+def test_get_items_etag_not_modified(client: TestClient):
+    """Teste le GET conditionnel de la liste des articles."""
+    client.post("/items/", json={"nom": "Item 1", "prix": 1.0})
+    etag = client.get("/items/").headers["ETag"]
+
+    assert client.get("/items/", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/items/", json={"nom": "Item 2", "prix": 2.0})
+    assert client.get("/items/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_update_item_if_match(client: TestClient):
+    """Teste qu'une écriture avec un ETag périmé est rejetée en 412."""
+    create_response = client.post("/items/", json={"nom": "Original", "prix": 1.0})
+    item_id = create_response.json()["id"]
+    etag = create_response.headers["ETag"]
+
+    first = client.put(
+        f"/items/{item_id}", json={"prix": 2.0}, headers={"If-Match": etag}
+    )
+    assert first.status_code == 200
+
+    stale = client.put(
+        f"/items/{item_id}", json={"prix": 3.0}, headers={"If-Match": etag}
+    )
+    assert stale.status_code == 412
+    assert client.get(f"/items/{item_id}").json()["prix"] == 2.0
+    assert client.get("/items/stats").json()["sum_prix"] == 2.0
+
+    stale_delete = client.delete(f"/items/{item_id}", headers={"If-Match": etag})
+    assert stale_delete.status_code == 412
+
+    # If-Match utilise la comparaison forte : un ETag faible ne correspond pas
+    weak = client.delete(
+        f"/items/{item_id}", headers={"If-Match": f"W/{first.headers['ETag']}"}
+    )
+    assert weak.status_code == 412
+
+    fresh = client.delete(
+        f"/items/{item_id}", headers={"If-Match": first.headers["ETag"]}
+    )
+    assert fresh.status_code == 204
+
+
+def test_update_statement_returns_locked_old_prix():
+    """Teste que l'ancien prix est lu et verrouillé par l'UPDATE lui-même."""
+    statement = update_statement(1, {"prix": 2.0}, returning_old_prix=True)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith('WITH "old" AS')
+    assert "FOR UPDATE)" in sql
+    assert sql.endswith('"old".prix AS old_prix')
+
+
+def test_export_items_ndjson(client: TestClient):
+    """Teste l'export NDJSON en flux de tous les articles."""
+    for i in range(5):
+        client.post("/items/", json={"nom": f"Item {i}", "prix": float(i + 1)})
+
+    response = client.get("/items/export?batch_size=2")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["nom"] for line in lines] == [f"Item {i}" for i in range(5)]
+
+
+def test_export_items_csv(client: TestClient):
+    """Teste l'export CSV, ligne d'en-tête comprise."""
+    client.post("/items/", json={"nom": "Clavier, AZERTY", "prix": 49.99})
+
+    response = client.get("/items/export?format=csv")
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["id", "nom", "prix"]
+    assert rows[1][1:] == ["Clavier, AZERTY", "49.99"]
+
+
+def test_import_items_csv(client: TestClient):
+    """Teste l'import CSV en flux avec lignes rejetées."""
+    body = "nom,prix\nLaptop,899.99\n,10\nSouris,19.90\nClavier,abc\n"
+    response = client.post(
+        "/items/import?format=csv&batch_size=1",
+        content=body,
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["accepted"] == 2
+    assert data["rejected"] == 2
+    assert [error["line"] for error in data["errors"]] == [3, 5]
+
+    noms = [item["nom"] for item in client.get("/items/").json()]
+    assert noms == ["Laptop", "Souris"]
+
+
+def test_import_items_ndjson(client: TestClient):
+    """Teste l'import NDJSON en flux, y compris une ligne JSON invalide."""
+    body = '{"nom": "A", "prix": 1}\n{not json}\n\n{"nom": "B", "prix": 2}'
+    response = client.post(
+        "/items/import",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    data = response.json()
+    assert data["accepted"] == 2
+    assert [error["line"] for error in data["errors"]] == [2]
+
+
+def test_import_items_opens_one_session_per_batch(client: TestClient):
+    """Teste que chaque lot importé ouvre sa propre session."""
+    opened = []
+
+    def session_factory():
+        session = Session(engine)
+        opened.append(session)
+        return session
+
+    app.main.app.dependency_overrides[get_session_factory] = lambda: session_factory
+    body = "\n".join(json.dumps({"nom": f"Item {i}", "prix": 1}) for i in range(3))
+    response = client.post(
+        "/items/import?batch_size=2",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.json()["accepted"] == 3
+    assert len(opened) == 2
+
+
+def test_search_items(client: TestClient):
+    """Teste la recherche par préfixe, sous-chaîne et similarité."""
+    for nom in ["Clavier", "Clavier sans fil", "Souris", "Enceinte"]:
+        client.post("/items/", json={"nom": nom, "prix": 10.0})
+
+    prefix = client.get("/items/search?q=CLAV").json()
+    assert [item["nom"] for item in prefix] == ["Clavier", "Clavier sans fil"]
+
+    contains = client.get("/items/search?q=sans&mode=contains").json()
+    assert [item["nom"] for item in contains] == ["Clavier sans fil"]
+
+    fuzzy = client.get("/items/search?q=claviet&mode=fuzzy&limit=1").json()
+    assert [item["nom"] for item in fuzzy] == ["Clavier"]
+
+
+def test_search_items_tracks_updates(client: TestClient):
+    """Teste que l'index de recherche suit les mises à jour et suppressions."""
+    item_id = client.post("/items/", json={"nom": "Ecran", "prix": 1.0}).json()["id"]
+    client.put(f"/items/{item_id}", json={"nom": "Moniteur"})
+
+    assert client.get("/items/search?q=ecran").json() == []
+    assert len(client.get("/items/search?q=moni").json()) == 1
+
+    client.delete(f"/items/{item_id}")
+    assert client.get("/items/search?q=moni").json() == []
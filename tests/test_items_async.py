@@ -0,0 +1,68 @@
+"""Tests d'intégration pour les routes CRUD asynchrones.
+
+Ces tests montent le routeur asynchrone sur une application dédiée,
+branchée sur la même base SQLite de test via le pilote aiosqlite.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import get_async_db
+from app.routes import async_items_read_router, async_items_router
+from tests.conftest import SQLALCHEMY_DATABASE_URL
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture(scope="function")
+def async_client(db):
+    async_engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://")
+    )
+
+    async def override_get_async_db():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    test_app = FastAPI()
+    test_app.include_router(async_items_read_router)
+    test_app.include_router(async_items_router)
+    test_app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(test_app) as test_client:
+        yield test_client
+
+
+def test_async_crud(async_client: TestClient):
+    """Teste le cycle complet création/lecture/mise à jour/suppression."""
+    create_response = async_client.post("/items/", json={"nom": "Async", "prix": 10.0})
+    assert create_response.status_code == 201
+    item_id = create_response.json()["id"]
+
+    response = async_client.get(f"/items/{item_id}")
+    assert response.status_code == 200
+    assert response.json()["nom"] == "Async"
+
+    update_response = async_client.put(f"/items/{item_id}", json={"prix": 12.5})
+    assert update_response.status_code == 200
+    assert update_response.json() == {"id": item_id, "nom": "Async", "prix": 12.5}
+
+    assert async_client.delete(f"/items/{item_id}").status_code == 204
+    assert async_client.get(f"/items/{item_id}").status_code == 404
+
+
+def test_async_cursor_pagination(async_client: TestClient):
+    """Teste la pagination par curseur sur le routeur asynchrone."""
+    for i in range(3):
+        async_client.post("/items/", json={"nom": f"Item {i}", "prix": 1.0})
+
+    first_page = async_client.get("/items/?limit=2&count=exact")
+    assert len(first_page.json()) == 2
+    assert first_page.headers["X-Total-Count"] == "3"
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = async_client.get(f"/items/?limit=2&cursor={cursor}")
+    assert [item["nom"] for item in second_page.json()] == ["Item 2"]
@@ -0,0 +1,61 @@
+"""Tests des métriques Prometheus (GET /metrics)."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from app.metrics import Histogram, db_latency, instrument_engine, statement_kind
+from tests.conftest import SQLALCHEMY_DATABASE_URL
+
+
+def test_histogram_render():
+    """Teste le rendu cumulatif des tranches d'un histogramme."""
+    histogram = Histogram("latency_seconds", "Latence.", ["route"], (0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(("/items/",), value)
+
+    lines = histogram.render()
+    assert lines == [
+        "# HELP latency_seconds Latence.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/items/",le="0.1"} 1',
+        'latency_seconds_bucket{route="/items/",le="1.0"} 3',
+        'latency_seconds_bucket{route="/items/",le="+Inf"} 4',
+        'latency_seconds_sum{route="/items/"} 4.25',
+        'latency_seconds_count{route="/items/"} 4',
+    ]
+
+
+def test_statement_kind():
+    """Teste la classification des instructions SQL."""
+    assert statement_kind("select 1") == "SELECT"
+    assert statement_kind("\n  UPDATE items SET prix = 1") == "UPDATE"
+    assert statement_kind("PRAGMA main.table_info('items')") == "other"
+
+
+def test_metrics_endpoint(client: TestClient):
+    """Teste l'exposition des compteurs de requêtes par gabarit de route."""
+    client.get("/items/1")
+    client.get("/items/2")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        'items_http_requests_total{method="GET",route="/items/{item_id}",status="404"}'
+    ) in body
+    assert "items_http_request_duration_seconds_bucket" in body
+    assert 'items_http_requests_in_flight{method="GET"} 1' in body
+
+
+def test_instrument_engine_times_statements():
+    """Teste la mesure des instructions SQL par les événements du moteur."""
+    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    instrument_engine(engine, "test")
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+
+    assert db_latency.count(("test", "SELECT")) == 2
+    engine.dispose()
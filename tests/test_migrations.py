@@ -0,0 +1,141 @@
+"""Tests des migrations de schéma et de la vérification au démarrage."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, text
+from sqlmodel import SQLModel, create_engine
+
+import app.cli
+import app.main
+from app.migrations import SCHEMA_VERSION, SchemaVersionError, check_schema, migrate
+
+
+@pytest.fixture
+def empty_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/schema.db")
+    yield engine
+    engine.dispose()
+
+
+def test_migrate(empty_engine):
+    """Teste la création du schéma puis l'idempotence de la migration."""
+    with pytest.raises(SchemaVersionError):
+        check_schema(empty_engine)
+
+    assert migrate(empty_engine) == (0, SCHEMA_VERSION)
+    assert {"items", "item_stats", "schema_version"} <= set(
+        inspect(empty_engine).get_table_names()
+    )
+    assert check_schema(empty_engine) == SCHEMA_VERSION
+    assert migrate(empty_engine) == (SCHEMA_VERSION, SCHEMA_VERSION)
+
+
+def test_migrate_adopts_existing_schema(empty_engine):
+    """Teste la reprise d'une base créée par l'ancien create_all au démarrage."""
+    SQLModel.metadata.create_all(empty_engine)
+    with empty_engine.begin() as connection:
+        SQLModel.metadata.tables["schema_version"].drop(connection)
+
+    assert migrate(empty_engine) == (0, SCHEMA_VERSION)
+    assert check_schema(empty_engine) == SCHEMA_VERSION
+
+
+def test_migrate_upgrades_baseline_schema(empty_engine):
+    """Teste la mise à niveau d'une base créée par le create_all d'origine."""
+    with empty_engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE items (id INTEGER NOT NULL, nom VARCHAR NOT NULL, "
+                "prix FLOAT NOT NULL, PRIMARY KEY (id))"
+            )
+        )
+        connection.execute(text("CREATE INDEX ix_items_nom ON items (nom)"))
+        connection.execute(
+            text(
+                "INSERT INTO items (nom, prix) "
+                "VALUES ('Clavier', 5.0), ('Souris', 12.0)"
+            )
+        )
+
+    assert migrate(empty_engine) == (0, SCHEMA_VERSION)
+
+    inspector = inspect(empty_engine)
+    assert "version" in {column["name"] for column in inspector.get_columns("items")}
+    assert {index["name"] for index in inspector.get_indexes("items")} == {
+        "ix_items_prix_id",
+        "ix_items_nom_id",
+    }
+    with empty_engine.connect() as connection:
+        versions = connection.execute(text("SELECT version FROM items"))
+        assert versions.scalars().all() == [1, 1]
+        # Articles existants indexés par la reconstruction de items_fts
+        assert connection.execute(
+            text("SELECT rowid FROM items_fts WHERE items_fts MATCH 'avie'")
+        ).scalars().all() == [1]
+        assert connection.execute(
+            text("SELECT shard, count, prix_sum FROM item_stats")
+        ).all() == [(0, 2, 17.0)]
+
+
+def test_migrate_version_1_is_baseline_schema(empty_engine):
+    """Teste que la migration 1 reste figée sur le schéma d'origine."""
+    assert migrate(empty_engine, target=1) == (0, 1)
+
+    inspector = inspect(empty_engine)
+    assert {column["name"] for column in inspector.get_columns("items")} == {
+        "id",
+        "nom",
+        "prix",
+    }
+    assert [index["name"] for index in inspector.get_indexes("items")] == [
+        "ix_items_nom"
+    ]
+    assert "item_stats" not in inspector.get_table_names()
+
+
+def test_migrate_backfills_sharded_stats(empty_engine):
+    """Teste le remplacement des agrégats sur une ligne unique par les partitions."""
+    migrate(empty_engine, target=1)
+    with empty_engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE item_stats (id INTEGER PRIMARY KEY, count INTEGER)")
+        )
+        connection.execute(text("INSERT INTO item_stats VALUES (1, 99)"))
+        connection.execute(
+            text("INSERT INTO items (nom, prix) VALUES ('A', 5.0), ('B', 12.0)")
+        )
+
+    migrate(empty_engine)
+    with empty_engine.connect() as connection:
+        assert connection.execute(
+            text("SELECT shard, count, prix_sum FROM item_stats")
+        ).all() == [(0, 2, 17.0)]
+        assert connection.execute(
+            text("SELECT bucket, count FROM item_price_buckets ORDER BY bucket")
+        ).all() == [(0, 1), (1, 1)]
+
+
+def test_startup_checks_schema(empty_engine, monkeypatch):
+    """Teste le refus de démarrer sur une base non migrée, sauf si désactivé."""
+    monkeypatch.setattr(app.main, "engine", empty_engine)
+    with pytest.raises(SchemaVersionError):
+        with TestClient(app.main.app):
+            pass
+
+    monkeypatch.setattr(app.main, "DATABASE_SCHEMA_CHECK", False)
+    with TestClient(app.main.app) as client:
+        assert client.get("/health").status_code == 200
+
+
+def test_cli_migrate(empty_engine, monkeypatch, capsys):
+    """Teste la commande python -m app.cli migrate."""
+    monkeypatch.setattr(app.cli, "engine", empty_engine)
+
+    assert app.cli.main(["migrate"]) == 0
+    assert app.cli.main(["migrate"]) == 0
+
+    output = capsys.readouterr().out.splitlines()
+    assert output == [
+        f"schema migrated from version 0 to {SCHEMA_VERSION}",
+        f"schema already at version {SCHEMA_VERSION}",
+    ]
@@ -0,0 +1,35 @@
+"""Tests des points de terminaison et outils de supervision."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from app.pool import InstrumentedQueuePool, pool_status
+from tests.conftest import SQLALCHEMY_DATABASE_URL
+
+
+def test_pool_stats_endpoint(client: TestClient):
+    """Teste que l'endpoint des statistiques du pool répond."""
+    response = client.get("/health/pool")
+    assert response.status_code == 200
+    assert "pool" in response.json()["sync"]
+
+
+def test_instrumented_pool_counts_checkouts():
+    """Teste les compteurs d'occupation et de latence du pool instrumenté."""
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedQueuePool, pool_size=2
+    )
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        status = pool_status(engine.pool)
+        assert status["checked_out"] == 1
+        assert status["waiters"] == 0
+
+    status = pool_status(engine.pool)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 1
+    assert status["checkout_latency_ms"]["max"] >= 0
+
+    engine.dispose()
+    assert pool_status(engine.pool)["checkouts"] == 1
@@ -0,0 +1,106 @@
+"""Tests du profilage à la demande des requêtes."""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import profiling
+
+
+@pytest.fixture
+def profiles(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILING_TOKEN", "secret")
+    monkeypatch.setattr(profiling, "PROFILING_DIR", tmp_path)
+    return tmp_path
+
+
+def test_profile_saved(client: TestClient, profiles):
+    """Teste l'enregistrement du profil d'une requête autorisée."""
+    response = client.get("/items/", headers={"X-Profile": "secret"})
+
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+    assert (profiles / f"{profile_id}.pstats").exists()
+    report = (profiles / f"{profile_id}.txt").read_text()
+    assert "function calls" in report
+    assert "allocations (tracemalloc)" in report
+
+
+def test_profile_requires_token(client: TestClient, profiles):
+    """Teste qu'un jeton invalide ou absent ne déclenche aucun profilage."""
+    for headers in ({"X-Profile": "wrong"}, {}):
+        response = client.get("/items/", headers=headers)
+        assert "x-profile-id" not in response.headers
+    assert list(profiles.iterdir()) == []
+
+
+def test_profile_token_ignored_in_query_string(client: TestClient, profiles):
+    """Teste que le jeton passé dans l'URL ne déclenche aucun profilage."""
+    response = client.get("/items/?profile=secret")
+
+    assert "x-profile-id" not in response.headers
+    assert list(profiles.iterdir()) == []
+
+
+def test_profiles_pruned(profiles):
+    """Teste que seuls les profils les plus récents sont conservés."""
+    for age, profile_id in enumerate(("c", "b", "a")):
+        for suffix in (".pstats", ".txt"):
+            path = profiles / f"{profile_id}{suffix}"
+            path.write_text("")
+            os.utime(path, (1000 - age, 1000 - age))
+
+    assert profiling.prune_profiles(max_files=2) == 1
+    assert sorted(path.name for path in profiles.iterdir()) == [
+        "b.pstats",
+        "b.txt",
+        "c.pstats",
+        "c.txt",
+    ]
+
+
+def test_profile_saved_prunes_old_profiles(client: TestClient, profiles, monkeypatch):
+    """Teste l'application de PROFILING_MAX_FILES à chaque enregistrement."""
+    monkeypatch.setattr(profiling, "PROFILING_MAX_FILES", 1)
+    for _ in range(2):
+        client.get("/items/", headers={"X-Profile": "secret"})
+
+    assert len(list(profiles.glob("*.pstats"))) == 1
+
+
+def test_profile_inline(client: TestClient, profiles):
+    """Teste le renvoi du rapport dans le corps de la réponse."""
+    response = client.get(
+        "/items/1", headers={"X-Profile": "secret", "X-Profile-Output": "inline"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["x-profile-status"] == "404"
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "function calls" in response.text
+    assert list(profiles.iterdir()) == []
+
+
+def test_profile_sampling(client: TestClient, profiles, monkeypatch):
+    """Teste le profilage échantillonné, sans suivi des allocations."""
+    monkeypatch.setattr(profiling, "PROFILING_SAMPLE_RATE", 1.0)
+
+    response = client.get("/items/")
+
+    report = (profiles / f"{response.headers['x-profile-id']}.txt").read_text()
+    assert "tracemalloc" not in report
+
+
+def test_profile_sampling_ignores_inline_without_token(
+    client: TestClient, profiles, monkeypatch
+):
+    """Teste qu'une requête échantillonnée sans jeton garde sa réponse."""
+    monkeypatch.setattr(profiling, "PROFILING_SAMPLE_RATE", 1.0)
+
+    response = client.get("/items/", headers={"X-Profile-Output": "inline"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == []
+    assert (profiles / f"{response.headers['x-profile-id']}.pstats").exists()
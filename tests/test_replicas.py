@@ -0,0 +1,86 @@
+"""Tests du routage des lectures vers les réplicas."""
+
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, create_engine
+
+from app import database
+from app.database import get_read_db
+from app.replicas import READ_YOUR_WRITES_COOKIE, ReplicaSet
+
+
+@pytest.fixture
+def replica_engines(tmp_path):
+    engines = [
+        create_engine(f"sqlite:///{tmp_path}/replica_{index}.db") for index in range(2)
+    ]
+    for engine in engines:
+        SQLModel.metadata.create_all(engine)
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def test_round_robin(replica_engines):
+    """Teste que les réplicas sont choisis à tour de rôle."""
+    replicas = ReplicaSet(replica_engines, strategy="round_robin")
+    chosen = [replicas.candidates()[0] for _ in range(4)]
+    assert chosen == replica_engines * 2
+
+
+def test_least_connections(replica_engines):
+    """Teste que le réplica le moins chargé est préféré."""
+    replicas = ReplicaSet(replica_engines, strategy="least_connections")
+    with replica_engines[0].connect():
+        chosen = {replicas.candidates()[0] for _ in range(4)}
+    assert chosen == {replica_engines[1]}
+
+
+def test_unreachable_replica_is_skipped(replica_engines, tmp_path):
+    """Teste la mise à l'écart d'un réplica injoignable puis le repli."""
+    broken = create_engine(f"sqlite:///{tmp_path}/missing/replica.db")
+    replicas = ReplicaSet([broken, replica_engines[0]], retry_after=60)
+
+    for _ in range(2):
+        with replicas.connect() as connection:
+            assert connection.engine is replica_engines[0]
+    assert replicas.healthy() == [replica_engines[0]]
+    assert [status["healthy"] for status in replicas.status()] == [False, True]
+
+    assert ReplicaSet([broken]).connect() is None
+
+
+def test_dead_pooled_replica_is_skipped(tmp_path):
+    """Teste qu'une connexion du pool vers un réplica tombé est écartée."""
+    (tmp_path / "replica").mkdir()
+    replica = database._replica_engine(f"sqlite:///{tmp_path}/replica/db.sqlite")
+    replica_set = ReplicaSet([replica])
+    try:
+        with replica.connect() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+        # Le réplica tombe alors que sa connexion dort dans le pool
+        dbapi_connection.close()
+        shutil.rmtree(tmp_path / "replica")
+        assert replica_set.connect() is None
+        assert replica_set.healthy() == []
+    finally:
+        replica.dispose()
+
+
+def test_read_your_writes(client: TestClient, replica_engines, monkeypatch):
+    """Teste qu'un client relit sur le primaire juste après avoir écrit."""
+    monkeypatch.setattr(database, "replicas", ReplicaSet(replica_engines[:1]))
+    client.app.dependency_overrides.pop(get_read_db)
+
+    # Le réplica (vide) est en retard sur le primaire
+    assert client.get("/items/").json() == []
+
+    response = client.post("/items/", json={"nom": "Souris", "prix": 29.99})
+    assert READ_YOUR_WRITES_COOKIE in response.cookies
+    assert [item["nom"] for item in client.get("/items/").json()] == ["Souris"]
+
+    client.cookies.clear()
+    assert client.get("/items/").json() == []
+    assert "replicas" in client.get("/health/pool").json()
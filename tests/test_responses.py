@@ -0,0 +1,30 @@
+"""Tests de la sérialisation rapide des réponses d'articles."""
+
+import json
+
+import pytest
+
+from app import responses
+from app.models.item import Item
+from app.responses import ItemJSONResponse
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_item_json_response_matches_item_response(monkeypatch, use_orjson):
+    """Teste que seuls les champs de ItemResponse sont sérialisés."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+    items = [
+        Item(id=1, nom="Écran", prix=199.0, version=3),
+        Item(id=2, nom="Souris", prix=19.9, version=1),
+    ]
+
+    response = ItemJSONResponse(items)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [
+        {"id": 1, "nom": "Écran", "prix": 199.0},
+        {"id": 2, "nom": "Souris", "prix": 19.9},
+    ]
@@ -0,0 +1,155 @@
+"""Tests du regroupement des lectures concurrentes (single-flight)."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_concurrent_calls():
+    """Teste que des appels concurrents sur une même clé partagent un résultat."""
+    flight = SingleFlight(enabled=True)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return {"id": 1}
+
+    results = []
+
+    def caller():
+        results.append(flight.do("item:1", load))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait(timeout=5)
+    followers = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.stats()["shared"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert sorted(is_leader for _, is_leader in results) == [False, False, False, True]
+    assert all(result == {"id": 1} for result, _ in results)
+    assert flight.stats() == {
+        "enabled": True,
+        "executed": 1,
+        "shared": 3,
+        "in_flight": 0,
+    }
+
+
+def test_single_flight_propagates_errors():
+    """Teste qu'une erreur du leader est levée et libère la clé."""
+    flight = SingleFlight(enabled=True)
+
+    def fail():
+        raise RuntimeError("database unavailable")
+
+    with pytest.raises(RuntimeError):
+        flight.do("item:1", fail)
+    assert flight.do("item:1", lambda: 42) == (42, True)
+
+
+def test_async_single_flight_shares_concurrent_calls():
+    """Teste le regroupement des appels concurrents dans la boucle."""
+    flight = AsyncSingleFlight(enabled=True)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("item:1", load) for _ in range(4)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert sorted(is_leader for _, is_leader in results) == [False, False, False, True]
+    assert all(result == {"id": 1} for result, _ in results)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_async_single_flight_errors_and_cancelled_leader():
+    """Teste la propagation des erreurs et la reprise après annulation."""
+    flight = AsyncSingleFlight(enabled=True)
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("database unavailable")
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def fast():
+        return 42
+
+    async def main():
+        failures = await asyncio.gather(
+            flight.do("item:1", fail), flight.do("item:1", fail), return_exceptions=True
+        )
+        assert all(isinstance(error, RuntimeError) for error in failures)
+
+        leader = asyncio.create_task(flight.do("item:2", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("item:2", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(main()) == (42, True)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_singleflight_stats_endpoint(client: TestClient):
+    """Teste que l'endpoint des compteurs single-flight répond."""
+    response = client.get("/health/singleflight")
+    assert response.status_code == 200
+    assert {"executed", "shared", "in_flight"} <= response.json()["sync"].keys()
+    assert "async" not in response.json()
+
+
+def test_singleflight_stats_endpoint_async_mode(client: TestClient, monkeypatch):
+    """Teste que les lectures regroupées des routes asynchrones sont visibles."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app import database
+    from app.services.async_item_service import AsyncItemService
+    from tests.conftest import SQLALCHEMY_DATABASE_URL
+
+    async_engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://")
+    )
+    monkeypatch.setattr(database, "async_engine", async_engine)
+    monkeypatch.setattr(AsyncItemService, "flight", AsyncSingleFlight(enabled=True))
+
+    async def load():
+        await asyncio.sleep(0.01)
+        return 1
+
+    async def main():
+        await asyncio.gather(
+            *(AsyncItemService.flight.do("item:1", load) for _ in range(3))
+        )
+
+    asyncio.run(main())
+
+    stats = client.get("/health/singleflight").json()
+    assert stats["async"]["executed"] == 1
+    assert stats["async"]["shared"] == 2
+    assert "sync" in stats
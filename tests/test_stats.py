@@ -0,0 +1,89 @@
+"""Tests des statistiques du catalogue (GET /items/stats)."""
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete, select
+
+from app.models.item_stats import ItemPriceBucket, ItemStats
+from app.services.stats import rebuild_stats, stats_delta_statements
+
+
+def test_get_stats_empty(client: TestClient):
+    """Teste les statistiques d'un catalogue vide."""
+    response = client.get("/items/stats")
+    assert response.status_code == 200
+    assert response.json() == {
+        "count": 0,
+        "min_prix": None,
+        "max_prix": None,
+        "avg_prix": None,
+        "sum_prix": 0.0,
+        "bucket_width": 10.0,
+        "histogram": [],
+    }
+
+
+def test_get_stats_tracks_writes(client: TestClient):
+    """Teste que les agrégats suivent les créations, mises à jour et suppressions."""
+    ids = [
+        client.post("/items/", json={"nom": nom, "prix": prix}).json()["id"]
+        for nom, prix in [("A", 5.0), ("B", 12.0), ("C", 18.0), ("D", 41.0)]
+    ]
+    client.post("/items/bulk", json=[{"nom": "E", "prix": 15.0}])
+    client.put(f"/items/{ids[0]}", json={"prix": 25.0})
+    client.delete(f"/items/{ids[3]}")
+
+    data = client.get("/items/stats").json()
+    assert data["count"] == 4
+    assert data["min_prix"] == 12.0
+    assert data["max_prix"] == 25.0
+    assert data["sum_prix"] == 70.0
+    assert data["avg_prix"] == 17.5
+    assert data["histogram"] == [
+        {"lower": 10.0, "upper": 20.0, "count": 3},
+        {"lower": 20.0, "upper": 30.0, "count": 1},
+    ]
+
+
+def test_get_stats_bucket_width(client: TestClient):
+    """Teste le regroupement de l'histogramme et le refus d'une largeur invalide."""
+    for prix in [5.0, 15.0, 35.0]:
+        client.post("/items/", json={"nom": "Item", "prix": prix})
+
+    data = client.get("/items/stats?bucket_width=20").json()
+    assert data["histogram"] == [
+        {"lower": 0.0, "upper": 20.0, "count": 2},
+        {"lower": 20.0, "upper": 40.0, "count": 1},
+    ]
+
+    response = client.get("/items/stats?bucket_width=15")
+    assert response.status_code == 400
+
+
+def test_get_stats_sums_shards(client: TestClient, db: Session):
+    """Teste que la lecture additionne les partitions des compteurs."""
+    dialect = db.get_bind().dialect.name
+    for shard, added, removed in [(0, [5.0, 15.0], []), (3, [12.0], [5.0])]:
+        for statement in stats_delta_statements(dialect, added, removed, shard):
+            db.exec(statement)
+    db.commit()
+    assert len(db.exec(select(ItemStats)).all()) == 2
+
+    data = client.get("/items/stats").json()
+    assert (data["count"], data["sum_prix"]) == (2, 27.0)
+    assert data["histogram"] == [{"lower": 10.0, "upper": 20.0, "count": 2}]
+
+
+def test_rebuild_stats(client: TestClient, db: Session):
+    """Teste le recalcul des agrégats après une dérive."""
+    for prix in [3.0, 9.0, 27.0]:
+        client.post("/items/", json={"nom": "Item", "prix": prix})
+    db.exec(delete(ItemPriceBucket))
+    db.exec(delete(ItemStats))
+    db.commit()
+
+    stats = rebuild_stats(db)
+
+    assert (stats.count, stats.prix_sum) == (3, 39.0)
+    data = client.get("/items/stats").json()
+    assert data["count"] == 3
+    assert [bucket["count"] for bucket in data["histogram"]] == [2, 1]